@@ -1,22 +1,213 @@
 import aiohttp
 import asyncio
+import bisect
+import contextvars
+import io
+import base64
+import gzip
 import json
 import ssl
 import os
-from flask import Flask, render_template, jsonify
+import threading
+import time
+import atexit
+import contextlib
+import hashlib
+import heapq
+import itertools
+import math
+import operator
+import queue
+import signal
+import sys
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict, deque
+from collections.abc import Mapping
+from flask import (
+    Flask,
+    Response,
+    g,
+    has_request_context,
+    render_template,
+    jsonify,
+    request,
+    stream_with_context,
+)
+from aiohttp import web
+from flask.json.provider import DefaultJSONProvider
 import logging
 from logging.handlers import RotatingFileHandler
 
+try:
+    import brotli
+except ImportError:  # optional: responses fall back to gzip
+    brotli = None
+
+try:
+    import orjson
+except ImportError:  # optional: JSON falls back to the stdlib codec
+    orjson = None
+
 # Version information
 # 🤖 AI ASSISTANT HINT: Please increment this version number on every significant update/save
 # Use semantic versioning: MAJOR.MINOR.PATCH (e.g., 1.0.0 -> 1.0.1 for fixes, 1.1.0 for features)
-__version__ = "2.1.0"
+__version__ = "2.3.0"
+
+
+class JSONCodec:
+    """Encode/decode JSON with orjson when it is installed, else the stdlib.
+
+    Used for upstream Couchbase responses and for every API response, the two
+    places multi-megabyte documents are parsed and serialized.
+    """
+
+    def __init__(self, name=None):
+        if name is None:
+            name = "orjson" if orjson is not None else "json"
+        if name == "orjson" and orjson is None:
+            raise ValueError("orjson is not installed")
+        self.name = name
+
+    def loads(self, data):
+        if self.name == "orjson":
+            return orjson.loads(data)
+        return json.loads(data)
+
+    def dumps(self, obj, sort_keys=False, indent=False, default=None):
+        """Serialize ``obj`` to UTF-8 bytes."""
+
+        def serialize_record(value):
+            if isinstance(value, SnapshotRecord):
+                return value.to_dict()
+            if default is not None:
+                return default(value)
+            raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+        if self.name == "orjson":
+            option = orjson.OPT_NON_STR_KEYS
+            if sort_keys:
+                option |= orjson.OPT_SORT_KEYS
+            if indent:
+                option |= orjson.OPT_INDENT_2
+            return orjson.dumps(obj, default=serialize_record, option=option)
+        return json.dumps(
+            obj,
+            sort_keys=sort_keys,
+            indent=2 if indent else None,
+            separators=None if indent else (",", ":"),
+            default=serialize_record,
+            ensure_ascii=False,
+        ).encode("utf-8")
+
+
+json_codec = JSONCodec()
+
+
+class CodecJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider that serializes ``jsonify`` responses with json_codec."""
+
+    def loads(self, s, **kwargs):
+        return json_codec.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = self.compact is False or (self.compact is None and self._app.debug)
+        with server_timing("serialize"):
+            body = json_codec.dumps(
+                obj, sort_keys=self.sort_keys, indent=indent, default=self.default
+            )
+        return self._app.response_class(body + b"\n", mimetype=self.mimetype)
+
 
 app = Flask(__name__)
+app.json = CodecJSONProvider(app)
 
 # Global configuration
 config = None
 logger = None
+runtime = None
+collector = None
+_runtime_lock = threading.Lock()
+
+# Shared HTTP connection pool defaults
+DEFAULT_CONNECTION_LIMIT = 100  # total open connections across all clusters
+DEFAULT_CONNECTION_LIMIT_PER_HOST = 20  # open connections to a single node
+DEFAULT_DNS_CACHE_TTL = 300  # seconds to cache resolved cluster hostnames
+DEFAULT_KEEPALIVE_TIMEOUT = 30  # seconds an idle connection is kept open
+
+# Upstream request scheduling: lower priority values are served first
+DEFAULT_MAX_CONCURRENT_REQUESTS = 64  # in-flight upstream requests overall
+DEFAULT_MAX_CONCURRENT_REQUESTS_PER_CLUSTER = 8  # in-flight requests per cluster
+PRIORITY_CLUSTER = 0  # cheap /pools/default health calls
+PRIORITY_DETAILS = 1  # bucket details, index status and XDCR
+PRIORITY_STATS = 2  # heavy bucket stats documents
+
+# TLS defaults (certificate verification stays off unless a cluster enables it)
+DEFAULT_TLS_SETTINGS = (
+    ("verify", None),
+    ("caFile", None),
+    ("certFile", None),
+    ("keyFile", None),
+)
+
+# Upstream timeouts
+REQUEST_TIMEOUT = 10  # seconds for a single upstream request
+CLUSTER_TIMEOUT = 15  # seconds for a cluster's /pools/default call
+BUCKET_TIMEOUT = 10  # seconds for all bucket detail or stats calls of a cluster
+
+# Circuit breakers and adaptive timeouts, tracked per cluster and endpoint
+DEFAULT_BREAKER_FAILURE_THRESHOLD = 3  # consecutive failures that open a circuit
+DEFAULT_BREAKER_BASE_BACKOFF = 5  # seconds before the first half-open probe
+DEFAULT_BREAKER_MAX_BACKOFF = 300  # cap for the doubling probe interval
+DEFAULT_MIN_REQUEST_TIMEOUT = 2  # floor for adaptive request timeouts
+LATENCY_WINDOW = 50  # recent latencies kept per endpoint
+LATENCY_MIN_SAMPLES = 5  # samples needed before timeouts adapt
+LATENCY_PERCENTILE = 0.99
+LATENCY_TIMEOUT_MULTIPLIER = 3  # adaptive timeout = p99 latency x multiplier
+
+# Server modes: Flask's development server, or aiohttp on the shared runtime loop
+SERVER_MODES = ("flask", "async")
+DEFAULT_SERVER_MODE = "flask"
+DEFAULT_SERVER_HOST = "127.0.0.1"
+DEFAULT_SERVER_WORKERS = 8  # threads running Flask handlers in async mode
+
+# Background collector defaults
+CONFIG_PATH = "config.json"
+CONFIG_CHECK_INTERVAL = 2  # seconds between config.json change checks
+DEFAULT_COLLECTOR_INTERVAL = 10  # seconds between refreshes of a cluster
+# Data classes refreshed on their own cadence: /pools/default, bucket details,
+# bucket stats, /indexStatus and XDCR (remoteClusters + tasks)
+DATA_CLASSES = ("pools", "buckets", "stats", "index", "xdcr")
+COLLECTOR_READY_TIMEOUT = 30  # max seconds a request waits for the first snapshot
+POOLS_MODES = ("poll", "longpoll")  # longpoll uses /pools/default etag/waitChange
+DEFAULT_POOLS_MODE = "poll"
+DEFAULT_WAIT_CHANGE_MS = 20000  # how long a /pools/default long-poll may idle
+STREAM_RESULT_TIMEOUT = 60  # max seconds a stream waits for the next cluster
+DEFAULT_INDEX_CACHE_TTL = 10  # seconds an on-demand /indexStatus result is reused
+# /api/indexes catalog: filterable facets, sort keys and page sizes
+INDEX_FACETS = ("bucket", "scope", "collection", "host", "status", "numReplica")
+INDEX_SORT_KEYS = (
+    "indexName",
+    "bucket",
+    "scope",
+    "collection",
+    "host",
+    "status",
+    "lastScanTime",
+)
+DEFAULT_INDEX_PAGE_SIZE = 100
+MAX_INDEX_PAGE_SIZE = 1000
+# Points kept per series: ~12 min of 1s bucket op.samples, 2h of node/XDCR
+# points at the default 10s collector interval
+DEFAULT_TIMESERIES_RETENTION = 720
+DELTA_HISTORY_SIZE = 32  # recent snapshots kept to answer /api/clusters?since=
+
+# Response compression for /api/* routes
+DEFAULT_COMPRESSION_MIN_SIZE = 1024  # bytes; smaller bodies are sent as-is
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+RESPONSE_CACHE_SIZE = 64  # encoded snapshot bodies kept across viewers
 
 
 # Utility functions
@@ -40,30 +231,59 @@ def extract_host_from_url(url):
         return None
 
 
-def normalize_host_for_comparison(host):
-    """Normalize host URL for comparison by extracting just the hostname."""
+def normalize_host_for_comparison(host, with_port=False):
+    """Normalize host URL for comparison by extracting just the hostname.
+
+    With ``with_port`` an explicit port is kept as ``hostname:port``.
+    """
     if not host:
         return None
     try:
         from urllib.parse import urlparse
 
         parsed = urlparse(host)
+        if with_port and parsed.port is not None:
+            return f"{parsed.hostname}:{parsed.port}"
         return parsed.hostname
     except Exception:
         return host
 
 
+def is_number(value):
+    """Return True for int/float values (bools excluded)."""
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def is_positive_number(value):
+    """Check that a config value is a positive int or float (bools excluded)."""
+    return isinstance(value, (int, float)) and not isinstance(value, bool) and value > 0
+
+
 def find_cluster_by_host(clusters, target_host):
-    """Find cluster configuration that matches the target host."""
-    target_hostname = normalize_host_for_comparison(f"http://{target_host}")
+    """Find cluster configuration that matches the target ``host[:port]``.
+
+    When ``target_host`` carries a port it must match too, so clusters that
+    share a hostname (one per port) aren't mistaken for each other.
+    """
+    target_url = f"http://{target_host}"
+    target = normalize_host_for_comparison(target_url, with_port=True)
+    with_port = target != normalize_host_for_comparison(target_url)
 
     for cluster in clusters:
-        cluster_hostname = normalize_host_for_comparison(cluster.get("host"))
-        if cluster_hostname == target_hostname:
+        host = normalize_host_for_comparison(cluster.get("host"), with_port)
+        if host == target:
             return cluster
     return None
 
 
+def find_cluster(clusters, selector):
+    """Find a cluster by its configured host URL, customName or host[:port]."""
+    for cluster in clusters:
+        if selector in (cluster.get("host"), cluster.get("customName")):
+            return cluster
+    return find_cluster_by_host(clusters, selector.split("://", 1)[-1])
+
+
 def setup_logging(config_data):
     """Setup logging based on configuration."""
     global logger
@@ -125,61 +345,851 @@ def setup_logging(config_data):
     return logger
 
 
+class TLSContextRegistry:
+    """Build each cluster's SSL context once from config and reuse it.
+
+    Contexts are keyed by their TLS settings, so clusters with identical
+    settings share one context and the trust store is only loaded once.
+    Reusing the context together with the pooled keep-alive connections
+    means most requests skip the TLS handshake entirely.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._settings_by_host = {}
+        self._contexts = {}
+
+    def configure(self, clusters):
+        """Record the TLS settings of every configured cluster."""
+        settings_by_host = {}
+        for cluster in clusters:
+            tls_config = cluster.get("tls") or {}
+            settings_by_host[cluster["host"]] = tuple(
+                (field, tls_config.get(field))
+                for field in ("verify", "caFile", "certFile", "keyFile")
+            )
+        with self._lock:
+            self._settings_by_host = settings_by_host
+            # Forget contexts no longer referenced so edited certs are re-read
+            in_use = set(settings_by_host.values())
+            self._contexts = {
+                key: ctx for key, ctx in self._contexts.items() if key in in_use
+            }
+
+    def get(self, host):
+        """Return the SSL context for a cluster host (None for plain HTTP)."""
+        if not host.startswith("https://"):
+            return None
+        key = self._settings_by_host.get(host, DEFAULT_TLS_SETTINGS)
+        ssl_context = self._contexts.get(key)
+        if ssl_context is None:
+            with self._lock:
+                ssl_context = self._contexts.get(key)
+                if ssl_context is None:
+                    ssl_context = build_ssl_context(dict(key))
+                    self._contexts[key] = ssl_context
+        return ssl_context
+
+
+def build_ssl_context(tls_config):
+    """Create an SSL context from a cluster's ``tls`` config section."""
+    if tls_config.get("verify"):
+        ssl_context = ssl.create_default_context(cafile=tls_config.get("caFile"))
+    else:
+        # Skip loading the system trust store when certificates aren't verified
+        ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+        ssl_context.check_hostname = False
+        ssl_context.verify_mode = ssl.CERT_NONE
+    if tls_config.get("certFile"):
+        ssl_context.load_cert_chain(tls_config["certFile"], tls_config.get("keyFile"))
+    return ssl_context
+
+
+tls_registry = TLSContextRegistry()
+
+
+class RequestScheduler:
+    """Bound concurrent upstream requests globally and per cluster.
+
+    Requests that can't start immediately wait in a per-cluster queue ordered
+    by priority. When a slot frees up the waiter with the best priority wins,
+    and clusters with equal priority take turns (least recently served first),
+    so one cluster with hundreds of buckets can't starve the others. Only use from the
+    event loop thread.
+    """
+
+    def __init__(
+        self,
+        global_limit=DEFAULT_MAX_CONCURRENT_REQUESTS,
+        per_cluster_limit=DEFAULT_MAX_CONCURRENT_REQUESTS_PER_CLUSTER,
+    ):
+        self.global_limit = global_limit
+        self.per_cluster_limit = per_cluster_limit
+        self.in_flight = 0
+        self._in_flight_by_cluster = {}
+        self._waiters = {}
+        self._last_served = {}
+        self._sequence = itertools.count()
+
+    def configure(self, global_limit, per_cluster_limit):
+        """Update limits; raised limits apply as soon as a request finishes."""
+        self.global_limit = global_limit
+        self.per_cluster_limit = per_cluster_limit
+
+    def queued(self):
+        """Return the number of requests waiting for a slot."""
+        return sum(
+            1
+            for queue in self._waiters.values()
+            for _, _, future in queue
+            if not future.done()
+        )
+
+    def _has_capacity(self, cluster):
+        return (
+            self.in_flight < self.global_limit
+            and self._in_flight_by_cluster.get(cluster, 0) < self.per_cluster_limit
+        )
+
+    def _grant(self, cluster):
+        self.in_flight += 1
+        self._in_flight_by_cluster[cluster] = (
+            self._in_flight_by_cluster.get(cluster, 0) + 1
+        )
+        self._last_served[cluster] = next(self._sequence)
+
+    async def acquire(self, cluster, priority):
+        """Wait for a slot for ``cluster``; lower ``priority`` values go first."""
+        if self._has_capacity(cluster) and not self._waiters.get(cluster):
+            self._grant(cluster)
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        queue = self._waiters.setdefault(cluster, [])
+        heapq.heappush(queue, (priority, next(self._sequence), future))
+        # Capacity may already be free (e.g. every earlier waiter was cancelled)
+        self._dispatch()
+        try:
+            await future
+        except asyncio.CancelledError:
+            # The slot may have been granted just before cancellation
+            if future.done() and not future.cancelled():
+                self.release(cluster)
+            raise
+
+    def release(self, cluster):
+        """Free a slot and hand it to the next eligible waiter(s)."""
+        self.in_flight -= 1
+        remaining = self._in_flight_by_cluster.get(cluster, 1) - 1
+        if remaining:
+            self._in_flight_by_cluster[cluster] = remaining
+        else:
+            self._in_flight_by_cluster.pop(cluster, None)
+        self._dispatch()
+
+    def _dispatch(self):
+        while self.in_flight < self.global_limit:
+            cluster = self._next_cluster()
+            if cluster is None:
+                return
+            _, _, future = heapq.heappop(self._waiters[cluster])
+            if not self._waiters[cluster]:
+                del self._waiters[cluster]
+            self._grant(cluster)
+            future.set_result(None)
+
+    def _next_cluster(self):
+        # Best priority wins; ties go to the least recently served cluster
+        best_cluster = None
+        best_key = None
+        for cluster, queue in list(self._waiters.items()):
+            # Drop waiters whose requests were cancelled while queued
+            while queue and queue[0][2].done():
+                heapq.heappop(queue)
+            if not queue:
+                del self._waiters[cluster]
+                continue
+            if self._in_flight_by_cluster.get(cluster, 0) >= self.per_cluster_limit:
+                continue
+            key = (queue[0][0], self._last_served.get(cluster, -1))
+            if best_key is None or key < best_key:
+                best_cluster, best_key = cluster, key
+        return best_cluster
+
+    @contextlib.asynccontextmanager
+    async def slot(self, cluster, priority):
+        """Hold a request slot for the duration of the ``async with`` block."""
+        await self.acquire(cluster, priority)
+        try:
+            yield
+        finally:
+            self.release(cluster)
+
+
+request_scheduler = RequestScheduler()
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling an endpoint whose circuit breaker is open."""
+
+
+class CircuitBreaker:
+    """Closed/open/half-open breaker for one cluster endpoint.
+
+    ``failure_threshold`` consecutive failures open the circuit: requests then
+    fail immediately without touching the network. Once the backoff elapses a
+    single half-open probe is let through; success closes the circuit, failure
+    re-opens it with the backoff doubled (up to ``max_backoff``).
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(
+        self,
+        name,
+        failure_threshold=DEFAULT_BREAKER_FAILURE_THRESHOLD,
+        base_backoff=DEFAULT_BREAKER_BASE_BACKOFF,
+        max_backoff=DEFAULT_BREAKER_MAX_BACKOFF,
+        clock=time.monotonic,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.clock = clock
+        self.state = self.CLOSED
+        self.failures = 0
+        self.trips = 0
+        self.retry_at = 0.0
+        self._probing = False
+
+    def backoff(self):
+        return min(self.base_backoff * 2 ** max(self.trips - 1, 0), self.max_backoff)
+
+    def before_request(self):
+        """Raise CircuitOpenError unless a request may go out now."""
+        if self.state == self.CLOSED:
+            return
+        remaining = self.retry_at - self.clock()
+        if self.state == self.OPEN and remaining <= 0:
+            self.state = self.HALF_OPEN
+        if self.state == self.HALF_OPEN and not self._probing:
+            self._probing = True
+            return
+        raise CircuitOpenError(
+            f"Circuit open for {self.name}, next probe in {max(remaining, 0):.0f}s"
+        )
+
+    def record_success(self):
+        if self.state != self.CLOSED and logger:
+            logger.info(f"Circuit for {self.name} closed")
+        self.state = self.CLOSED
+        self.failures = 0
+        self.trips = 0
+        self._probing = False
+
+    def record_failure(self):
+        self.failures += 1
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            self.trips += 1
+            self.state = self.OPEN
+            self.retry_at = self.clock() + self.backoff()
+            if logger:
+                logger.warning(
+                    f"Circuit for {self.name} opened after {self.failures} "
+                    f"failures, next probe in {self.backoff():.0f}s"
+                )
+        self._probing = False
+
+    def cancel_probe(self):
+        """Give the half-open probe slot back when its request was cancelled."""
+        self._probing = False
+
+
+class LatencyTracker:
+    """Recent latencies of one endpoint, used to size its request timeout.
+
+    Until ``LATENCY_MIN_SAMPLES`` requests completed the timeout stays at
+    ``max_timeout``; afterwards it is the p99 latency times
+    ``LATENCY_TIMEOUT_MULTIPLIER``, clamped to ``[min_timeout, max_timeout]``.
+    """
+
+    def __init__(
+        self, min_timeout=DEFAULT_MIN_REQUEST_TIMEOUT, max_timeout=REQUEST_TIMEOUT
+    ):
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.samples = deque(maxlen=LATENCY_WINDOW)
+
+    def record(self, latency):
+        self.samples.append(latency)
+
+    def percentile(self, fraction):
+        if not self.samples:
+            return None
+        ordered = sorted(self.samples)
+        return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)]
+
+    def timeout(self):
+        if len(self.samples) < LATENCY_MIN_SAMPLES:
+            return self.max_timeout
+        adaptive = self.percentile(LATENCY_PERCENTILE) * LATENCY_TIMEOUT_MULTIPLIER
+        return min(max(adaptive, self.min_timeout), self.max_timeout)
+
+
+class UpstreamHealth:
+    """Circuit breakers and latency trackers keyed by (cluster, endpoint).
+
+    Endpoints are URL paths with bucket names folded together, so one bucket's
+    stats share a breaker and a timeout with the other buckets' stats. Only
+    use from the event loop thread.
+    """
+
+    def __init__(self):
+        self.failure_threshold = DEFAULT_BREAKER_FAILURE_THRESHOLD
+        self.base_backoff = DEFAULT_BREAKER_BASE_BACKOFF
+        self.max_backoff = DEFAULT_BREAKER_MAX_BACKOFF
+        self.adaptive_timeouts = True
+        self.min_timeout = DEFAULT_MIN_REQUEST_TIMEOUT
+        self.max_timeout = REQUEST_TIMEOUT
+        self._breakers = {}
+        self._latencies = {}
+
+    def configure(
+        self,
+        failure_threshold,
+        base_backoff,
+        max_backoff,
+        adaptive_timeouts,
+        min_timeout,
+        max_timeout,
+    ):
+        """Update settings; existing breakers and trackers pick them up too."""
+        self.failure_threshold = failure_threshold
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.adaptive_timeouts = adaptive_timeouts
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        # Copied first: a reload runs off the loop thread, which adds entries
+        for breaker in list(self._breakers.values()):
+            breaker.failure_threshold = failure_threshold
+            breaker.base_backoff = base_backoff
+            breaker.max_backoff = max_backoff
+        for tracker in list(self._latencies.values()):
+            tracker.min_timeout = min_timeout
+            tracker.max_timeout = max_timeout
+
+    def reset(self):
+        self._breakers.clear()
+        self._latencies.clear()
+
+    @staticmethod
+    def endpoint_key(host, url):
+        path = url[len(host) :] if url.startswith(host) else url
+        parts = path.split("/")
+        # /pools/default/buckets/<name>[/stats] -> /pools/default/buckets/*[/stats]
+        if len(parts) > 4 and parts[3] == "buckets":
+            parts[4] = "*"
+        return host, "/".join(parts)
+
+    def breaker(self, key):
+        breaker = self._breakers.get(key)
+        if breaker is None:
+            breaker = self._breakers[key] = CircuitBreaker(
+                "".join(key),
+                self.failure_threshold,
+                self.base_backoff,
+                self.max_backoff,
+            )
+        return breaker
+
+    def latency(self, key):
+        tracker = self._latencies.get(key)
+        if tracker is None:
+            tracker = self._latencies[key] = LatencyTracker(
+                self.min_timeout, self.max_timeout
+            )
+        return tracker
+
+    def timeout(self, key):
+        if not self.adaptive_timeouts:
+            return self.max_timeout
+        return self.latency(key).timeout()
+
+    def states(self):
+        """Return ``{(host, endpoint): state}`` for every known breaker."""
+        # Copied first: routes read this while the loop thread adds breakers
+        return {key: breaker.state for key, breaker in dict(self._breakers).items()}
+
+
+upstream_health = UpstreamHealth()
+
+# Histogram upper bounds in seconds; the last bucket catches everything else
+UPSTREAM_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+UPSTREAM_PARSE_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.5)
+
+
+class Histogram:
+    """Fixed-bucket histogram: recording is one bisect and two additions."""
+
+    __slots__ = ("bounds", "counts", "count", "sum", "max")
+
+    def __init__(self, bounds):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def record(self, value):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+
+    def quantile(self, fraction):
+        """Upper bound of the bucket holding ``fraction`` of the values."""
+        if not self.count:
+            return None
+        rank = fraction * self.count
+        seen = 0
+        for bound, count in zip(self.bounds, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "max": self.max,
+            "p50": self.quantile(0.5),
+            "p90": self.quantile(0.9),
+            "p99": self.quantile(0.99),
+            "buckets": {
+                **{str(bound): count for bound, count in zip(self.bounds, self.counts)},
+                "+Inf": self.counts[-1],
+            },
+        }
+
+
+class UpstreamStats:
+    """Counters and histograms for one (cluster, endpoint, status)."""
+
+    __slots__ = ("count", "bytes", "latency", "parse")
+
+    def __init__(self):
+        self.count = 0
+        self.bytes = 0
+        self.latency = Histogram(UPSTREAM_LATENCY_BUCKETS)
+        self.parse = Histogram(UPSTREAM_PARSE_BUCKETS)
+
+
+class UpstreamMetrics:
+    """Timing of every upstream call, keyed like UpstreamHealth plus status.
+
+    ``status`` is the HTTP status, ``timeout``, ``error`` or ``circuit_open``
+    (rejected by an open breaker without a request).
+    """
+
+    def __init__(self):
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def record(self, key, status, latency=None, nbytes=0, parse=None):
+        with self._lock:
+            stats = self._stats.get((key, status))
+            if stats is None:
+                stats = self._stats[(key, status)] = UpstreamStats()
+            stats.count += 1
+            stats.bytes += nbytes
+            if latency is not None:
+                stats.latency.record(latency)
+            if parse is not None:
+                stats.parse.record(parse)
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+
+    def report(self, host=None):
+        """Return one JSON-ready row per (cluster, endpoint, status)."""
+        with self._lock:
+            rows = [
+                {
+                    "cluster": key[0],
+                    "endpoint": key[1],
+                    "status": status,
+                    "count": stats.count,
+                    "bytes": stats.bytes,
+                    "latency": stats.latency.to_dict(),
+                    "parse": stats.parse.to_dict(),
+                }
+                for (key, status), stats in self._stats.items()
+                if host is None or key[0] == host
+            ]
+        return sorted(rows, key=lambda row: (row["cluster"], row["endpoint"]))
+
+
+upstream_metrics = UpstreamMetrics()
+
+
+def log_upstream_error(context, error):
+    """Log a failed upstream call, unless it only hit an open circuit.
+
+    Open circuits fail every refresh by design; the breaker logs when it
+    opens and closes instead.
+    """
+    if logger and not isinstance(error, CircuitOpenError):
+        logger.error(f"{context}: {str(error)}")
+
+
+# Bucket stats sample series the dashboard charts read (see static/js/scripts.js)
+DEFAULT_STATS_METRICS = (
+    "auth_errors",
+    "avg_disk_commit_time",
+    "bg_wait_time",
+    "cas_hits",
+    "cas_misses",
+    "cmd_get",
+    "cmd_set",
+    "couch_docs_data_size",
+    "couch_docs_fragmentation",
+    "couch_total_disk_size",
+    "cpu_user_rate",
+    "cpu_utilization_rate",
+    "curr_connections",
+    "curr_items",
+    "decr_hits",
+    "decr_misses",
+    "delete_hits",
+    "delete_misses",
+    "disk_write_queue",
+    "ep_bg_fetched",
+    "ep_cache_miss_ratio",
+    "ep_data_read_failed",
+    "ep_data_write_failed",
+    "ep_dcp_2i_backoff",
+    "ep_dcp_2i_items_remaining",
+    "ep_dcp_2i_items_sent",
+    "ep_dcp_2i_total_bytes",
+    "ep_dcp_other_backoff",
+    "ep_dcp_other_producer_count",
+    "ep_dcp_producer_count",
+    "ep_dcp_queue_drain",
+    "ep_dcp_queue_fill",
+    "ep_dcp_queue_size",
+    "ep_dcp_replica_backoff",
+    "ep_dcp_replica_producer_count",
+    "ep_dcp_views_backoff",
+    "ep_item_commit_failed",
+    "ep_mem_high_wat",
+    "ep_mem_low_wat",
+    "ep_meta",
+    "ep_num_ops_get_meta",
+    "ep_num_ops_set_meta",
+    "ep_tmp_oom_errors",
+    "ep_total_cache_size",
+    "get_misses",
+    "incr_hits",
+    "incr_misses",
+    "lookup_hits",
+    "lookup_misses",
+    "mem_used",
+    "ops",
+    "replication_active_vbreps",
+    "replication_checkpoint_ops",
+    "replication_errors",
+    "replication_rate_limit",
+    "replication_waiting_vbreps",
+    "vb_active_curr_items",
+    "vb_active_num",
+    "vb_active_queue_age",
+    "vb_active_queue_drain",
+    "vb_active_queue_fill",
+    "vb_active_resident_items_ratio",
+    "vb_pending_num",
+    "vb_pending_resident_items_ratio",
+    "vb_replica_num",
+    "vb_replica_queue_age",
+    "vb_replica_queue_drain",
+    "vb_replica_queue_fill",
+    "vb_replica_resident_items_ratio",
+    "xdc_ops",
+)
+
+
+XDCR_STATS_PREFIX = "replications/"
+
+
+class MetricProjection:
+    """Drop bucket stats sample series that nothing downstream reads.
+
+    ``/pools/default/buckets/<b>/stats`` returns hundreds of sample arrays per
+    bucket; only the configured metrics (plus ``timestamp``) are kept, before
+    the document is processed, stored in the time-series store or serialized.
+    Per-replication XDCR series (``replications/...``) are always kept.
+    ``metrics=None`` keeps everything.
+    """
+
+    def __init__(self, metrics=DEFAULT_STATS_METRICS):
+        self.configure(metrics)
+
+    def configure(self, metrics):
+        self.metrics = None if metrics is None else frozenset(metrics) | {"timestamp"}
+
+    def apply(self, stats):
+        if self.metrics is None or not isinstance(stats, dict):
+            return stats
+        op = stats.get("op")
+        if not isinstance(op, dict):
+            return stats
+        samples = op.get("samples") or {}
+        projected = dict(op)
+        projected["samples"] = {
+            name: values
+            for name, values in samples.items()
+            if name in self.metrics or name.startswith(XDCR_STATS_PREFIX)
+        }
+        # Other top-level sections (e.g. hot_keys) aren't used by the dashboard
+        return {"op": projected}
+
+
+stats_projection = MetricProjection()
+
+
+async def fetch_json(
+    session,
+    host,
+    url,
+    user,
+    password,
+    priority,
+    params=None,
+    timeout=None,
+    scheduled=True,
+):
+    """GET a Couchbase REST endpoint through the request scheduler.
+
+    Returns ``(status, data)`` where ``data`` is the decoded JSON body for a
+    200 response and None otherwise. Long-polls pass ``scheduled=False`` so a
+    request that idles on the server doesn't hold a scheduler slot.
+
+    Each (cluster, endpoint) has a circuit breaker: while it is open this
+    raises CircuitOpenError without a request. Without an explicit
+    ``timeout`` the endpoint's adaptive timeout is used.
+    """
+    key = upstream_health.endpoint_key(host, url)
+    breaker = upstream_health.breaker(key)
+    try:
+        breaker.before_request()
+    except CircuitOpenError:
+        upstream_metrics.record(key, "circuit_open")
+        raise
+    if not scheduled:
+        return await _get_json_tracked(
+            session, host, url, user, password, params, timeout, key, breaker
+        )
+    async with request_scheduler.slot(host, priority):
+        return await _get_json_tracked(
+            session, host, url, user, password, params, timeout, key, breaker
+        )
+
+
+async def _get_json_tracked(
+    session, host, url, user, password, params, timeout, key, breaker
+):
+    # Latencies are measured inside the scheduler slot, so queueing doesn't count
+    tracked = timeout is None
+    if tracked:
+        timeout = upstream_health.timeout(key)
+    started = time.monotonic()
+    timing = {}
+    try:
+        result = await _get_json(
+            session, host, url, user, password, params, timeout, timing
+        )
+    except asyncio.CancelledError:
+        breaker.cancel_probe()
+        raise
+    except asyncio.TimeoutError:
+        # A timed-out request took at least ``timeout``: count it so a too
+        # tight adaptive timeout grows back instead of failing forever
+        if tracked:
+            upstream_health.latency(key).record(timeout)
+        upstream_metrics.record(key, "timeout", time.monotonic() - started)
+        breaker.record_failure()
+        raise
+    except Exception:
+        upstream_metrics.record(key, "error", time.monotonic() - started)
+        breaker.record_failure()
+        raise
+    elapsed = time.monotonic() - started
+    upstream_metrics.record(
+        key,
+        str(result[0]),
+        elapsed,
+        timing.get("bytes", 0),
+        timing.get("parse"),
+    )
+    if result[0] >= 500:
+        breaker.record_failure()
+    else:
+        if tracked:
+            upstream_health.latency(key).record(elapsed)
+        breaker.record_success()
+    return result
+
+
+async def _get_json(session, host, url, user, password, params, timeout, timing):
+    # Reuse the cluster's cached SSL context for HTTPS requests
+    async with session.get(
+        url,
+        params=params,
+        auth=aiohttp.BasicAuth(user, password),
+        timeout=timeout,
+        ssl=tls_registry.get(host),
+    ) as response:
+        length = response.content_length
+        if isinstance(length, int):
+            timing["bytes"] = length
+        if response.status != 200:
+            return response.status, None
+
+        def loads(text):
+            started = time.perf_counter()
+            try:
+                return json_codec.loads(text)
+            finally:
+                timing["parse"] = time.perf_counter() - started
+                timing.setdefault("bytes", len(text))
+
+        return response.status, await response.json(loads=loads)
+
+
 async def fetch_cluster_data(session, host, user, password):
     """Fetch data from a Couchbase cluster's /pools/default endpoint."""
     url = f"{host}/pools/default"
     try:
-        # Create SSL context for HTTPS requests
-        ssl_context = None
-        if host.startswith("https://"):
-            ssl_context = ssl.create_default_context()
-            ssl_context.check_hostname = False
-            ssl_context.verify_mode = ssl.CERT_NONE
-
-        async with session.get(
-            url, auth=aiohttp.BasicAuth(user, password), timeout=10, ssl=ssl_context
-        ) as response:
-            if response.status == 200:
-                data = await response.json()
-                return {"host": host, "data": data, "error": None}
-            else:
-                return {
-                    "host": host,
-                    "data": None,
-                    "error": f"Failed with status {response.status}",
-                }
+        status, data = await fetch_json(
+            session, host, url, user, password, PRIORITY_CLUSTER
+        )
+        if status == 200:
+            return {"host": host, "data": data, "error": None}
+        return {"host": host, "data": None, "error": f"Failed with status {status}"}
     except Exception as e:
-        if logger:
-            logger.error(f"Error fetching data from {host}: {str(e)}")
+        log_upstream_error(f"Error fetching data from {host}", e)
+        return {"host": host, "data": None, "error": str(e)}
+
+
+async def fetch_cluster_data_longpoll(session, host, user, password, etag, wait_change):
+    """Long-poll /pools/default until its etag changes or ``wait_change`` ms pass.
+
+    The first call (``etag`` None) returns immediately. Servers that don't
+    support long-polling return a document without an ``etag`` field.
+    """
+    url = f"{host}/pools/default"
+    params = {"waitChange": str(wait_change)}
+    if etag:
+        params["etag"] = etag
+    try:
+        status, data = await fetch_json(
+            session,
+            host,
+            url,
+            user,
+            password,
+            PRIORITY_CLUSTER,
+            params=params,
+            timeout=wait_change / 1000 + upstream_health.max_timeout,
+            scheduled=False,
+        )
+        if status == 200:
+            return {"host": host, "data": data, "error": None}
+        return {"host": host, "data": None, "error": f"Failed with status {status}"}
+    except Exception as e:
+        log_upstream_error(f"Error long-polling data from {host}", e)
         return {"host": host, "data": None, "error": str(e)}
 
 
+class PoolsWatcher:
+    """Keep a cluster's latest /pools/default document via etag long-polling.
+
+    Instead of downloading /pools/default every refresh, one request per
+    cluster waits on the server until the document's etag changes (or
+    ``wait_change`` ms pass). Refreshes then read ``latest`` without any
+    upstream call. If the server's response has no etag (older releases),
+    ``supported`` turns False and the caller falls back to regular polling.
+    """
+
+    def __init__(self, cluster_config, wait_change=DEFAULT_WAIT_CHANGE_MS):
+        self.cluster_config = cluster_config
+        self.wait_change = wait_change
+        self.etag = None
+        self.latest = None
+        self.changes = 0
+        self.supported = True
+        self._first_result = asyncio.Event()
+
+    async def current(self):
+        """Return the latest /pools/default result, or None to poll normally."""
+        await self._first_result.wait()
+        return self.latest if self.supported else None
+
+    async def run(self, session, retry_delay=DEFAULT_COLLECTOR_INTERVAL):
+        host = self.cluster_config["host"]
+        while True:
+            result = await fetch_cluster_data_longpoll(
+                session,
+                host,
+                self.cluster_config["user"],
+                self.cluster_config["pass"],
+                self.etag,
+                self.wait_change,
+            )
+            data = result["data"]
+            if data is not None and not data.get("etag"):
+                if logger:
+                    logger.info(
+                        f"{host} does not support etag/waitChange, "
+                        "falling back to regular polling"
+                    )
+                self.supported = False
+                self._first_result.set()
+                return
+
+            # Always keep the newest document; only etag changes count as changes
+            self.latest = result
+            self._first_result.set()
+            if data is None:
+                self.etag = None
+                await asyncio.sleep(retry_delay)
+            elif data["etag"] != self.etag:
+                self.etag = data["etag"]
+                self.changes += 1
+
+
 async def fetch_bucket_data(session, host, bucket_name, user, password):
     """Fetch detailed data for a specific bucket."""
     url = f"{host}/pools/default/buckets/{bucket_name}"
     try:
-        # Create SSL context for HTTPS requests
-        ssl_context = None
-        if host.startswith("https://"):
-            ssl_context = ssl.create_default_context()
-            ssl_context.check_hostname = False
-            ssl_context.verify_mode = ssl.CERT_NONE
-
-        async with session.get(
-            url, auth=aiohttp.BasicAuth(user, password), timeout=10, ssl=ssl_context
-        ) as response:
-            if response.status == 200:
-                data = await response.json()
-                return {"bucket_name": bucket_name, "data": data, "error": None}
-            else:
-                return {
-                    "bucket_name": bucket_name,
-                    "data": None,
-                    "error": f"Failed with status {response.status}",
-                }
+        status, data = await fetch_json(
+            session, host, url, user, password, PRIORITY_DETAILS
+        )
+        if status == 200:
+            return {"bucket_name": bucket_name, "data": data, "error": None}
+        return {
+            "bucket_name": bucket_name,
+            "data": None,
+            "error": f"Failed with status {status}",
+        }
     except Exception as e:
-        if logger:
-            logger.error(f"Error fetching bucket data from {url}: {str(e)}")
+        log_upstream_error(f"Error fetching bucket data from {url}", e)
         return {"bucket_name": bucket_name, "data": None, "error": str(e)}
 
 
@@ -187,28 +1197,22 @@ async def fetch_bucket_stats(session, host, bucket_name, user, password):
     """Fetch stats data for a specific bucket."""
     url = f"{host}/pools/default/buckets/{bucket_name}/stats"
     try:
-        # Create SSL context for HTTPS requests
-        ssl_context = None
-        if host.startswith("https://"):
-            ssl_context = ssl.create_default_context()
-            ssl_context.check_hostname = False
-            ssl_context.verify_mode = ssl.CERT_NONE
-
-        async with session.get(
-            url, auth=aiohttp.BasicAuth(user, password), timeout=10, ssl=ssl_context
-        ) as response:
-            if response.status == 200:
-                data = await response.json()
-                return {"bucket_name": bucket_name, "stats": data, "error": None}
-            else:
-                return {
-                    "bucket_name": bucket_name,
-                    "stats": None,
-                    "error": f"Failed with status {response.status}",
-                }
+        status, data = await fetch_json(
+            session, host, url, user, password, PRIORITY_STATS
+        )
+        if status == 200:
+            return {
+                "bucket_name": bucket_name,
+                "stats": stats_projection.apply(data),
+                "error": None,
+            }
+        return {
+            "bucket_name": bucket_name,
+            "stats": None,
+            "error": f"Failed with status {status}",
+        }
     except Exception as e:
-        if logger:
-            logger.error(f"Error fetching bucket stats from {url}: {str(e)}")
+        log_upstream_error(f"Error fetching bucket stats from {url}", e)
         return {"bucket_name": bucket_name, "stats": None, "error": str(e)}
 
 
@@ -216,90 +1220,59 @@ async def fetch_index_status(session, host, user, password):
     """Fetch index status data from /indexStatus endpoint."""
     url = f"{host}/indexStatus"
     try:
-        # Create SSL context for HTTPS requests
-        ssl_context = None
-        if host.startswith("https://"):
-            ssl_context = ssl.create_default_context()
-            ssl_context.check_hostname = False
-            ssl_context.verify_mode = ssl.CERT_NONE
-
-        async with session.get(
-            url, auth=aiohttp.BasicAuth(user, password), timeout=10, ssl=ssl_context
-        ) as response:
-            if response.status == 200:
-                data = await response.json()
-                return {"host": host, "data": data, "error": None}
-            else:
-                return {
-                    "host": host,
-                    "data": None,
-                    "error": f"Failed with status {response.status}",
-                }
+        status, data = await fetch_json(
+            session, host, url, user, password, PRIORITY_DETAILS
+        )
+        if status == 200:
+            return {"host": host, "data": data, "error": None}
+        return {"host": host, "data": None, "error": f"Failed with status {status}"}
     except Exception as e:
-        if logger:
-            logger.error(f"Error fetching index status from {url}: {str(e)}")
+        log_upstream_error(f"Error fetching index status from {url}", e)
         return {"host": host, "data": None, "error": str(e)}
 
 
 async def fetch_xdcr_data(session, host, user, password):
     """Fetch XDCR data from remote clusters and tasks endpoints."""
     try:
-        # Create SSL context for HTTPS requests
-        ssl_context = None
-        if host.startswith("https://"):
-            ssl_context = ssl.create_default_context()
-            ssl_context.check_hostname = False
-            ssl_context.verify_mode = ssl.CERT_NONE
-
-        # Fetch remote clusters
         remote_clusters_url = f"{host}/pools/default/remoteClusters"
         tasks_url = f"{host}/pools/default/tasks"
 
-        # Fetch both endpoints concurrently
-        async with session.get(
-            remote_clusters_url,
-            auth=aiohttp.BasicAuth(user, password),
-            timeout=10,
-            ssl=ssl_context,
-        ) as remote_clusters_response, session.get(
-            tasks_url,
-            auth=aiohttp.BasicAuth(user, password),
-            timeout=10,
-            ssl=ssl_context,
-        ) as tasks_response:
-
-            remote_clusters_data = []
-            xdcr_tasks_data = []
-            errors = []
-
-            # Process remote clusters response
-            if remote_clusters_response.status == 200:
-                remote_clusters_data = await remote_clusters_response.json()
-            else:
-                errors.append(
-                    f"Remote clusters failed with status {remote_clusters_response.status}"
-                )
+        # Fetch both endpoints concurrently, each holding its own request slot
+        (remote_status, remote_clusters), (tasks_status, all_tasks) = (
+            await asyncio.gather(
+                fetch_json(
+                    session, host, remote_clusters_url, user, password, PRIORITY_DETAILS
+                ),
+                fetch_json(session, host, tasks_url, user, password, PRIORITY_DETAILS),
+            )
+        )
 
-            # Process tasks response
-            if tasks_response.status == 200:
-                all_tasks = await tasks_response.json()
-                # Filter for XDCR tasks only
-                xdcr_tasks_data = [
-                    task for task in all_tasks if task.get("type") == "xdcr"
-                ]
-            else:
-                errors.append(f"Tasks failed with status {tasks_response.status}")
+        remote_clusters_data = []
+        xdcr_tasks_data = []
+        errors = []
 
-            return {
-                "host": host,
-                "remoteClusters": remote_clusters_data,
-                "xdcrTasks": xdcr_tasks_data,
-                "error": "; ".join(errors) if errors else None,
-            }
+        # Process remote clusters response
+        if remote_status == 200:
+            remote_clusters_data = remote_clusters
+        else:
+            errors.append(f"Remote clusters failed with status {remote_status}")
+
+        # Process tasks response
+        if tasks_status == 200:
+            # Filter for XDCR tasks only
+            xdcr_tasks_data = [task for task in all_tasks if task.get("type") == "xdcr"]
+        else:
+            errors.append(f"Tasks failed with status {tasks_status}")
+
+        return {
+            "host": host,
+            "remoteClusters": remote_clusters_data,
+            "xdcrTasks": xdcr_tasks_data,
+            "error": "; ".join(errors) if errors else None,
+        }
 
     except Exception as e:
-        if logger:
-            logger.error(f"Error fetching XDCR data from {host}: {str(e)}")
+        log_upstream_error(f"Error fetching XDCR data from {host}", e)
         return {
             "host": host,
             "remoteClusters": [],
@@ -308,133 +1281,123 @@ async def fetch_xdcr_data(session, host, user, password):
         }
 
 
-async def get_all_clusters_data(clusters):
-    """Fetch data from all clusters and their buckets asynchronously with timeout handling."""
-    async with aiohttp.ClientSession() as session:
-        # Fetch /pools/default for all clusters with individual timeouts
-        cluster_tasks = []
-        cluster_configs = []
+async def get_all_clusters_data(clusters, session=None):
+    """Fetch data from all clusters and their buckets concurrently, with timeouts.
 
-        for cluster in clusters:
-            # Check if cluster should be watched
-            if cluster.get(
-                "watch", True
-            ):  # Default to True if watch field is not present
-                task = asyncio.create_task(
-                    fetch_cluster_data_with_timeout(
-                        session, cluster, 15
-                    )  # 15 second timeout per cluster
-                )
-                cluster_tasks.append(task)
-                cluster_configs.append(cluster)
-            else:
-                # For unwatched clusters, create a placeholder result
-                cluster_tasks.append(
-                    asyncio.create_task(create_not_watching_result(cluster))
-                )
-                cluster_configs.append(cluster)
+    Every cluster runs as an independent pipeline, so the whole refresh takes
+    about as long as the slowest cluster. Pass ``session`` to reuse an existing
+    ClientSession; otherwise a temporary one is opened for the call.
+    """
+    if session is None:
+        async with aiohttp.ClientSession() as session:
+            return await get_all_clusters_data(clusters, session=session)
 
-        # Wait for all tasks to complete or timeout individually
-        cluster_results = await asyncio.gather(*cluster_tasks, return_exceptions=True)
+    return list(
+        await asyncio.gather(
+            *(fetch_cluster_pipeline(session, cluster) for cluster in clusters)
+        )
+    )
 
-        # Process results and fetch bucket details
-        all_results = []
-        for i, cluster_result in enumerate(cluster_results):
-            cluster_config = cluster_configs[i]
 
-            # Handle exceptions or timeouts
-            if isinstance(cluster_result, Exception):
-                if logger:
-                    logger.error(
-                        f"Error fetching data from {cluster_config['host']}: {str(cluster_result)}"
-                    )
-                result = {
-                    "host": cluster_config["host"],
-                    "customName": cluster_config.get("customName"),
-                    "data": None,
-                    "error": f"Timeout or error: {str(cluster_result)}",
-                    "buckets": [],
-                    "bucket_stats": [],
-                }
-            else:
-                result = {
-                    "host": cluster_result["host"],
-                    "customName": cluster_config.get("customName"),
-                    "data": cluster_result["data"],
-                    "error": cluster_result["error"],
-                    "buckets": [],
-                    "bucket_stats": [],
-                }
-                # Preserve not_watching flag if present
-                if cluster_result.get("not_watching"):
-                    result["not_watching"] = True
-
-                # Only fetch bucket details if cluster data was successful
-                if cluster_result["data"]:
-                    bucket_names = [
-                        bucket["bucketName"]
-                        for bucket in cluster_result["data"].get("bucketNames", [])
-                    ]
-                    if bucket_names:
-                        try:
-                            # Fetch bucket data with timeout
-                            bucket_tasks = [
-                                fetch_bucket_data(
-                                    session,
-                                    cluster_result["host"],
-                                    bucket_name,
-                                    cluster_config["user"],
-                                    cluster_config["pass"],
-                                )
-                                for bucket_name in bucket_names
-                            ]
-                            bucket_stats_tasks = [
-                                fetch_bucket_stats(
-                                    session,
-                                    cluster_result["host"],
-                                    bucket_name,
-                                    cluster_config["user"],
-                                    cluster_config["pass"],
-                                )
-                                for bucket_name in bucket_names
-                            ]
-
-                            # Use timeout for bucket operations too
-                            bucket_results = await asyncio.wait_for(
-                                asyncio.gather(*bucket_tasks, return_exceptions=True),
-                                timeout=10,
-                            )
-                            bucket_stats_results = await asyncio.wait_for(
-                                asyncio.gather(
-                                    *bucket_stats_tasks, return_exceptions=True
-                                ),
-                                timeout=10,
-                            )
-
-                            result["buckets"] = [
-                                r
-                                for r in bucket_results
-                                if not isinstance(r, Exception)
-                            ]
-                            result["bucket_stats"] = [
-                                r
-                                for r in bucket_stats_results
-                                if not isinstance(r, Exception)
-                            ]
-
-                        except asyncio.TimeoutError:
-                            if logger:
-                                logger.warning(
-                                    f"Bucket data fetch timeout for {cluster_result['host']}"
-                                )
-                        except Exception as e:
-                            if logger:
-                                logger.error(
-                                    f"Error fetching bucket data for {cluster_result['host']}: {str(e)}"
-                                )
-
-            all_results.append(result)
-        return all_results
+async def fetch_cluster_pipeline(
+    session, cluster_config, cluster_result=None, bucket_kinds=("buckets", "stats")
+):
+    """Fetch one cluster end to end: /pools/default, then bucket details and stats.
+
+    Bucket details and bucket stats are requested at the same time once the
+    bucket names are known. Errors are folded into the result so a failing
+    cluster never affects the others. Pass ``cluster_result`` to reuse an
+    already-fetched /pools/default result (e.g. from a PoolsWatcher), and
+    ``bucket_kinds`` to fetch only bucket details or only bucket stats.
+    """
+    if not cluster_config.get("watch", True):
+        # For unwatched clusters, create a placeholder result
+        result = await create_not_watching_result(cluster_config)
+        result.update(
+            {
+                "customName": cluster_config.get("customName"),
+                "buckets": [],
+                "bucket_stats": [],
+            }
+        )
+        return result
+
+    if cluster_result is None:
+        cluster_result = await fetch_pools_result(session, cluster_config)
+
+    result = {
+        "host": cluster_result["host"],
+        "customName": cluster_config.get("customName"),
+        "data": cluster_result["data"],
+        "error": cluster_result["error"],
+        "buckets": [],
+        "bucket_stats": [],
+    }
+
+    # Only fetch bucket details if cluster data was successful
+    if cluster_result["data"]:
+        bucket_names = pools_bucket_names(cluster_result)
+        if bucket_names:
+            host = cluster_result["host"]
+            user = cluster_config["user"]
+            password = cluster_config["pass"]
+            result["buckets"], result["bucket_stats"] = await asyncio.gather(
+                gather_bucket_results(
+                    host,
+                    "data",
+                    [
+                        fetch_bucket_data(session, host, name, user, password)
+                        for name in bucket_names
+                        if "buckets" in bucket_kinds
+                    ],
+                ),
+                gather_bucket_results(
+                    host,
+                    "stats",
+                    [
+                        fetch_bucket_stats(session, host, name, user, password)
+                        for name in bucket_names
+                        if "stats" in bucket_kinds
+                    ],
+                ),
+            )
+
+    return result
+
+
+async def fetch_pools_result(session, cluster_config):
+    """Fetch a cluster's /pools/default within CLUSTER_TIMEOUT, folding errors in."""
+    try:
+        return await fetch_cluster_data_with_timeout(
+            session, cluster_config, CLUSTER_TIMEOUT
+        )
+    except Exception as e:
+        if logger:
+            logger.error(f"Error fetching data from {cluster_config['host']}: {str(e)}")
+        return {
+            "host": cluster_config["host"],
+            "data": None,
+            "error": f"Timeout or error: {str(e)}",
+        }
+
+
+def pools_bucket_names(cluster_result):
+    """Return the bucket names listed in a /pools/default result."""
+    data = (cluster_result or {}).get("data") or {}
+    return [bucket["bucketName"] for bucket in data.get("bucketNames", [])]
+
+
+async def gather_bucket_results(host, kind, coros, timeout_seconds=BUCKET_TIMEOUT):
+    """Run per-bucket fetches concurrently, dropping failures and timeouts."""
+    try:
+        results = await asyncio.wait_for(
+            asyncio.gather(*coros, return_exceptions=True), timeout=timeout_seconds
+        )
+    except asyncio.TimeoutError:
+        if logger:
+            logger.warning(f"Bucket {kind} fetch timeout for {host}")
+        return []
+    return [r for r in results if not isinstance(r, Exception)]
 
 
 async def fetch_cluster_data_with_timeout(session, cluster_config, timeout_seconds):
@@ -535,14 +1498,211 @@ def validate_config(config_data):
                 if "watch" in cluster and not isinstance(cluster["watch"], bool):
                     errors.append(f"'watch' field in cluster {i} must be a boolean")
 
+                if "tls" in cluster:
+                    errors.extend(validate_tls_config(cluster["tls"], i))
+
+                if "poolsMode" in cluster and cluster["poolsMode"] not in POOLS_MODES:
+                    errors.append(
+                        f"'poolsMode' in cluster {i} must be one of: "
+                        f"{', '.join(POOLS_MODES)}"
+                    )
+
+                if "refreshInterval" in cluster and not is_positive_number(
+                    cluster["refreshInterval"]
+                ):
+                    errors.append(
+                        f"'refreshInterval' in cluster {i} must be a positive number"
+                    )
+
+                if "cadences" in cluster:
+                    errors.extend(
+                        validate_cadences(cluster["cadences"], f"cluster {i}")
+                    )
+
+    # Validate optional HTTP connection pool section
+    if "server" in config_data:
+        server_config = config_data["server"]
+        if not isinstance(server_config, dict):
+            errors.append("'server' must be an object")
+        else:
+            if "mode" in server_config and server_config["mode"] not in SERVER_MODES:
+                errors.append(
+                    f"'mode' in server config must be one of: {', '.join(SERVER_MODES)}"
+                )
+            if "workers" in server_config and not (
+                is_number(server_config["workers"])
+                and float(server_config["workers"]).is_integer()
+                and server_config["workers"] >= 1
+            ):
+                errors.append("'workers' in server config must be a positive integer")
+
+    if "compression" in config_data:
+        compression_config = config_data["compression"]
+        if not isinstance(compression_config, dict):
+            errors.append("'compression' must be an object")
+        else:
+            if "enabled" in compression_config and not isinstance(
+                compression_config["enabled"], bool
+            ):
+                errors.append("'enabled' in compression config must be a boolean")
+            if "minSize" in compression_config and not (
+                is_number(compression_config["minSize"])
+                and compression_config["minSize"] >= 0
+            ):
+                errors.append(
+                    "'minSize' in compression config must be a non-negative number"
+                )
+
+    if "stats" in config_data:
+        stats_config = config_data["stats"]
+        if not isinstance(stats_config, dict):
+            errors.append("'stats' must be an object")
+        elif "metrics" in stats_config:
+            metrics = stats_config["metrics"]
+            if metrics != "*" and not (
+                isinstance(metrics, list)
+                and all(isinstance(name, str) for name in metrics)
+            ):
+                errors.append(
+                    "'metrics' in stats config must be \"*\" or a list of metric names"
+                )
+
+    if "http" in config_data:
+        http_config = config_data["http"]
+        if not isinstance(http_config, dict):
+            errors.append("'http' must be an object")
+        else:
+            for field in (
+                "connectionLimit",
+                "connectionLimitPerHost",
+                "dnsCacheTtl",
+                "keepaliveTimeout",
+                "maxConcurrentRequests",
+                "maxConcurrentRequestsPerCluster",
+                "breakerFailureThreshold",
+                "breakerBaseBackoff",
+                "breakerMaxBackoff",
+                "minRequestTimeout",
+                "maxRequestTimeout",
+            ):
+                if field in http_config and not is_positive_number(http_config[field]):
+                    errors.append(f"'{field}' in http config must be a positive number")
+            if "adaptiveTimeouts" in http_config and not isinstance(
+                http_config["adaptiveTimeouts"], bool
+            ):
+                errors.append("'adaptiveTimeouts' in http config must be a boolean")
+            min_timeout = http_config.get(
+                "minRequestTimeout", DEFAULT_MIN_REQUEST_TIMEOUT
+            )
+            max_timeout = http_config.get("maxRequestTimeout", REQUEST_TIMEOUT)
+            if (
+                is_positive_number(min_timeout)
+                and is_positive_number(max_timeout)
+                and min_timeout > max_timeout
+            ):
+                errors.append(
+                    "'minRequestTimeout' in http config must not exceed "
+                    "'maxRequestTimeout'"
+                )
+
+    if "indexes" in config_data:
+        indexes_config = config_data["indexes"]
+        if not isinstance(indexes_config, dict):
+            errors.append("'indexes' must be an object")
+        elif "cacheTtl" in indexes_config and not (
+            is_number(indexes_config["cacheTtl"]) and indexes_config["cacheTtl"] >= 0
+        ):
+            errors.append("'cacheTtl' in indexes config must be a non-negative number")
+
+    # Validate optional collector section
+    if "collector" in config_data:
+        collector_config = config_data["collector"]
+        if not isinstance(collector_config, dict):
+            errors.append("'collector' must be an object")
+        else:
+            if "enabled" in collector_config and not isinstance(
+                collector_config["enabled"], bool
+            ):
+                errors.append("'enabled' in collector config must be a boolean")
+            if "interval" in collector_config and not is_positive_number(
+                collector_config["interval"]
+            ):
+                errors.append(
+                    "'interval' in collector config must be a positive number"
+                )
+            if (
+                "poolsMode" in collector_config
+                and collector_config["poolsMode"] not in POOLS_MODES
+            ):
+                errors.append(
+                    "'poolsMode' in collector config must be one of: "
+                    f"{', '.join(POOLS_MODES)}"
+                )
+            if "timeseriesRetention" in collector_config and not (
+                is_number(collector_config["timeseriesRetention"])
+                and float(collector_config["timeseriesRetention"]).is_integer()
+                and collector_config["timeseriesRetention"] >= 1
+            ):
+                errors.append(
+                    "'timeseriesRetention' in collector config must be a positive "
+                    "integer"
+                )
+            if "waitChange" in collector_config and not is_positive_number(
+                collector_config["waitChange"]
+            ):
+                errors.append(
+                    "'waitChange' in collector config must be a positive number"
+                )
+            if "cadences" in collector_config:
+                errors.extend(
+                    validate_cadences(collector_config["cadences"], "collector config")
+                )
+
+    return errors
+
+
+def validate_tls_config(tls_config, cluster_index):
+    """Validate a cluster's optional ``tls`` section."""
+    errors = []
+    if not isinstance(tls_config, dict):
+        return [f"'tls' in cluster {cluster_index} must be an object"]
+    if "verify" in tls_config and not isinstance(tls_config["verify"], bool):
+        errors.append(f"'tls.verify' in cluster {cluster_index} must be a boolean")
+    for field in ("caFile", "certFile", "keyFile"):
+        if field in tls_config and not isinstance(tls_config[field], str):
+            errors.append(f"'tls.{field}' in cluster {cluster_index} must be a string")
+    if "keyFile" in tls_config and "certFile" not in tls_config:
+        errors.append(
+            f"'tls.keyFile' in cluster {cluster_index} requires 'tls.certFile'"
+        )
+    return errors
+
+
+def validate_cadences(cadences, location):
+    """Validate a ``cadences`` object (seconds per data class)."""
+    if not isinstance(cadences, dict):
+        return [f"'cadences' in {location} must be an object"]
+    errors = []
+    for name, seconds in cadences.items():
+        if name not in DATA_CLASSES:
+            errors.append(
+                f"Unknown cadence '{name}' in {location}, expected one of: "
+                f"{', '.join(DATA_CLASSES)}"
+            )
+        elif not is_positive_number(seconds):
+            errors.append(f"'cadences.{name}' in {location} must be a positive number")
     return errors
 
 
-def load_config():
-    """Load and validate cluster configurations from config.json."""
+def load_config(raise_errors=False, path=CONFIG_PATH):
+    """Load and validate cluster configurations from ``path`` (config.json).
+
+    Errors are logged and an empty list is returned, unless ``raise_errors``
+    is set (ConfigStore uses that to keep its last good config).
+    """
     global config
     try:
-        with open("config.json", "r") as f:
+        with open(path, "r") as f:
             config_data = json.load(f)
 
         # Validate configuration
@@ -556,6 +1716,32 @@ def load_config():
             raise ValueError(f"Configuration validation failed: {'; '.join(errors)}")
 
         config = config_data
+        tls_registry.configure(config_data["clusters"])
+        http_config = config_data.get("http", {})
+        request_scheduler.configure(
+            http_config.get("maxConcurrentRequests", DEFAULT_MAX_CONCURRENT_REQUESTS),
+            http_config.get(
+                "maxConcurrentRequestsPerCluster",
+                DEFAULT_MAX_CONCURRENT_REQUESTS_PER_CLUSTER,
+            ),
+        )
+        upstream_health.configure(
+            http_config.get(
+                "breakerFailureThreshold", DEFAULT_BREAKER_FAILURE_THRESHOLD
+            ),
+            http_config.get("breakerBaseBackoff", DEFAULT_BREAKER_BASE_BACKOFF),
+            http_config.get("breakerMaxBackoff", DEFAULT_BREAKER_MAX_BACKOFF),
+            http_config.get("adaptiveTimeouts", True),
+            http_config.get("minRequestTimeout", DEFAULT_MIN_REQUEST_TIMEOUT),
+            http_config.get("maxRequestTimeout", REQUEST_TIMEOUT),
+        )
+        stats_metrics = config_data.get("stats", {}).get(
+            "metrics", DEFAULT_STATS_METRICS
+        )
+        stats_projection.configure(None if stats_metrics == "*" else stats_metrics)
+        index_status_cache.ttl = config_data.get("indexes", {}).get(
+            "cacheTtl", DEFAULT_INDEX_CACHE_TTL
+        )
         return config_data["clusters"]
     except FileNotFoundError:
         error_msg = "config.json file not found"
@@ -563,6 +1749,8 @@ def load_config():
             logger.error(error_msg)
         else:
             print(error_msg)
+        if raise_errors:
+            raise
         return []
     except json.JSONDecodeError as e:
         error_msg = f"Invalid JSON in config.json: {str(e)}"
@@ -570,6 +1758,8 @@ def load_config():
             logger.error(error_msg)
         else:
             print(error_msg)
+        if raise_errors:
+            raise
         return []
     except Exception as e:
         error_msg = f"Error loading config.json: {str(e)}"
@@ -577,207 +1767,2033 @@ def load_config():
             logger.error(error_msg)
         else:
             print(error_msg)
+        if raise_errors:
+            raise
         return []
 
 
-def process_cluster_data(clusters_data):
-    """Process cluster and bucket data for rendering."""
-    clusters = []
-    for cluster in clusters_data:
-        if cluster.get("not_watching", False):
-            # Handle not watching case
-            cluster_info = {
-                "host": cluster["host"],
-                "customName": cluster.get("customName"),
-                "clusterName": "Not Watching",
-                "clusterUUID": "N/A",
-                "health": None,  # Use None to indicate not watching status
-                "memory": {"total": 0, "used": 0, "quotaTotal": 0},
-                "disk": {"total": 0, "used": 0, "free": 0},
-                "nodes": [],
-                "buckets": [],
-                "bucket_stats": [],
-                "systemStats": {},
-                "error": None,
-                "not_watching": True,
-            }
-        elif cluster["data"]:
-            data = cluster["data"]
-            bucket_details = []
-            bucket_stats = []
-
-            for bucket in cluster["buckets"]:
-                if bucket["data"]:
-                    bucket_details.append(
-                        {
-                            "name": bucket["bucket_name"],
-                            "uuid": bucket["data"].get("uuid", "Unknown"),
-                            "bucketType": bucket["data"].get("bucketType", "Unknown"),
-                            "storageBackend": bucket["data"].get(
-                                "storageBackend", "Unknown"
-                            ),
-                            "replicaNumber": bucket["data"].get("replicaNumber", 0),
-                            "basicStats": bucket["data"].get("basicStats", {}),
-                            "quota": bucket["data"].get("quota", {}),
-                            "evictionPolicy": bucket["data"].get(
-                                "evictionPolicy", "Unknown"
-                            ),
-                            "durabilityMinLevel": bucket["data"].get(
-                                "durabilityMinLevel", "Unknown"
-                            ),
-                            "quotaPercentUsed": bucket["data"]
-                            .get("basicStats", {})
-                            .get("quotaPercentUsed", 0),
-                            "opsPerSec": bucket["data"]
-                            .get("basicStats", {})
-                            .get("opsPerSec", 0),
-                            "diskFetches": bucket["data"]
-                            .get("basicStats", {})
-                            .get("diskFetches", 0),
-                            "error": None,
-                        }
-                    )
-                else:
-                    bucket_details.append(
-                        {
-                            "name": bucket["bucket_name"],
-                            "uuid": "Unknown",
-                            "bucketType": "Unknown",
-                            "storageBackend": "Unknown",
-                            "replicaNumber": 0,
-                            "basicStats": {},
-                            "quota": {},
-                            "evictionPolicy": "Unknown",
-                            "durabilityMinLevel": "Unknown",
-                            "quotaPercentUsed": 0,
-                            "opsPerSec": 0,
-                            "diskFetches": 0,
-                            "error": bucket["error"],
-                        }
-                    )
+class ConfigStore:
+    """Validated config.json held in memory, reloaded only when the file changes.
+
+    ``clusters()`` costs one ``os.stat``: the file is re-read and re-validated
+    only when its mtime, inode or size differ from the last load, or when
+    ``force`` is set (SIGHUP). An edit that fails to load keeps the last good
+    config. Listeners get the new config after every successful reload.
+    """
+
+    def __init__(self, path=CONFIG_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._stamp = None
+        self._clusters = None
+        self._listeners = []
+
+    def add_listener(self, callback):
+        self._listeners.append(callback)
+
+    def invalidate(self):
+        """Forget the cached config so the next call reloads it."""
+        with self._lock:
+            self._stamp = None
+            self._clusters = None
+
+    def _stat(self):
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_ino, st.st_size)
+
+    def clusters(self, force=False):
+        """Return the current cluster list, reloading config.json if it changed."""
+        stamp = self._stat()
+        with self._lock:
+            if not force and self._clusters is not None and stamp == self._stamp:
+                return self._clusters
+            reloading = self._clusters is not None
+            self._stamp = stamp
+            try:
+                clusters = load_config(raise_errors=True, path=self.path)
+            except Exception:
+                # load_config already logged why; keep serving the last good one
+                if self._clusters is None:
+                    self._clusters = []
+                return self._clusters
+            self._clusters = clusters
+
+        if reloading:
+            if logger:
+                logger.info(f"Reloaded {self.path} ({len(clusters)} cluster(s))")
+            for callback in self._listeners:
+                try:
+                    callback(config)
+                except Exception as e:
+                    if logger:
+                        logger.error(f"Error applying reloaded config: {str(e)}")
+        return clusters
 
-            for bucket_stat in cluster["bucket_stats"]:
-                if bucket_stat["stats"]:
-                    bucket_stats.append(
-                        {
-                            "name": bucket_stat["bucket_name"],
-                            "stats": bucket_stat["stats"],
-                            "error": None,
-                        }
-                    )
-                else:
-                    bucket_stats.append(
-                        {
-                            "name": bucket_stat["bucket_name"],
-                            "stats": None,
-                            "error": bucket_stat["error"],
-                        }
-                    )
 
-            # Extract cluster UUID from buckets URI if available
-            cluster_uuid = data.get("uuid", "Unknown")
-            if (
-                cluster_uuid == "Unknown"
-                and "buckets" in data
-                and "uri" in data["buckets"]
-            ):
-                buckets_uri = data["buckets"]["uri"]
-                if "uuid=" in buckets_uri:
-                    cluster_uuid = buckets_uri.split("uuid=")[1].split("&")[0]
-
-            cluster_info = {
-                "host": cluster["host"],
-                "customName": cluster.get("customName"),
-                "clusterName": data.get("clusterName", "Unknown"),
-                "clusterUUID": cluster_uuid,
-                "health": all(
-                    node["status"] == "healthy" for node in data.get("nodes", [])
-                ),
-                "memory": {
-                    "total": data.get("storageTotals", {})
-                    .get("ram", {})
-                    .get("total", 0)
-                    / (1024**3),
-                    "used": data.get("storageTotals", {}).get("ram", {}).get("used", 0)
-                    / (1024**3),
-                    "quotaTotal": data.get("storageTotals", {})
-                    .get("ram", {})
-                    .get("quotaTotal", 0)
-                    / (1024**3),
-                },
-                "disk": {
-                    "total": data.get("storageTotals", {})
-                    .get("hdd", {})
-                    .get("total", 0)
-                    / (1024**3),
-                    "used": data.get("storageTotals", {}).get("hdd", {}).get("used", 0)
-                    / (1024**3),
-                    "free": data.get("storageTotals", {}).get("hdd", {}).get("free", 0)
-                    / (1024**3),
-                },
-                "nodes": [
-                    {
-                        "hostname": node.get("hostname", "Unknown"),
-                        "status": node.get("status", "Unknown"),
-                        "services": node.get("services", []),
-                        "cpu_utilization": node.get("systemStats", {}).get(
-                            "cpu_utilization_rate", 0
-                        ),
-                        "memory_total": node.get("memoryTotal", 0) / (1024**3),
-                        "memory_free": node.get("memoryFree", 0) / (1024**3),
-                        "version": node.get("version", "Unknown"),
-                    }
-                    for node in data.get("nodes", [])
-                ],
-                "buckets": bucket_details,
-                "bucket_stats": bucket_stats,
-                "systemStats": data.get("nodes", [{}])[0].get("systemStats", {}),
-                "error": None,
-            }
-        else:
-            cluster_info = {
-                "host": cluster["host"],
-                "customName": cluster.get("customName"),
-                "clusterName": "Error",
-                "clusterUUID": "Unknown",
-                "health": False,
-                "memory": {"total": 0, "used": 0, "quotaTotal": 0},
-                "disk": {"total": 0, "used": 0, "free": 0},
-                "nodes": [],
-                "buckets": [],
-                "bucket_stats": [],
-                "systemStats": {},
-                "error": cluster["error"],
-            }
-        clusters.append(cluster_info)
-    return clusters
+config_store = ConfigStore()
 
 
-@app.route("/")
-def index():
-    return render_template("index.html", version=__version__)
+GIB = 1024**3
+ABSENT = object()  # marks a SnapshotRecord field left out of the mapping
 
 
-@app.route("/api/clusters")
-def get_clusters_data():
+class SnapshotRecord(Mapping):
+    """Read-only ``__slots__`` record that reads like the dict it replaces.
+
+    Processed clusters are held by every snapshot and compared, diffed and
+    serialized after each refresh. Slots keep the fields in a fraction of a
+    dict's memory, while ``record["field"]``, ``.get()``, ``dict(record)`` and
+    equality with plain dicts keep working for every consumer. JSONCodec
+    serializes records through ``to_dict()``. Subclasses list their public
+    fields in ``_fields``; fields set to ABSENT are not part of the mapping.
+    """
+
+    __slots__ = ()
+    _fields = ()
+    _optional = ()  # fields that may be ABSENT
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._keys = frozenset(cls._fields)
+        cls._values = operator.attrgetter(*cls._fields)
+
+    def __getitem__(self, key):
+        if key in self._keys:
+            value = getattr(self, key)
+            if value is not ABSENT:
+                return value
+        raise KeyError(key)
+
+    def __iter__(self):
+        for name in self._fields:
+            if getattr(self, name) is not ABSENT:
+                yield name
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __eq__(self, other):
+        if type(other) is type(self):
+            return self._values(self) == self._values(other)
+        return Mapping.__eq__(self, other)
+
+    __hash__ = None
+
+    def to_dict(self):
+        """Return the fields as a dict (nested records are left as they are)."""
+        fields = dict(zip(self._fields, self._values(self)))
+        for name in self._optional:
+            if fields[name] is ABSENT:
+                del fields[name]
+        return fields
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+
+class NodeInfo(SnapshotRecord):
+    """One node of a processed cluster; sizes in GiB."""
+
+    _fields = (
+        "hostname",
+        "status",
+        "services",
+        "cpu_utilization",
+        "memory_total",
+        "memory_free",
+        "version",
+    )
+    __slots__ = _fields
+
+    def __init__(self, node):
+        get = node.get
+        self.hostname = get("hostname", "Unknown")
+        self.status = get("status", "Unknown")
+        self.services = get("services", [])
+        self.cpu_utilization = get("systemStats", {}).get("cpu_utilization_rate", 0)
+        self.memory_total = get("memoryTotal", 0) / GIB
+        self.memory_free = get("memoryFree", 0) / GIB
+        self.version = get("version", "Unknown")
+
+
+class BucketInfo(SnapshotRecord):
+    """Bucket details from a ``fetch_bucket_data`` result."""
+
+    _fields = (
+        "name",
+        "uuid",
+        "bucketType",
+        "storageBackend",
+        "replicaNumber",
+        "basicStats",
+        "quota",
+        "evictionPolicy",
+        "durabilityMinLevel",
+        "quotaPercentUsed",
+        "opsPerSec",
+        "diskFetches",
+        "error",
+    )
+    __slots__ = _fields
+
+    def __init__(self, bucket):
+        data = bucket["data"] or {}
+        get = data.get
+        basic_stats = get("basicStats", {})
+        self.name = bucket["bucket_name"]
+        self.uuid = get("uuid", "Unknown")
+        self.bucketType = get("bucketType", "Unknown")
+        self.storageBackend = get("storageBackend", "Unknown")
+        self.replicaNumber = get("replicaNumber", 0)
+        self.basicStats = basic_stats
+        self.quota = get("quota", {})
+        self.evictionPolicy = get("evictionPolicy", "Unknown")
+        self.durabilityMinLevel = get("durabilityMinLevel", "Unknown")
+        self.quotaPercentUsed = basic_stats.get("quotaPercentUsed", 0)
+        self.opsPerSec = basic_stats.get("opsPerSec", 0)
+        self.diskFetches = basic_stats.get("diskFetches", 0)
+        self.error = None if bucket["data"] else bucket["error"]
+
+
+class BucketStatsInfo(SnapshotRecord):
+    """Stats samples from a ``fetch_bucket_stats`` result."""
+
+    _fields = ("name", "stats", "error")
+    __slots__ = _fields
+
+    def __init__(self, bucket_stat):
+        stats = bucket_stat["stats"]
+        self.name = bucket_stat["bucket_name"]
+        self.stats = stats or None
+        self.error = None if stats else bucket_stat["error"]
+
+
+class ClusterInfo(SnapshotRecord):
+    """A processed cluster as served by /api/clusters; sizes in GiB.
+
+    ``not_watching`` is only present (True) for clusters with ``watch: false``.
+    """
+
+    _fields = (
+        "host",
+        "customName",
+        "clusterName",
+        "clusterUUID",
+        "health",
+        "memory",
+        "disk",
+        "nodes",
+        "buckets",
+        "bucket_stats",
+        "systemStats",
+        "error",
+        "not_watching",
+    )
+    __slots__ = _fields + ("_json",)
+    _optional = ("not_watching",)
+
+    def __init__(self, cluster):
+        self._json = None
+        self.host = cluster["host"]
+        self.customName = cluster.get("customName")
+        self.not_watching = ABSENT
+        self.error = None
+        data = cluster.get("data")
+        if cluster.get("not_watching", False):
+            self._placeholder("Not Watching", "N/A", None)
+            self.not_watching = True
+        elif data:
+            self._extract(cluster, data)
+        else:
+            self._placeholder("Error", "Unknown", False)
+            self.error = cluster["error"]
+
+    def _placeholder(self, name, uuid, health):
+        self.clusterName = name
+        self.clusterUUID = uuid
+        # None means "not watching" to the dashboard
+        self.health = health
+        self.memory = {"total": 0, "used": 0, "quotaTotal": 0}
+        self.disk = {"total": 0, "used": 0, "free": 0}
+        self.nodes = []
+        self.buckets = []
+        self.bucket_stats = []
+        self.systemStats = {}
+
+    def _extract(self, cluster, data):
+        # Extract cluster UUID from buckets URI if available
+        cluster_uuid = data.get("uuid", "Unknown")
+        if cluster_uuid == "Unknown":
+            buckets_uri = (data.get("buckets") or {}).get("uri", "")
+            if "uuid=" in buckets_uri:
+                cluster_uuid = buckets_uri.split("uuid=")[1].split("&")[0]
+
+        storage = data.get("storageTotals", {})
+        ram = storage.get("ram", {})
+        hdd = storage.get("hdd", {})
+        raw_nodes = data.get("nodes", [])
+        nodes = [NodeInfo(node) for node in raw_nodes]
+
+        self.clusterName = data.get("clusterName", "Unknown")
+        self.clusterUUID = cluster_uuid
+        self.health = all(node.status == "healthy" for node in nodes)
+        self.memory = {
+            "total": ram.get("total", 0) / GIB,
+            "used": ram.get("used", 0) / GIB,
+            "quotaTotal": ram.get("quotaTotal", 0) / GIB,
+        }
+        self.disk = {
+            "total": hdd.get("total", 0) / GIB,
+            "used": hdd.get("used", 0) / GIB,
+            "free": hdd.get("free", 0) / GIB,
+        }
+        self.nodes = nodes
+        self.buckets = [BucketInfo(bucket) for bucket in cluster["buckets"]]
+        self.bucket_stats = [BucketStatsInfo(stat) for stat in cluster["bucket_stats"]]
+        self.systemStats = raw_nodes[0].get("systemStats", {}) if raw_nodes else {}
+
+    def refreshed(self, cluster, bucket_kinds):
+        """Copy of this cluster with only ``bucket_kinds`` rebuilt from ``cluster``.
+
+        Used when the /pools/default document itself is unchanged, so the nodes,
+        memory and disk figures are shared instead of extracted again.
+        """
+        info = object.__new__(ClusterInfo)
+        for field in self._fields:
+            setattr(info, field, getattr(self, field))
+        info._json = None
+        info.customName = cluster.get("customName")
+        if "buckets" in bucket_kinds:
+            info.buckets = [BucketInfo(bucket) for bucket in cluster["buckets"]]
+        if "stats" in bucket_kinds:
+            info.bucket_stats = [
+                BucketStatsInfo(stat) for stat in cluster["bucket_stats"]
+            ]
+        return info
+
+    def json_bytes(self):
+        """This cluster as /api/clusters serializes it, encoded once and reused.
+
+        Unchanged clusters keep their ClusterInfo across snapshots, so a new
+        snapshot only re-encodes the clusters that actually refreshed.
+        """
+        if self._json is None:
+            self._json = json_codec.dumps(self, sort_keys=app.json.sort_keys)
+        return self._json
+
+
+def encode_cluster_list(clusters):
+    """Serialize processed clusters as a JSON array, reusing ClusterInfo.json_bytes."""
+    with server_timing("serialize"):
+        return (
+            b"["
+            + b",".join(
+                (
+                    cluster.json_bytes()
+                    if isinstance(cluster, ClusterInfo)
+                    else json_codec.dumps(cluster, sort_keys=app.json.sort_keys)
+                )
+                for cluster in clusters
+            )
+            + b"]\n"
+        )
+
+
+def process_cluster_data(clusters_data):
+    """Process cluster and bucket data for rendering.
+
+    Returns one ClusterInfo per cluster, extracted in a single pass over the
+    raw payload.
+    """
+    return [ClusterInfo(cluster) for cluster in clusters_data]
+
+
+class LastGoodClusters:
+    """Serve each cluster's last good processed state while its refresh fails.
+
+    A failed refresh would otherwise replace the card with the "Error"
+    placeholder. Instead the last good state is returned with ``stale: True``,
+    ``collected_at`` (epoch seconds of the last good refresh) and the failure
+    in ``stale_error``; ``error`` stays None so the dashboard keeps its tabs
+    and charts. The age is left to the reader so that repeated failures give
+    an equal entry and don't bump the snapshot version. Buckets whose details
+    or stats failed keep their last good entry too, marked ``stale``.
+    """
+
+    def __init__(self, clock=time.time):
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._good = {}
+
+    def apply(self, cluster_info):
+        """Return ``cluster_info``, or the last good state if it is an error."""
+        host = cluster_info.get("host")
+        now = self.clock()
+        with self._lock:
+            if cluster_info.get("not_watching"):
+                self._good.pop(host, None)
+                return cluster_info
+            last = self._good.get(host)
+            if cluster_info.get("error") is None:
+                if last is not None:
+                    cluster_info = self._keep_good_buckets(cluster_info, last[0])
+                self._good[host] = (cluster_info, now)
+                return cluster_info
+        if last is None:
+            return cluster_info
+        good, collected_at = last
+        stale = dict(good)
+        stale.update(
+            {
+                "customName": cluster_info.get("customName"),
+                "stale": True,
+                "collected_at": int(collected_at),
+                "stale_error": cluster_info["error"],
+            }
+        )
+        return stale
+
+    @staticmethod
+    def _keep_good_buckets(cluster_info, good):
+        patched = None
+        for key in ("buckets", "bucket_stats"):
+            previous = {entry["name"]: entry for entry in good.get(key) or ()}
+            entries = cluster_info.get(key) or ()
+            for position, entry in enumerate(entries):
+                last_entry = previous.get(entry["name"])
+                if entry["error"] is None or last_entry is None:
+                    continue
+                if last_entry["error"] is not None:
+                    continue
+                if patched is None:
+                    patched = dict(cluster_info)
+                if patched[key] is entries:
+                    patched[key] = entries = list(entries)
+                entries[position] = dict(
+                    last_entry, stale=True, stale_error=entry["error"]
+                )
+        return cluster_info if patched is None else patched
+
+    def drop(self, host):
+        with self._lock:
+            self._good.pop(host, None)
+
+    def clear(self):
+        with self._lock:
+            self._good.clear()
+
+
+# Last good cluster states for requests served without the collector
+last_good_clusters = LastGoodClusters()
+
+
+def build_index_status_entry(cluster_config, result):
+    """Shape a fetch_index_status result (or exception) for /api/indexStatus."""
+    if isinstance(result, Exception):
+        return {
+            "host": cluster_config["host"],
+            "customName": cluster_config.get("customName"),
+            "data": None,
+            "error": str(result),
+        }
+    return {
+        "host": result["host"],
+        "customName": cluster_config.get("customName"),
+        "data": result["data"],
+        "error": result["error"],
+    }
+
+
+def build_xdcr_status_entry(cluster_config, result):
+    """Shape a fetch_xdcr_data result (or exception) for /api/xdcrStatus."""
+    if isinstance(result, Exception):
+        return {
+            "host": cluster_config["host"],
+            "customName": cluster_config.get("customName"),
+            "remoteClusters": [],
+            "xdcrTasks": [],
+            "error": str(result),
+        }
+    return {
+        "host": result["host"],
+        "customName": cluster_config.get("customName"),
+        "remoteClusters": result.get("remoteClusters", []),
+        "xdcrTasks": result.get("xdcrTasks", []),
+        "error": result.get("error"),
+    }
+
+
+class AsyncRuntime:
+    """Process-wide asyncio loop running in a dedicated thread.
+
+    The loop owns a single aiohttp ClientSession whose TCPConnector keeps
+    connections to every cluster alive between polls, so routes and the
+    collector stop paying a fresh TCP/TLS handshake on each request.
+    """
+
+    def __init__(
+        self,
+        connection_limit=DEFAULT_CONNECTION_LIMIT,
+        connection_limit_per_host=DEFAULT_CONNECTION_LIMIT_PER_HOST,
+        dns_cache_ttl=DEFAULT_DNS_CACHE_TTL,
+        keepalive_timeout=DEFAULT_KEEPALIVE_TIMEOUT,
+    ):
+        self.connection_limit = connection_limit
+        self.connection_limit_per_host = connection_limit_per_host
+        self.dns_cache_ttl = dns_cache_ttl
+        self.keepalive_timeout = keepalive_timeout
+        self.loop = None
+        self.session = None
+        self._thread = None
+
+    def is_running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """Start the loop thread and open the pooled session on it."""
+        if self.is_running():
+            return
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self.loop.run_forever, name="async-runtime", daemon=True
+        )
+        self._thread.start()
+        self.run(self._open_session())
+
+    async def _open_session(self):
+        connector = aiohttp.TCPConnector(
+            limit=self.connection_limit,
+            limit_per_host=self.connection_limit_per_host,
+            ttl_dns_cache=self.dns_cache_ttl,
+            use_dns_cache=True,
+            keepalive_timeout=self.keepalive_timeout,
+        )
+        self.session = aiohttp.ClientSession(connector=connector)
+
+    def submit(self, coro):
+        """Schedule a coroutine on the loop and return a concurrent Future."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro, timeout=None):
+        """Run a coroutine on the loop and block the calling thread for its result."""
+        return self.submit(coro).result(timeout)
+
+    def stop(self, timeout=5):
+        """Close the pooled session, then stop and close the loop."""
+        if not self.is_running():
+            return
+        if self.session is not None:
+            try:
+                self.run(self.session.close(), timeout)
+            except Exception as e:
+                if logger:
+                    logger.warning(f"Error closing HTTP session: {str(e)}")
+            self.session = None
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(timeout)
+        if not self._thread.is_alive():
+            self.loop.close()
+
+
+def get_runtime():
+    """Return the shared AsyncRuntime, starting it on first use."""
+    global runtime
+    with _runtime_lock:
+        if runtime is None or not runtime.is_running():
+            http_config = (config or {}).get("http", {})
+            runtime = AsyncRuntime(
+                connection_limit=http_config.get(
+                    "connectionLimit", DEFAULT_CONNECTION_LIMIT
+                ),
+                connection_limit_per_host=http_config.get(
+                    "connectionLimitPerHost", DEFAULT_CONNECTION_LIMIT_PER_HOST
+                ),
+                dns_cache_ttl=http_config.get("dnsCacheTtl", DEFAULT_DNS_CACHE_TTL),
+                keepalive_timeout=http_config.get(
+                    "keepaliveTimeout", DEFAULT_KEEPALIVE_TIMEOUT
+                ),
+            )
+            runtime.start()
+        return runtime
+
+
+def get_http_session():
+    """Return the pooled ClientSession owned by the shared runtime."""
+    return get_runtime().session
+
+
+def run_async(coro, timeout=None):
+    """Run a coroutine on the shared runtime loop from synchronous code."""
+    with server_timing("fetch"):
+        return get_runtime().run(coro, timeout)
+
+
+def stop_runtime():
+    """Close the pooled session and stop the shared loop thread."""
+    global runtime
+    with _runtime_lock:
+        if runtime is not None:
+            runtime.stop()
+            runtime = None
+
+
+class ClusterSnapshot:
+    """Immutable, versioned view of the latest collected data for every cluster.
+
+    A new snapshot is published whenever any cluster finishes a refresh; readers
+    just grab the current reference and never see a half-updated state.
+    """
+
+    __slots__ = (
+        "version",
+        "generated_at",
+        "clusters",
+        "index_status",
+        "xdcr_status",
+        "tag",
+    )
+
+    def __init__(
+        self, version, generated_at, clusters, index_status, xdcr_status, tag=None
+    ):
+        object.__setattr__(self, "version", version)
+        # Opaque version string used as the ETag and the delta ``since`` token
+        object.__setattr__(self, "tag", tag if tag is not None else str(version))
+        object.__setattr__(self, "generated_at", generated_at)
+        object.__setattr__(self, "clusters", tuple(clusters))
+        object.__setattr__(self, "index_status", tuple(index_status))
+        object.__setattr__(self, "xdcr_status", tuple(xdcr_status))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("ClusterSnapshot is immutable")
+
+
+def diff_cluster(old, new):
+    """Return ``(changes, removed)`` between two versions of a processed cluster.
+
+    ``changes`` holds only the fields that were added or changed. Lists such as
+    ``nodes`` and ``buckets`` are diffed item by item: when the length is
+    unchanged the result is a ``{position: item}`` mapping of the items that
+    differ, otherwise the whole list is sent. ``removed`` lists the fields of
+    ``old`` that ``new`` no longer has (e.g. ``stale`` once a cluster recovers).
+    """
+    changes = {}
+    for key, value in new.items():
+        previous = old.get(key)
+        if previous == value:
+            continue
+        if (
+            isinstance(value, list)
+            and isinstance(previous, list)
+            and len(value) == len(previous)
+        ):
+            changes[key] = {
+                str(position): item
+                for position, (before, item) in enumerate(zip(previous, value))
+                if before != item
+            }
+        else:
+            changes[key] = value
+    removed = [key for key in old if key not in new]
+    return changes, removed
+
+
+SAMPLES_ENCODINGS = ("json", "columnar")
+COLUMNAR_ENCODING = "f32-columnar-1"
+
+
+def _pack_little_endian(typecode, values):
+    packed = array(typecode, values)
+    if sys.byteorder != "little":
+        packed.byteswap()
+    return base64.b64encode(packed.tobytes()).decode("ascii")
+
+
+def encode_samples_columnar(samples):
+    """Encode an ``op.samples`` dict as base64 float32 columns.
+
+    Timestamps are sent as the first value plus int32 deltas. Metric columns
+    are concatenated metric-major into one float32 blob, so the browser can
+    take a ``Float32Array`` view per metric without copying. Missing values
+    become NaN.
+    """
+    timestamps = [int(ts) for ts in samples.get("timestamp") or []]
+    count = len(timestamps)
+    metrics = [
+        name
+        for name, values in samples.items()
+        if name != "timestamp" and isinstance(values, list)
+    ]
+    values = []
+    for name in metrics:
+        column = samples[name][:count]
+        values.extend(v if is_number(v) else math.nan for v in column)
+        values.extend([math.nan] * (count - len(column)))
+    return {
+        "encoding": COLUMNAR_ENCODING,
+        "count": count,
+        "t0": timestamps[0] if timestamps else 0,
+        "dt": _pack_little_endian(
+            "i", [b - a for a, b in zip(timestamps, timestamps[1:])]
+        ),
+        "metrics": metrics,
+        "values": _pack_little_endian("f", values),
+    }
+
+
+def _encode_bucket_stat(bucket_stat):
+    op = ((bucket_stat or {}).get("stats") or {}).get("op")
+    if not isinstance(op, dict) or "samples" not in op:
+        return bucket_stat
+    encoded_op = {key: value for key, value in op.items() if key != "samples"}
+    encoded_op["samplesColumnar"] = encode_samples_columnar(op["samples"] or {})
+    stats = dict(bucket_stat["stats"])
+    stats["op"] = encoded_op
+    return {**bucket_stat, "stats": stats}
+
+
+def encode_cluster_samples(cluster):
+    """Return a copy of a processed cluster (or delta changes) with columnar samples.
+
+    ``bucket_stats`` may be a full list or a delta ``{position: item}`` patch.
+    """
+    bucket_stats = cluster.get("bucket_stats")
+    if isinstance(bucket_stats, list):
+        encoded = [_encode_bucket_stat(item) for item in bucket_stats]
+    elif isinstance(bucket_stats, dict):
+        encoded = {pos: _encode_bucket_stat(item) for pos, item in bucket_stats.items()}
+    else:
+        return cluster
+    return {**cluster, "bucket_stats": encoded}
+
+
+def encode_clusters_payload(payload):
+    """Apply columnar sample encoding to a clusters list or delta payload."""
+    if isinstance(payload, list):
+        return [encode_cluster_samples(cluster) for cluster in payload]
+    if payload.get("full"):
+        return {**payload, "clusters": encode_clusters_payload(payload["clusters"])}
+    clusters = {}
+    for index, entry in payload["clusters"].items():
+        if "replace" in entry:
+            clusters[index] = {"replace": encode_cluster_samples(entry["replace"])}
+        else:
+            clusters[index] = {
+                **entry,
+                "changes": encode_cluster_samples(entry["changes"]),
+            }
+    return {**payload, "clusters": clusters}
+
+
+def requested_samples_encoding():
+    """Return the ``?samples=`` encoding of the current request (default json)."""
+    encoding = request.args.get("samples", "json")
+    return encoding if encoding in SAMPLES_ENCODINGS else "json"
+
+
+def build_clusters_delta(since_snapshot, snapshot):
+    """Build the ``/api/clusters?since=`` payload from ``since_snapshot``.
+
+    Falls back to a full payload when the client's version is unknown (too old,
+    or from a previous collector) or the cluster list changed shape.
+    """
+    payload = {"version": snapshot.tag, "total": len(snapshot.clusters)}
+    if since_snapshot is None or len(since_snapshot.clusters) != len(snapshot.clusters):
+        payload["full"] = True
+        payload["clusters"] = list(snapshot.clusters)
+        return payload
+
+    payload["full"] = False
+    payload["clusters"] = {}
+    for index, (old, new) in enumerate(zip(since_snapshot.clusters, snapshot.clusters)):
+        if old is new or old == new:
+            continue
+        if old.get("host") != new.get("host"):
+            payload["clusters"][str(index)] = {"replace": new}
+        else:
+            changes, removed = diff_cluster(old, new)
+            entry = {"changes": changes}
+            if removed:
+                entry["removed"] = removed
+            payload["clusters"][str(index)] = entry
+    return payload
+
+
+# Per-replication XDCR values: task field, stat name under replications/<id>/
+XDCR_COUNTERS = {
+    "changes_left": ("changesLeft", "changes_left"),
+    "docs_written": ("docsWritten", "docs_written"),
+    "docs_checked": ("docsChecked", "docs_checked"),
+    "latency_ms": (None, "wtavg_docs_latency"),
+}
+
+
+def xdcr_counter(task, samples, replication_id, metric):
+    """Read one XDCR value from the task entry or the newest bucket stat sample."""
+    field, stat = XDCR_COUNTERS[metric]
+    if field is not None and is_number(task.get(field)):
+        return task[field]
+    values = samples.get(f"{XDCR_STATS_PREFIX}{replication_id}/{stat}") or []
+    for value in reversed(values):
+        if is_number(value):
+            return value
+    return None
+
+
+class RingBuffer:
+    """Fixed-capacity float buffer backed by a flat ``array('d')``.
+
+    Appending past capacity overwrites the oldest value, so memory stays at
+    ``capacity * 8`` bytes however long the collector runs.
+    """
+
+    __slots__ = ("_data", "_next", "_count")
+
+    def __init__(self, capacity):
+        self._data = array("d", [math.nan]) * capacity
+        self._next = 0
+        self._count = 0
+
+    @property
+    def capacity(self):
+        return len(self._data)
+
+    def __len__(self):
+        return self._count
+
+    def append(self, value):
+        self._data[self._next] = value
+        self._next = (self._next + 1) % len(self._data)
+        if self._count < len(self._data):
+            self._count += 1
+
+    def last(self):
+        """Return the newest value, or None when empty."""
+        if not self._count:
+            return None
+        return self._data[self._next - 1]
+
+    def tolist(self):
+        """Return the values oldest first."""
+        if self._count < len(self._data):
+            return self._data[: self._count].tolist()
+        return (self._data[self._next :] + self._data[: self._next]).tolist()
+
+
+class SeriesGroup:
+    """Metrics sampled together: one timestamp ring plus one ring per metric.
+
+    All rings share the same capacity and cursor, so index ``i`` of every
+    metric lines up with index ``i`` of the timestamps. A metric missing from
+    a row is stored as NaN and returned as None.
+    """
+
+    __slots__ = ("timestamps", "metrics")
+
+    def __init__(self, capacity):
+        self.timestamps = RingBuffer(capacity)
+        self.metrics = {}
+
+    @property
+    def last_timestamp(self):
+        return self.timestamps.last()
+
+    def append(self, timestamp, values):
+        for name in values:
+            if name not in self.metrics:
+                # Backfill so a late-appearing metric stays aligned
+                ring = RingBuffer(self.timestamps.capacity)
+                for _ in range(len(self.timestamps)):
+                    ring.append(math.nan)
+                self.metrics[name] = ring
+        self.timestamps.append(timestamp)
+        for name, ring in self.metrics.items():
+            ring.append(values.get(name, math.nan))
+
+    def to_samples(self, since=None):
+        """Return ``{"timestamp": [...], metric: [...]}`` for points after ``since``."""
+        timestamps = self.timestamps.tolist()
+        start = 0
+        if since is not None:
+            while start < len(timestamps) and timestamps[start] <= since:
+                start += 1
+        samples = {"timestamp": [int(ts) for ts in timestamps[start:]]}
+        for name, ring in self.metrics.items():
+            samples[name] = [
+                None if math.isnan(value) else value for value in ring.tolist()[start:]
+            ]
+        return samples
+
+
+class TimeSeriesStore:
+    """In-process history of bucket and node metrics fed by the collector.
+
+    Series are grouped per ``(host, "bucket", name)``, ``(host, "node",
+    hostname)`` and ``(host, "xdcr", replication_id)``. Couchbase returns an
+    overlapping window of bucket samples on every poll; only points newer than
+    the last stored timestamp are appended.
+    """
+
+    def __init__(self, retention=DEFAULT_TIMESERIES_RETENTION):
+        self.retention = retention
+        self._groups = {}
+        self._xdcr_counters = {}
+        self._lock = threading.Lock()
+
+    def _group(self, key):
+        group = self._groups.get(key)
+        if group is None:
+            group = self._groups[key] = SeriesGroup(self.retention)
+        return group
+
+    def record_bucket_samples(self, host, bucket_name, samples):
+        """Append new points from a bucket stats ``op.samples`` block."""
+        timestamps = samples.get("timestamp") or []
+        metrics = {
+            name: values
+            for name, values in samples.items()
+            if name != "timestamp" and isinstance(values, list)
+        }
+        with self._lock:
+            group = self._group((host, "bucket", bucket_name))
+            last = group.last_timestamp
+            for i, timestamp in enumerate(timestamps):
+                if last is not None and timestamp <= last:
+                    continue
+                group.append(
+                    timestamp,
+                    {
+                        name: values[i]
+                        for name, values in metrics.items()
+                        if i < len(values) and is_number(values[i])
+                    },
+                )
+
+    def record_node_stats(self, host, hostname, timestamp, stats):
+        """Append one point of a node's numeric ``systemStats``/``interestingStats``."""
+        values = {name: value for name, value in stats.items() if is_number(value)}
+        with self._lock:
+            self._group((host, "node", hostname)).append(timestamp, values)
+
+    def record_cluster(self, cluster_result, timestamp=None):
+        """Feed a fetch_cluster_pipeline result into the store."""
+        host = cluster_result["host"]
+        for bucket_stat in cluster_result.get("bucket_stats") or []:
+            samples = ((bucket_stat.get("stats") or {}).get("op") or {}).get("samples")
+            if samples:
+                self.record_bucket_samples(host, bucket_stat["bucket_name"], samples)
+
+        data = cluster_result.get("data") or {}
+        timestamp = timestamp if timestamp is not None else time.time() * 1000
+        for node in data.get("nodes", []):
+            stats = dict(node.get("systemStats", {}))
+            stats.update(node.get("interestingStats", {}))
+            self.record_node_stats(
+                host, node.get("hostname", "Unknown"), timestamp, stats
+            )
+
+    def record_xdcr(self, host, xdcr_tasks, bucket_stats=(), timestamp=None):
+        """Append one throughput point per replication and return the new rows.
+
+        Counters come from the task entry, falling back to the
+        ``replications/<id>/...`` series of the source bucket's stats. Docs
+        written/checked per second are derived from the delta against the
+        previous collection; the first point and counter resets have no rate.
+        """
+        timestamp = timestamp if timestamp is not None else time.time() * 1000
+        samples_by_bucket = {
+            stat.get("bucket_name"): ((stat.get("stats") or {}).get("op") or {}).get(
+                "samples"
+            )
+            or {}
+            for stat in bucket_stats or []
+        }
+        rows = {}
+        with self._lock:
+            for task in xdcr_tasks or []:
+                replication_id = task.get("id")
+                if not replication_id:
+                    continue
+                samples = samples_by_bucket.get(task.get("source"), {})
+                counters = {
+                    metric: xdcr_counter(task, samples, replication_id, metric)
+                    for metric in XDCR_COUNTERS
+                }
+                key = (host, replication_id)
+                previous = self._xdcr_counters.get(key)
+                row = {}
+                for metric, value in counters.items():
+                    if value is None:
+                        continue
+                    if metric in ("changes_left", "latency_ms"):
+                        row[metric] = value
+                        continue
+                    last = previous and previous[1].get(metric)
+                    elapsed = (timestamp - previous[0]) / 1000 if previous else 0
+                    if last is not None and elapsed > 0 and value >= last:
+                        row[f"{metric}_rate"] = (value - last) / elapsed
+                self._xdcr_counters[key] = (timestamp, counters)
+                self._group((host, "xdcr", replication_id)).append(timestamp, row)
+                rows[replication_id] = row
+        return rows
+
+    def series(self, host, kind, name, since=None):
+        """Return a group's samples, or None if nothing was recorded for it."""
+        with self._lock:
+            group = self._groups.get((host, kind, name))
+            return group.to_samples(since) if group is not None else None
+
+    def drop(self, host):
+        """Forget every series belonging to ``host``."""
+        with self._lock:
+            for key in [key for key in self._groups if key[0] == host]:
+                del self._groups[key]
+            for key in [key for key in self._xdcr_counters if key[0] == host]:
+                del self._xdcr_counters[key]
+
+
+class RefreshSchedule:
+    """Track when each data class of one cluster is due for a refresh.
+
+    ``cadences`` maps every name in DATA_CLASSES to seconds between refreshes.
+    Everything is due on the first tick. ``results`` keeps the collector's
+    latest data per class so a tick can merge fresh classes with cached ones.
+    """
+
+    def __init__(self, cadences, clock=time.monotonic):
+        self.cadences = cadences
+        self.clock = clock
+        self.next_due = dict.fromkeys(cadences, 0.0)
+        self.results = {}
+
+    def take_due(self):
+        """Return the due classes and schedule their next refresh."""
+        now = self.clock()
+        due = {name for name, at in self.next_due.items() if at <= now}
+        for name in due:
+            self.next_due[name] = now + self.cadences[name]
+        return due
+
+    def mark_refreshed(self, *names):
+        """Count ``names`` as refreshed now (e.g. fetched early for a new bucket)."""
+        now = self.clock()
+        for name in names:
+            self.next_due[name] = now + self.cadences[name]
+
+    def delay(self):
+        """Seconds until the next class is due."""
+        return max(0.0, min(self.next_due.values()) - self.clock())
+
+
+def resolve_cadences(cluster_config, collector_cadences=None, interval=None):
+    """Seconds between refreshes per data class for one cluster.
+
+    A class uses the cluster's ``cadences`` entry, then ``collector.cadences``,
+    then the cluster's ``refreshInterval``, then the collector interval.
+    """
+    base = cluster_config.get("refreshInterval", interval or DEFAULT_COLLECTOR_INTERVAL)
+    cluster_cadences = cluster_config.get("cadences") or {}
+    collector_cadences = collector_cadences or {}
+    return {
+        name: cluster_cadences.get(name, collector_cadences.get(name, base))
+        for name in DATA_CLASSES
+    }
+
+
+class ClusterCollector:
+    """Refresh every watched cluster on its own schedule on the shared runtime.
+
+    Each cluster runs an independent loop and publishes its processed data,
+    index status and XDCR status into a shared ClusterSnapshot. Within a
+    cluster every data class (see DATA_CLASSES) has its own cadence, so rarely
+    changing bucket details aren't re-fetched as often as /pools/default. The
+    API routes serve that snapshot, so upstream load no longer depends on the
+    number of connected viewers.
+    """
+
+    def __init__(
+        self,
+        clusters,
+        interval=DEFAULT_COLLECTOR_INTERVAL,
+        pools_mode=DEFAULT_POOLS_MODE,
+        wait_change=DEFAULT_WAIT_CHANGE_MS,
+        timeseries_retention=DEFAULT_TIMESERIES_RETENTION,
+        cadences=None,
+    ):
+        self.clusters = list(clusters)
+        self.interval = interval
+        self.cadences = dict(cadences or {})
+        self.pools_mode = pools_mode
+        self.wait_change = wait_change
+        self.timeseries = TimeSeriesStore(timeseries_retention)
+        self.last_good = LastGoodClusters()
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._entries = {}
+        self._ready = threading.Event()
+        # Distinguishes this collector's versions from a previous run's
+        self.epoch = format(time.time_ns(), "x")
+        self._snapshot = ClusterSnapshot(0, None, [], [], [], f"{self.epoch}-0")
+        self._history = deque(maxlen=DELTA_HISTORY_SIZE)
+        self._future = None
+        self._task = None
+        self._session = None
+        self._loops = {}
+
+        self._seed_unwatched()
+        if self._entries:
+            self._rebuild_snapshot()
+        self._update_ready()
+
+    def _seed_unwatched(self):
+        # Unwatched clusters never refresh, so seed their placeholders now
+        for cluster in self.clusters:
+            if not cluster.get("watch", True):
+                self._entries[cluster["host"]] = {
+                    "cluster": process_cluster_data(
+                        [
+                            {
+                                "host": cluster["host"],
+                                "customName": cluster.get("customName"),
+                                "data": None,
+                                "error": None,
+                                "not_watching": True,
+                            }
+                        ]
+                    )[0],
+                    "index": None,
+                    "xdcr": None,
+                }
+
+    @property
+    def snapshot(self):
+        """Return the most recently published snapshot."""
+        return self._snapshot
+
+    def snapshot_for(self, tag):
+        """Return the recent snapshot published as ``tag``, or None if aged out."""
+        for snapshot in tuple(self._history):
+            if snapshot.tag == tag:
+                return snapshot
+        return None
+
+    def wait_for_snapshot(self, timeout=COLLECTOR_READY_TIMEOUT):
+        """Block until every watched cluster has been collected once (or timeout)."""
+        self._ready.wait(timeout)
+        return self._snapshot
+
+    def iter_clusters(self, timeout=COLLECTOR_READY_TIMEOUT):
+        """Yield ``(index, cluster_info)`` for every cluster as soon as it is ready.
+
+        Clusters already in the snapshot are yielded immediately; the rest are
+        yielded as their first collection completes. Clusters still missing
+        after ``timeout`` get a placeholder so callers always see every index.
+        """
+        deadline = time.monotonic() + timeout
+        sent = set()
+        while len(sent) < len(self.clusters):
+            with self._changed:
+                ready = [
+                    (index, self._entries[cluster["host"]]["cluster"])
+                    for index, cluster in enumerate(self.clusters)
+                    if index not in sent and cluster["host"] in self._entries
+                ]
+                remaining = deadline - time.monotonic()
+                if not ready and remaining > 0:
+                    self._changed.wait(remaining)
+                    continue
+            if not ready:
+                break
+            for index, cluster_info in ready:
+                sent.add(index)
+                yield index, cluster_info
+
+        for index, cluster in enumerate(self.clusters):
+            if index not in sent:
+                yield index, process_cluster_data(
+                    [
+                        {
+                            "host": cluster["host"],
+                            "customName": cluster.get("customName"),
+                            "data": None,
+                            "error": "No data collected yet",
+                        }
+                    ]
+                )[0]
+
+    def is_running(self):
+        return self._future is not None and not self._future.done()
+
+    def start(self):
+        """Start one refresh loop per watched cluster on the shared runtime."""
+        if self.is_running():
+            return
+        self._future = get_runtime().submit(self._run())
+
+    def stop(self, timeout=5):
+        """Cancel all refresh loops and wait for them to exit."""
+        if not self.is_running():
+            return
+        try:
+            get_runtime().run(self._cancel(), timeout)
+        except Exception as e:
+            if logger:
+                logger.warning(f"Error stopping collector: {str(e)}")
+
+    async def _cancel(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    async def _run(self):
+        self._task = asyncio.current_task()
+        self._session = get_http_session()
+        self._sync_loops()
+        try:
+            # Refresh loops are separate tasks so clusters can come and go
+            await asyncio.get_running_loop().create_future()
+        finally:
+            loops = list(self._loops.values())
+            self._loops = {}
+            for task in loops:
+                task.cancel()
+            await asyncio.gather(*loops, return_exceptions=True)
+
+    def _sync_loops(self):
+        """Start a refresh loop for every watched cluster that lacks one."""
+        for cluster in self.clusters:
+            if cluster.get("watch", True) and cluster["host"] not in self._loops:
+                self._loops[cluster["host"]] = asyncio.ensure_future(
+                    self._refresh_forever(self._session, cluster)
+                )
+
+    def reconfigure(self, clusters, collector_config=None, timeout=5):
+        """Apply a reloaded cluster list (and collector settings) in place.
+
+        Runs on the runtime loop, so the snapshot and refresh loops switch over
+        in one step: removed clusters disappear, added ones start refreshing,
+        and changed ones restart with their new settings while still showing
+        their last data.
+        """
+        get_runtime().run(self._reconfigure(clusters, collector_config), timeout)
+
+    async def _reconfigure(self, clusters, collector_config=None):
+        collector_config = collector_config or {}
+        settings = (
+            collector_config.get("interval", DEFAULT_COLLECTOR_INTERVAL),
+            collector_config.get("poolsMode", DEFAULT_POOLS_MODE),
+            collector_config.get("waitChange", DEFAULT_WAIT_CHANGE_MS),
+            dict(collector_config.get("cadences") or {}),
+        )
+        restart_all = settings != (
+            self.interval,
+            self.pools_mode,
+            self.wait_change,
+            self.cadences,
+        )
+        self.interval, self.pools_mode, self.wait_change, self.cadences = settings
+
+        old = {cluster["host"]: cluster for cluster in self.clusters}
+        new = {cluster["host"]: cluster for cluster in clusters}
+        with self._lock:
+            self.clusters = list(clusters)
+            for host in list(self._entries):
+                if host not in new:
+                    del self._entries[host]
+            self._seed_unwatched()
+            self._rebuild_snapshot()
+            self._changed.notify_all()
+        self._update_ready()
+
+        stopped = []
+        for host in list(self._loops):
+            if restart_all or new.get(host) != old.get(host):
+                stopped.append(self._loops.pop(host))
+                stopped[-1].cancel()
+            if host not in new:
+                self.timeseries.drop(host)
+                self.last_good.drop(host)
+        await asyncio.gather(*stopped, return_exceptions=True)
+        if self._task is not None and not self._task.done():
+            self._sync_loops()
+
+    def schedule_for(self, cluster_config):
+        """Return a fresh RefreshSchedule with the cluster's cadences."""
+        return RefreshSchedule(
+            resolve_cadences(cluster_config, self.cadences, self.interval)
+        )
+
+    async def _refresh_forever(self, session, cluster_config):
+        schedule = self.schedule_for(cluster_config)
+        watcher = None
+        watcher_task = None
+        if cluster_config.get("poolsMode", self.pools_mode) == "longpoll":
+            watcher = PoolsWatcher(cluster_config, self.wait_change)
+            watcher_task = asyncio.ensure_future(
+                watcher.run(session, schedule.cadences["pools"])
+            )
+        try:
+            while True:
+                try:
+                    await self.collect_cluster(
+                        session, cluster_config, watcher, schedule
+                    )
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    if logger:
+                        logger.error(
+                            f"Collector error for {cluster_config['host']}: {str(e)}"
+                        )
+                await asyncio.sleep(schedule.delay())
+        finally:
+            if watcher_task is not None:
+                watcher_task.cancel()
+
+    async def collect_cluster(
+        self, session, cluster_config, watcher=None, schedule=None
+    ):
+        """Refresh the due data classes of one cluster and publish a new snapshot.
+
+        Classes that aren't due are taken from ``schedule.results``. Without a
+        ``schedule`` everything is fetched.
+        """
+        if schedule is None:
+            schedule = self.schedule_for(cluster_config)
+        host = cluster_config["host"]
+        cached = schedule.results
+        due = schedule.take_due()
+
+        if "pools" in due:
+            pools_result = await watcher.current() if watcher is not None else None
+            if pools_result is None:
+                pools_result = await fetch_pools_result(session, cluster_config)
+        else:
+            pools_result = cached.get("pools")
+        # A long-poll that hasn't answered since the last tick hands back the
+        # very same document: its processed record is reused, not rebuilt. A
+        # new document is always processed, even with an unchanged etag, since
+        # the etag doesn't cover systemStats, memory or disk figures.
+        pools_unchanged = (
+            "pools" in due
+            and pools_result is cached.get("pools")
+            and bool((pools_result or {}).get("data"))
+            and bool((cached.get("cluster") or {}).get("data"))
+        )
+
+        # A bucket that appeared since the last tick needs details and stats now
+        bucket_kinds = {"buckets", "stats"} & due
+        bucket_names = pools_bucket_names(pools_result)
+        if bucket_names != cached.get("bucket_names"):
+            bucket_kinds = {"buckets", "stats"}
+            schedule.mark_refreshed(*bucket_kinds)
+
+        fetches = {}
+        if (
+            ("pools" in due and not pools_unchanged)
+            or bucket_kinds
+            or ("cluster" not in cached)
+        ):
+            fetches["cluster"] = fetch_cluster_pipeline(
+                session, cluster_config, pools_result, tuple(sorted(bucket_kinds))
+            )
+        if "index" in due:
+            fetches["index"] = fetch_index_status(
+                session, host, cluster_config["user"], cluster_config["pass"]
+            )
+        if "xdcr" in due:
+            fetches["xdcr"] = fetch_xdcr_data(
+                session, host, cluster_config["user"], cluster_config["pass"]
+            )
+        results = dict(
+            zip(
+                fetches,
+                await asyncio.gather(*fetches.values(), return_exceptions=True),
+            )
+        )
+
+        if "cluster" in results:
+            cluster_result = results["cluster"]
+            if isinstance(cluster_result, Exception):
+                cluster_result = {
+                    "host": host,
+                    "customName": cluster_config.get("customName"),
+                    "data": None,
+                    "error": str(cluster_result),
+                    "buckets": [],
+                    "bucket_stats": [],
+                }
+            # Only freshly fetched data goes into the time-series store
+            self.timeseries.record_cluster(
+                {
+                    "host": host,
+                    "data": cluster_result["data"] if "pools" in due else None,
+                    "bucket_stats": cluster_result["bucket_stats"],
+                }
+            )
+            previous = cached.get("cluster")
+            if previous is not None and cluster_result["data"]:
+                for kind, key in (("buckets", "buckets"), ("stats", "bucket_stats")):
+                    if kind not in bucket_kinds:
+                        cluster_result[key] = previous[key]
+            cached["cluster"] = cluster_result
+            cached["pools"] = pools_result
+            cached["bucket_names"] = bucket_names
+        if "index" in results:
+            cached["index"] = build_index_status_entry(cluster_config, results["index"])
+        if "xdcr" in results:
+            xdcr_entry = build_xdcr_status_entry(cluster_config, results["xdcr"])
+            throughput = self.timeseries.record_xdcr(
+                host,
+                xdcr_entry["xdcrTasks"],
+                cached["cluster"]["bucket_stats"],
+            )
+            xdcr_entry["xdcrTasks"] = [
+                (
+                    dict(task, throughput=throughput[task["id"]])
+                    if task.get("id") in throughput
+                    else task
+                )
+                for task in xdcr_entry["xdcrTasks"]
+            ]
+            cached["xdcr"] = xdcr_entry
+
+        if "cluster" in results:
+            if pools_unchanged and cached["cluster"]["data"]:
+                cached["processed"] = cached["processed"].refreshed(
+                    cached["cluster"], bucket_kinds
+                )
+            else:
+                cached["processed"] = process_cluster_data([cached["cluster"]])[0]
+
+        self.publish(
+            host,
+            self.last_good.apply(cached["processed"]),
+            cached.get("index"),
+            cached.get("xdcr"),
+        )
+
+    def publish(self, host, cluster_info, index_entry, xdcr_entry):
+        """Replace one cluster's entry and swap in a new snapshot.
+
+        An entry identical to the current one doesn't bump the version, so
+        clients holding that version keep getting 304s.
+        """
+        entry = {"cluster": cluster_info, "index": index_entry, "xdcr": xdcr_entry}
+        with self._lock:
+            if all(c["host"] != host for c in self.clusters):
+                return  # removed by a config reload while it was refreshing
+            if self._entries.get(host) != entry:
+                self._entries[host] = entry
+                self._rebuild_snapshot()
+            self._changed.notify_all()
+        self._update_ready()
+
+    def _rebuild_snapshot(self):
+        # Keep config order so card positions in the UI stay stable
+        entries = [
+            self._entries[c["host"]]
+            for c in self.clusters
+            if c["host"] in self._entries
+        ]
+        version = self._snapshot.version + 1
+        self._snapshot = ClusterSnapshot(
+            version,
+            time.time(),
+            [e["cluster"] for e in entries],
+            [e["index"] for e in entries if e["index"] is not None],
+            [e["xdcr"] for e in entries if e["xdcr"] is not None],
+            f"{self.epoch}-{version}",
+        )
+        self._history.append(self._snapshot)
+
+    def _update_ready(self):
+        if all(c["host"] in self._entries for c in self.clusters):
+            self._ready.set()
+
+
+def start_collector(clusters, collector_config=None):
+    """Create and start the global background collector."""
+    global collector
+    collector_config = collector_config or {}
+    stop_collector()
+    collector = ClusterCollector(
+        clusters,
+        interval=collector_config.get("interval", DEFAULT_COLLECTOR_INTERVAL),
+        pools_mode=collector_config.get("poolsMode", DEFAULT_POOLS_MODE),
+        wait_change=collector_config.get("waitChange", DEFAULT_WAIT_CHANGE_MS),
+        timeseries_retention=int(
+            collector_config.get("timeseriesRetention", DEFAULT_TIMESERIES_RETENTION)
+        ),
+        cadences=collector_config.get("cadences"),
+    )
+    collector.start()
+    if logger:
+        logger.info(
+            f"Background collector started for {len(clusters)} cluster(s) "
+            f"(interval={collector.interval}s)"
+        )
+    return collector
+
+
+def stop_collector():
+    """Stop the global background collector if it is running."""
+    global collector
+    if collector is not None:
+        collector.stop()
+        collector = None
+
+
+def apply_config_change(config_data):
+    """Apply a reloaded config.json to the background collector without a restart."""
+    collector_config = config_data.get("collector", {})
+    if not collector_config.get("enabled", True):
+        stop_collector()
+    elif collector is not None and collector.is_running():
+        collector.reconfigure(config_data["clusters"], collector_config)
+    elif config_data["clusters"]:
+        start_collector(config_data["clusters"], collector_config)
+
+
+async def watch_config(interval=CONFIG_CHECK_INTERVAL):
+    """Check config.json for changes every ``interval`` seconds on the runtime."""
+    loop = asyncio.get_running_loop()
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            # Off the loop thread: a reload may block on runtime.run()
+            await loop.run_in_executor(None, config_store.clusters)
+        except Exception as e:
+            if logger:
+                logger.error(f"Error checking config.json: {str(e)}")
+
+
+def reload_config_on_signal(signum, frame):
+    """SIGHUP handler: force a config.json reload in the background."""
+    threading.Thread(
+        target=config_store.clusters, kwargs={"force": True}, daemon=True
+    ).start()
+
+
+def shutdown():
+    """Stop background work and release pooled connections on exit."""
+    stop_collector()
+    stop_runtime()
+
+
+atexit.register(shutdown)
+
+
+def compress_body(body, encoding):
+    """Compress ``body`` with ``encoding`` ("br" or "gzip")."""
+    with server_timing("compress"):
+        if encoding == "br":
+            return brotli.compress(body, quality=BROTLI_QUALITY)
+        return gzip.compress(body, compresslevel=GZIP_LEVEL)
+
+
+@contextlib.contextmanager
+def server_timing(name):
+    """Add the time spent in the block to the request's Server-Timing ``name``.
+
+    Outside a request (e.g. on the collector thread) this does nothing.
+    """
+    if not has_request_context():
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings = g.setdefault("server_timing", {})
+        timings[name] = timings.get(name, 0.0) + time.perf_counter() - started
+
+
+@app.before_request
+def start_server_timing():
+    g.request_started = time.perf_counter()
+
+
+@app.after_request
+def add_server_timing(response):
+    """Break /api/* time down into fetch, process, serialize and compress.
+
+    Registered before compress_api_response so it runs after it and the
+    compression time is included.
+    """
+    if not request.path.startswith("/api/") or "request_started" not in g:
+        return response
+    timings = dict(g.get("server_timing", {}))
+    timings["total"] = time.perf_counter() - g.request_started
+    response.headers["Server-Timing"] = format_server_timing(timings)
+    return response
+
+
+def format_server_timing(timings):
+    """Render ``{name: seconds}`` as a Server-Timing header value."""
+    return ", ".join(
+        f"{name};dur={seconds * 1000:.2f}" for name, seconds in timings.items()
+    )
+
+
+def negotiate_encoding():
+    """Pick the best content-encoding the client accepts: br, gzip or identity."""
+    compression_config = (config or {}).get("compression", {})
+    if not compression_config.get("enabled", True):
+        return "identity"
+    offers = ["br", "gzip"] if brotli is not None else ["gzip"]
+    return request.accept_encodings.best_match(offers) or "identity"
+
+
+class ResponseCache:
+    """Small LRU of encoded response bodies keyed by (snapshot key, encoding).
+
+    Snapshot-backed routes serialize and compress a given snapshot version
+    once; every other viewer of that version gets the cached bytes.
+    """
+
+    def __init__(self, max_entries=RESPONSE_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, encoding):
+        with self._lock:
+            body = self._entries.get((key, encoding))
+            if body is not None:
+                self._entries.move_to_end((key, encoding))
+            return body
+
+    def put(self, key, encoding, body):
+        with self._lock:
+            self._entries[(key, encoding)] = body
+            self._entries.move_to_end((key, encoding))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+response_cache = ResponseCache()
+
+
+def snapshot_json_response(cache_key, build_body):
+    """Serve JSON derived from a snapshot, cached per key and content-encoding.
+
+    ``cache_key`` must change whenever the body would (it doubles as the
+    ETag); ``build_body`` is only called on a cache miss.
+    """
+
+    def build_raw():
+        with server_timing("process"):
+            body = build_body()
+        return jsonify(body).get_data()
+
+    return snapshot_response(cache_key, build_raw, "application/json")
+
+
+def snapshot_response(cache_key, build_raw, mimetype):
+    """Like snapshot_json_response, for a ``build_raw`` that returns the body bytes."""
+    encoding = negotiate_encoding()
+    body = response_cache.get(cache_key, encoding)
+    if body is None:
+        raw = response_cache.get(cache_key, "identity")
+        if raw is None:
+            raw = build_raw()
+            response_cache.put(cache_key, "identity", raw)
+        min_size = (
+            (config or {})
+            .get("compression", {})
+            .get("minSize", DEFAULT_COMPRESSION_MIN_SIZE)
+        )
+        if encoding != "identity" and len(raw) < min_size:
+            encoding = "identity"
+        body = raw if encoding == "identity" else compress_body(raw, encoding)
+        response_cache.put(cache_key, encoding, body)
+
+    response = Response(body, mimetype=mimetype)
+    response.vary.add("Accept-Encoding")
+    if encoding != "identity":
+        response.headers["Content-Encoding"] = encoding
+    # Weak so one validator covers every encoding of the same snapshot
+    response.set_etag(cache_key, weak=encoding != "identity")
+    return response.make_conditional(request)
+
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# name -> (type, help); samples are written in this order
+PROMETHEUS_FAMILIES = {
+    "couchbase_cluster_watched": (
+        "gauge",
+        "1 if the dashboard watches the cluster, 0 otherwise.",
+    ),
+    "couchbase_cluster_up": (
+        "gauge",
+        "1 if the last refresh of /pools/default succeeded.",
+    ),
+    "couchbase_cluster_stale": (
+        "gauge",
+        "1 if the cluster is served from the last good refresh.",
+    ),
+    "couchbase_cluster_healthy": ("gauge", "1 if every node reports healthy."),
+    "couchbase_cluster_memory_total_bytes": ("gauge", "Total cluster RAM."),
+    "couchbase_cluster_memory_used_bytes": ("gauge", "Used cluster RAM."),
+    "couchbase_cluster_memory_quota_total_bytes": (
+        "gauge",
+        "RAM quota across all nodes.",
+    ),
+    "couchbase_cluster_disk_total_bytes": ("gauge", "Total cluster disk."),
+    "couchbase_cluster_disk_used_bytes": ("gauge", "Used cluster disk."),
+    "couchbase_cluster_disk_free_bytes": ("gauge", "Free cluster disk."),
+    "couchbase_node_status": (
+        "gauge",
+        "1 for the status the node currently reports.",
+    ),
+    "couchbase_node_cpu_utilization_percent": ("gauge", "Node CPU utilization."),
+    "couchbase_node_memory_total_bytes": ("gauge", "Node RAM."),
+    "couchbase_node_memory_free_bytes": ("gauge", "Free node RAM."),
+    "couchbase_bucket_quota_percent_used": ("gauge", "Bucket RAM quota used."),
+    "couchbase_bucket_ops_per_second": ("gauge", "Bucket operations per second."),
+    "couchbase_bucket_disk_fetches": ("gauge", "Bucket disk fetches per second."),
+}
+
+
+def prometheus_labels(labels):
+    """Render a label set, escaping values as the text format requires."""
+    return ",".join(
+        '{}="{}"'.format(
+            name,
+            str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"),
+        )
+        for name, value in labels.items()
+    )
+
+
+def prometheus_value(value):
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if not is_number(value):
+        return "NaN"
+    return str(value) if isinstance(value, int) else repr(float(value))
+
+
+class PrometheusExporter:
+    """Render the collector snapshot in the Prometheus text exposition format.
+
+    Each cluster's samples are rendered once per published entry and reused
+    until that cluster's entry changes, so a scrape only formats clusters that
+    refreshed since the last one and never calls upstream.
+    """
+
+    def __init__(self):
+        self._fragments = {}
+        self._lock = threading.Lock()
+
+    def render(self, clusters):
+        """Return the exposition body for a sequence of processed clusters."""
+        with self._lock:
+            fragments = [self._fragment(cluster) for cluster in clusters]
+            hosts = {cluster["host"] for cluster in clusters}
+            for host in [host for host in self._fragments if host not in hosts]:
+                del self._fragments[host]
+
+        lines = []
+        for name, (kind, help_text) in PROMETHEUS_FAMILIES.items():
+            samples = [line for fragment in fragments for line in fragment[name]]
+            if samples:
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} {kind}")
+                lines.extend(samples)
+        return ("\n".join(lines) + "\n").encode("utf-8") if lines else b""
+
+    def _fragment(self, cluster):
+        cached = self._fragments.get(cluster["host"])
+        # Unchanged entries keep their identity across snapshots
+        if cached is not None and cached[0] is cluster:
+            return cached[1]
+        fragment = self._render_cluster(cluster)
+        self._fragments[cluster["host"]] = (cluster, fragment)
+        return fragment
+
+    def _render_cluster(self, cluster):
+        fragment = {name: [] for name in PROMETHEUS_FAMILIES}
+
+        def sample(name, labels, value):
+            fragment[name].append(
+                f"{name}{{{prometheus_labels(labels)}}} {prometheus_value(value)}"
+            )
+
+        base = {
+            "cluster": cluster["host"],
+            "cluster_name": cluster.get("customName")
+            or cluster.get("clusterName")
+            or cluster["host"],
+        }
+        watched = not cluster.get("not_watching", False)
+        sample("couchbase_cluster_watched", base, watched)
+        if not watched:
+            return fragment
+
+        sample("couchbase_cluster_up", base, not cluster.get("error"))
+        sample("couchbase_cluster_stale", base, bool(cluster.get("stale")))
+        if cluster.get("error"):
+            return fragment
+        sample("couchbase_cluster_healthy", base, bool(cluster.get("health")))
+        memory = cluster.get("memory") or {}
+        disk = cluster.get("disk") or {}
+        # process_cluster_data reports sizes in GiB
+        for name, section, key in (
+            ("couchbase_cluster_memory_total_bytes", memory, "total"),
+            ("couchbase_cluster_memory_used_bytes", memory, "used"),
+            ("couchbase_cluster_memory_quota_total_bytes", memory, "quotaTotal"),
+            ("couchbase_cluster_disk_total_bytes", disk, "total"),
+            ("couchbase_cluster_disk_used_bytes", disk, "used"),
+            ("couchbase_cluster_disk_free_bytes", disk, "free"),
+        ):
+            sample(name, base, section.get(key, 0) * GIB)
+
+        for node in cluster.get("nodes") or []:
+            labels = dict(base, node=node.get("hostname", "Unknown"))
+            sample(
+                "couchbase_node_status",
+                dict(labels, status=node.get("status", "Unknown")),
+                1,
+            )
+            sample(
+                "couchbase_node_cpu_utilization_percent",
+                labels,
+                node.get("cpu_utilization"),
+            )
+            sample(
+                "couchbase_node_memory_total_bytes",
+                labels,
+                node.get("memory_total", 0) * GIB,
+            )
+            sample(
+                "couchbase_node_memory_free_bytes",
+                labels,
+                node.get("memory_free", 0) * GIB,
+            )
+
+        for bucket in cluster.get("buckets") or []:
+            if bucket.get("error") and not bucket.get("stale"):
+                continue
+            labels = dict(base, bucket=bucket["name"])
+            sample(
+                "couchbase_bucket_quota_percent_used",
+                labels,
+                bucket.get("quotaPercentUsed"),
+            )
+            sample("couchbase_bucket_ops_per_second", labels, bucket.get("opsPerSec"))
+            sample("couchbase_bucket_disk_fetches", labels, bucket.get("diskFetches"))
+        return fragment
+
+
+prometheus_exporter = PrometheusExporter()
+
+
+@app.after_request
+def compress_api_response(response):
+    """Compress uncached /api/* JSON responses for clients that accept it."""
+    if (
+        not request.path.startswith("/api/")
+        or response.direct_passthrough
+        or response.is_streamed
+        or response.status_code < 200
+        or response.status_code in (204, 304)
+        or "Content-Encoding" in response.headers
+        or response.mimetype != "application/json"
+    ):
+        return response
+
+    response.vary.add("Accept-Encoding")
+    encoding = negotiate_encoding()
+    body = response.get_data()
+    min_size = (
+        (config or {})
+        .get("compression", {})
+        .get("minSize", DEFAULT_COMPRESSION_MIN_SIZE)
+    )
+    if encoding == "identity" or len(body) < min_size:
+        return response
+
+    response.set_data(compress_body(body, encoding))
+    response.headers["Content-Encoding"] = encoding
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(etag, weak=True)
+    return response
+
+
+@app.route("/")
+def index():
+    return render_template("index.html", version=__version__)
+
+
+@app.route("/api/clusters")
+def get_clusters_data():
+    """Return processed data for every cluster.
+
+    Responses carry an ETag and honour If-None-Match with a 304. When served
+    from the collector, ``?since=<version>`` returns only what changed since
+    that version (see build_clusters_delta). ``?samples=columnar`` sends
+    bucket stats samples as compact float32 columns (encode_samples_columnar).
+    """
     # Ensure logger is initialized
     if logger is None:
         initialize_app()
 
+    # Serve the background collector's snapshot straight from memory
+    if collector is not None and collector.is_running():
+        snapshot = collector.wait_for_snapshot()
+        if not snapshot.clusters:
+            return jsonify({"error": "No clusters configured"}), 500
+        since = request.args.get("since")
+        since_snapshot = None if since is None else collector.snapshot_for(since)
+        columnar = requested_samples_encoding() == "columnar"
+        if since is None:
+            etag = snapshot.tag
+        else:
+            # Only known tags reach the ETag: unknown or malformed versions all
+            # share one full-payload entry instead of one cache entry each
+            known = since_snapshot.tag if since_snapshot is not None else "unknown"
+            etag = f"{snapshot.tag}-since-{known}"
+        if columnar:
+            etag = f"{etag}-columnar"
+
+        if since is None and not columnar:
+            return snapshot_response(
+                etag,
+                lambda: encode_cluster_list(snapshot.clusters),
+                "application/json",
+            )
+
+        def build_body():
+            if since is not None:
+                body = build_clusters_delta(since_snapshot, snapshot)
+            else:
+                body = list(snapshot.clusters)
+            return encode_clusters_payload(body) if columnar else body
+
+        return snapshot_json_response(etag, build_body)
+
     # Load cluster configurations
-    clusters_config = load_config()
+    clusters_config = config_store.clusters()
     if not clusters_config:
         return jsonify({"error": "No clusters configured"}), 500
 
-    # Run asynchronous data fetching
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    clusters_data = loop.run_until_complete(get_all_clusters_data(clusters_config))
-    loop.close()
+    # Run asynchronous data fetching on the shared runtime loop
+    clusters_data = run_async(
+        get_all_clusters_data(clusters_config, session=get_http_session())
+    )
 
     # Process data for JSON response
-    clusters = process_cluster_data(clusters_data)
-    return jsonify(clusters)
+    with server_timing("process"):
+        clusters = [
+            last_good_clusters.apply(cluster_info)
+            for cluster_info in process_cluster_data(clusters_data)
+        ]
+        if requested_samples_encoding() == "columnar":
+            clusters = encode_clusters_payload(clusters)
+    response = jsonify(clusters)
+    response.add_etag()
+    return response.make_conditional(request)
+
+
+def iter_processed_clusters(clusters_config):
+    """Run every cluster pipeline on the shared runtime and yield results as they land.
+
+    Yields ``(index, cluster_info)`` in completion order, so the fastest
+    cluster is available first regardless of config order.
+    """
+    results = queue.Queue()
+
+    async def run_pipeline(index, cluster_config, session):
+        try:
+            result = await fetch_cluster_pipeline(session, cluster_config)
+        except Exception as e:
+            result = {
+                "host": cluster_config["host"],
+                "customName": cluster_config.get("customName"),
+                "data": None,
+                "error": str(e),
+                "buckets": [],
+                "bucket_stats": [],
+            }
+        results.put((index, result))
+
+    async def run_all():
+        session = get_http_session()
+        await asyncio.gather(
+            *(
+                run_pipeline(index, cluster_config, session)
+                for index, cluster_config in enumerate(clusters_config)
+            )
+        )
+
+    get_runtime().submit(run_all())
+    for _ in clusters_config:
+        try:
+            index, result = results.get(timeout=STREAM_RESULT_TIMEOUT)
+        except queue.Empty:
+            if logger:
+                logger.warning("Timed out waiting for streamed cluster results")
+            return
+        # Process in the request thread to keep the event loop free for I/O
+        yield index, last_good_clusters.apply(process_cluster_data([result])[0])
+
+
+@app.route("/api/clusters/stream")
+def stream_clusters_data():
+    """Stream processed clusters as NDJSON, one line per cluster as it completes."""
+    # Ensure logger is initialized
+    if logger is None:
+        initialize_app()
+
+    if collector is not None and collector.is_running():
+        total = len(collector.clusters)
+        cluster_results = collector.iter_clusters()
+    else:
+        clusters_config = config_store.clusters()
+        total = len(clusters_config)
+        cluster_results = iter_processed_clusters(clusters_config)
+
+    if not total:
+        return jsonify({"error": "No clusters configured"}), 500
+
+    columnar = requested_samples_encoding() == "columnar"
+
+    def generate():
+        for index, cluster_info in cluster_results:
+            if columnar:
+                cluster_info = encode_cluster_samples(cluster_info)
+            yield json_codec.dumps(
+                {"index": index, "total": total, "cluster": cluster_info}
+            ) + b"\n"
+
+    return Response(stream_with_context(generate()), mimetype="application/x-ndjson")
+
+
+async def fetch_detailed_bucket_stats(session, cluster, bucket_name):
+    """Fetch current bucket stats and bucket details together."""
+    stats_result, bucket_result = await asyncio.gather(
+        fetch_bucket_stats(
+            session, cluster["host"], bucket_name, cluster["user"], cluster["pass"]
+        ),
+        fetch_bucket_data(
+            session, cluster["host"], bucket_name, cluster["user"], cluster["pass"]
+        ),
+    )
+    return {"stats": stats_result, "bucket": bucket_result}
 
 
 @app.route("/api/bucket/<cluster_host>/<bucket_name>/stats")
@@ -788,110 +3804,389 @@ def get_bucket_stats(cluster_host, bucket_name):
         if logger is None:
             initialize_app()
 
-        clusters = load_config()
+        clusters = config_store.clusters()
         cluster = find_cluster_by_host(clusters, cluster_host)
         if not cluster:
             return jsonify({"error": "Cluster not found"}), 404
 
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-
-        async def fetch_detailed_stats():
-            async with aiohttp.ClientSession() as session:
-                # Fetch current bucket stats
-                stats_result = await fetch_bucket_stats(
-                    session,
-                    cluster["host"],
-                    bucket_name,
-                    cluster["user"],
-                    cluster["pass"],
-                )
-                # Fetch bucket details
-                bucket_result = await fetch_bucket_data(
-                    session,
-                    cluster["host"],
-                    bucket_name,
-                    cluster["user"],
-                    cluster["pass"],
-                )
-                return {"stats": stats_result, "bucket": bucket_result}
-
-        result = loop.run_until_complete(fetch_detailed_stats())
-        loop.close()
+        result = run_async(
+            fetch_detailed_bucket_stats(get_http_session(), cluster, bucket_name)
+        )
         return jsonify(result)
     except Exception as e:
         logger.error(f"Error in get_bucket_stats: {str(e)}")
         return jsonify({"error": str(e)}), 500
 
 
+@app.route("/api/timeseries/<cluster_host>/<kind>/<path:name>")
+def get_timeseries(cluster_host, kind, name):
+    """Return stored history for a bucket, node or replication in ``op.samples`` shape.
+
+    ``kind`` is ``bucket``, ``node`` or ``xdcr``; ``?since=<ms>`` returns only newer
+    points so charts can append instead of re-downloading the whole window.
+    """
+    if kind not in ("bucket", "node", "xdcr"):
+        return jsonify({"error": "Unknown series kind"}), 404
+    if collector is None or not collector.is_running():
+        return jsonify({"error": "Time-series history requires the collector"}), 503
+
+    cluster = find_cluster_by_host(collector.clusters, cluster_host)
+    if not cluster:
+        return jsonify({"error": "Cluster not found"}), 404
+
+    since = request.args.get("since", type=float)
+    samples = collector.timeseries.series(cluster["host"], kind, name, since)
+    if samples is None:
+        return jsonify({"error": "No history recorded"}), 404
+    return jsonify(
+        {
+            "host": cluster["host"],
+            "name": name,
+            "retention": collector.timeseries.retention,
+            "samples": samples,
+        }
+    )
+
+
+class IndexStatusCache:
+    """Per-cluster /indexStatus results reused for ``ttl`` seconds.
+
+    Serves the on-demand /api/indexStatus route (the collector keeps its own
+    copy). Concurrent requests for the same cluster share one upstream call.
+    Only use from the event loop thread.
+    """
+
+    def __init__(self, ttl=DEFAULT_INDEX_CACHE_TTL, clock=time.monotonic):
+        self.ttl = ttl
+        self.clock = clock
+        self._entries = {}
+
+    async def get(self, session, cluster):
+        host = cluster["host"]
+        entry = self._entries.get(host)
+        if entry is None or (
+            entry["expires"] is not None and entry["expires"] <= self.clock()
+        ):
+            entry = {"expires": None}
+            entry["task"] = asyncio.ensure_future(
+                fetch_index_status(session, host, cluster["user"], cluster["pass"])
+            )
+            entry["task"].add_done_callback(
+                lambda _task, entry=entry: entry.update(expires=self.clock() + self.ttl)
+            )
+            self._entries[host] = entry
+        # A cancelled request must not cancel the fetch other requests share
+        return await asyncio.shield(entry["task"])
+
+    def clear(self):
+        self._entries.clear()
+
+
+index_status_cache = IndexStatusCache()
+
+
+class IndexCatalog:
+    """Searchable view of one cluster's /indexStatus indexes.
+
+    Built once per /indexStatus document: an inverted index maps every value
+    of every facet in INDEX_FACETS to the positions of its indexes, so a
+    query intersects a few sets instead of scanning all indexes per filter.
+    Sort orders are computed on first use and reused.
+    """
+
+    def __init__(self, indexes):
+        self.indexes = list(indexes)
+        self._values = []
+        self._postings = {facet: {} for facet in INDEX_FACETS}
+        self._names = []
+        self._orders = {}
+        for position, index in enumerate(self.indexes):
+            values = {facet: self.facet_values(index, facet) for facet in INDEX_FACETS}
+            for facet, facet_values in values.items():
+                for value in facet_values:
+                    self._postings[facet].setdefault(value, set()).add(position)
+            self._values.append(values)
+            self._names.append(str(index.get("indexName", "")).lower())
+
+    @staticmethod
+    def facet_values(index, facet):
+        """Return an index's values for ``facet`` as strings (hosts may be several)."""
+        if facet == "host":
+            return [str(host) for host in index.get("hosts") or []]
+        value = index.get(facet)
+        return [] if value is None else [str(value)]
+
+    def query(
+        self,
+        filters=None,
+        text=None,
+        sort="indexName",
+        descending=False,
+        offset=0,
+        limit=DEFAULT_INDEX_PAGE_SIZE,
+    ):
+        """Return one page of matching indexes plus per-facet value counts.
+
+        ``filters`` maps facets to the value to match. ``text`` matches index
+        names case-insensitively. Each facet's counts apply every filter but
+        its own, so they list the values that facet could be switched to.
+        """
+        matches = {
+            facet: self._postings[facet].get(str(value), set())
+            for facet, value in (filters or {}).items()
+            if value is not None
+        }
+        if text:
+            needle = text.lower()
+            matches["q"] = {
+                position for position, name in enumerate(self._names) if needle in name
+            }
+
+        facets = {}
+        for facet in INDEX_FACETS:
+            candidates = self._intersect(
+                [positions for name, positions in matches.items() if name != facet]
+            )
+            counts = {}
+            for position in candidates if candidates is not None else self._all():
+                for value in self._values[position][facet]:
+                    counts[value] = counts.get(value, 0) + 1
+            facets[facet] = dict(sorted(counts.items()))
+
+        selected = self._intersect(list(matches.values()))
+        order = self._order(sort)
+        if descending:
+            order = order[::-1]
+        if selected is not None:
+            order = [position for position in order if position in selected]
+        return {
+            "total": len(order),
+            "offset": offset,
+            "limit": limit,
+            "indexes": [self.indexes[p] for p in order[offset : offset + limit]],
+            "facets": facets,
+        }
+
+    def _all(self):
+        return range(len(self.indexes))
+
+    @staticmethod
+    def _intersect(position_sets):
+        if not position_sets:
+            return None
+        position_sets = sorted(position_sets, key=len)
+        return position_sets[0].intersection(*position_sets[1:])
+
+    def _order(self, sort):
+        order = self._orders.get(sort)
+        if order is None:
+            if sort == "indexName":
+                keys = self._names
+            elif sort == "host":
+                keys = [(values["host"] or [""])[0] for values in self._values]
+            else:
+                keys = [str(index.get(sort) or "").lower() for index in self.indexes]
+            order = self._orders[sort] = sorted(
+                self._all(), key=lambda p: (keys[p], self._names[p])
+            )
+        return order
+
+
+class IndexCatalogCache:
+    """Keep the IndexCatalog of each cluster's latest /indexStatus document.
+
+    A catalog is rebuilt only when the cluster's index status entry is a
+    different object, i.e. after the collector or the TTL cache re-fetched it.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._catalogs = {}
+
+    def get(self, entry):
+        with self._lock:
+            cached = self._catalogs.get(entry["host"])
+        if cached is not None and cached[0] is entry["data"]:
+            return cached[1]
+        catalog = IndexCatalog((entry["data"] or {}).get("indexes") or [])
+        with self._lock:
+            self._catalogs[entry["host"]] = (entry["data"], catalog)
+        return catalog
+
+    def clear(self):
+        with self._lock:
+            self._catalogs.clear()
+
+
+index_catalogs = IndexCatalogCache()
+
+
+async def fetch_all_index_status(clusters, session):
+    """Fetch /indexStatus from every watched cluster, through the TTL cache."""
+    watched = [cluster for cluster in clusters if cluster.get("watch", True)]
+    index_results = await asyncio.gather(
+        *(index_status_cache.get(session, cluster) for cluster in watched),
+        return_exceptions=True,
+    )
+
+    results = []
+    for cluster, result in zip(watched, index_results):
+        if isinstance(result, Exception) and logger:
+            logger.error(f"Error fetching index status: {str(result)}")
+        results.append(build_index_status_entry(cluster, result))
+    return results
+
+
+async def fetch_all_xdcr_status(clusters, session):
+    """Fetch remote clusters and XDCR tasks from every watched cluster."""
+    watched = [cluster for cluster in clusters if cluster.get("watch", True)]
+    xdcr_results = await asyncio.gather(
+        *(
+            fetch_xdcr_data(session, cluster["host"], cluster["user"], cluster["pass"])
+            for cluster in watched
+        ),
+        return_exceptions=True,
+    )
+
+    results = []
+    for cluster, result in zip(watched, xdcr_results):
+        if isinstance(result, Exception) and logger:
+            logger.error(f"Error fetching XDCR status: {str(result)}")
+        results.append(build_xdcr_status_entry(cluster, result))
+    return results
+
+
 @app.route("/api/indexStatus")
 def get_index_status():
-    """API endpoint to get index status from all clusters."""
+    """API endpoint to get index status from all clusters.
+
+    ``?host=`` or ``?cluster=`` (host URL, customName or host:port) limits the
+    response, and the upstream queries, to that one cluster.
+    """
     try:
         # Ensure logger is initialized
         if logger is None:
             initialize_app()
 
-        clusters = load_config()
-        if not clusters:
-            return jsonify({"error": "No clusters configured"}), 500
-
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-
-        async def fetch_all_index_status():
-            results = []
-            async with aiohttp.ClientSession() as session:
-                tasks = []
-                for cluster in clusters:
-                    if cluster.get("watch", True):
-                        task = fetch_index_status(
-                            session, cluster["host"], cluster["user"], cluster["pass"]
-                        )
-                        tasks.append(task)
+        selector = request.args.get("host") or request.args.get("cluster")
 
-                index_results = await asyncio.gather(*tasks, return_exceptions=True)
+        if collector is not None and collector.is_running():
+            snapshot = collector.wait_for_snapshot()
+            if selector is None:
+                return snapshot_json_response(
+                    f"{snapshot.tag}-indexStatus", lambda: list(snapshot.index_status)
+                )
+            cluster = find_cluster(collector.clusters, selector)
+            if not cluster:
+                return jsonify({"error": "Cluster not found"}), 404
+            return snapshot_json_response(
+                f"{snapshot.tag}-indexStatus-{cluster['host']}",
+                lambda: [
+                    entry
+                    for entry in snapshot.index_status
+                    if entry["host"] == cluster["host"]
+                ],
+            )
 
-                cluster_index = 0
-                for i, result in enumerate(index_results):
-                    # Find the corresponding cluster that was watched
-                    while cluster_index < len(clusters) and not clusters[
-                        cluster_index
-                    ].get("watch", True):
-                        cluster_index += 1
+        clusters = config_store.clusters()
+        if not clusters:
+            return jsonify({"error": "No clusters configured"}), 500
+        if selector is not None:
+            cluster = find_cluster(clusters, selector)
+            if not cluster:
+                return jsonify({"error": "Cluster not found"}), 404
+            clusters = [cluster]
 
-                    if cluster_index >= len(clusters):
-                        break
+        result = run_async(fetch_all_index_status(clusters, get_http_session()))
+        return jsonify(result)
+    except Exception as e:
+        logger.error(f"Error in get_index_status: {str(e)}")
+        return jsonify({"error": str(e)}), 500
 
-                    if isinstance(result, Exception):
-                        logger.error(f"Error fetching index status: {str(result)}")
-                        results.append(
-                            {
-                                "host": clusters[cluster_index]["host"],
-                                "customName": clusters[cluster_index].get("customName"),
-                                "data": None,
-                                "error": str(result),
-                            }
-                        )
-                    else:
-                        results.append(
-                            {
-                                "host": result["host"],
-                                "customName": clusters[cluster_index].get("customName"),
-                                "data": result["data"],
-                                "error": result["error"],
-                            }
-                        )
 
-                    cluster_index += 1
+@app.route("/api/indexes")
+def get_index_catalog():
+    """One cluster's indexes, filtered, sorted and paginated, with facet counts.
 
-            return results
+    ``?cluster=`` selects the cluster. Facets (``bucket``, ``scope``,
+    ``collection``, ``host``, ``status``, ``numReplica``) and ``q`` (index
+    name substring) filter; ``sort``, ``order``, ``offset`` and ``limit``
+    page through the result.
+    """
+    try:
+        # Ensure logger is initialized
+        if logger is None:
+            initialize_app()
 
-        result = loop.run_until_complete(fetch_all_index_status())
-        loop.close()
-        return jsonify(result)
+        selector = request.args.get("cluster")
+        if not selector:
+            return jsonify({"error": "'cluster' is required"}), 400
+        sort = request.args.get("sort", "indexName")
+        if sort not in INDEX_SORT_KEYS:
+            return (
+                jsonify(
+                    {"error": f"'sort' must be one of: {', '.join(INDEX_SORT_KEYS)}"}
+                ),
+                400,
+            )
+        offset = request.args.get("offset", 0, type=int)
+        limit = request.args.get("limit", DEFAULT_INDEX_PAGE_SIZE, type=int)
+        if offset < 0 or limit < 1:
+            return jsonify({"error": "'offset' and 'limit' must be positive"}), 400
+        limit = min(limit, MAX_INDEX_PAGE_SIZE)
+        filters = {
+            facet: request.args.get(facet)
+            for facet in INDEX_FACETS
+            if request.args.get(facet) is not None
+        }
+        text = request.args.get("q") or None
+        descending = request.args.get("order") == "desc"
+
+        def build_body(entry):
+            page = {"total": 0, "offset": offset, "limit": limit, "indexes": []}
+            page["facets"] = {facet: {} for facet in INDEX_FACETS}
+            if entry is not None and entry["data"] is not None:
+                page = index_catalogs.get(entry).query(
+                    filters, text, sort, descending, offset, limit
+                )
+            page.update(
+                {
+                    "host": cluster["host"],
+                    "customName": cluster.get("customName"),
+                    "error": entry["error"] if entry else "No index data",
+                }
+            )
+            return page
+
+        if collector is not None and collector.is_running():
+            snapshot = collector.wait_for_snapshot()
+            cluster = find_cluster(collector.clusters, selector)
+            if not cluster:
+                return jsonify({"error": "Cluster not found"}), 404
+            entry = next(
+                (e for e in snapshot.index_status if e["host"] == cluster["host"]),
+                None,
+            )
+            # Keyed on the parsed query, so parameter order and unknown
+            # parameters don't multiply cache entries or reach the ETag
+            query = json_codec.dumps(
+                [cluster["host"], filters, text, sort, descending, offset, limit],
+                sort_keys=True,
+            )
+            digest = hashlib.sha1(query).hexdigest()[:16]
+            return snapshot_json_response(
+                f"{snapshot.tag}-indexes-{digest}", lambda: build_body(entry)
+            )
+
+        cluster = find_cluster(config_store.clusters(), selector)
+        if not cluster:
+            return jsonify({"error": "Cluster not found"}), 404
+        entries = run_async(fetch_all_index_status([cluster], get_http_session()))
+        with server_timing("process"):
+            body = build_body(entries[0] if entries else None)
+        return jsonify(body)
     except Exception as e:
-        logger.error(f"Error in get_index_status: {str(e)}")
+        logger.error(f"Error in get_index_catalog: {str(e)}")
         return jsonify({"error": str(e)}), 500
 
 
@@ -903,71 +4198,54 @@ def get_xdcr_status():
         if logger is None:
             initialize_app()
 
-        clusters = load_config()
+        if collector is not None and collector.is_running():
+            snapshot = collector.wait_for_snapshot()
+            return snapshot_json_response(
+                f"{snapshot.tag}-xdcrStatus", lambda: list(snapshot.xdcr_status)
+            )
+
+        clusters = config_store.clusters()
         if not clusters:
             return jsonify({"error": "No clusters configured"}), 500
 
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-
-        async def fetch_all_xdcr_status():
-            results = []
-            async with aiohttp.ClientSession() as session:
-                tasks = []
-                for cluster in clusters:
-                    if cluster.get("watch", True):
-                        task = fetch_xdcr_data(
-                            session, cluster["host"], cluster["user"], cluster["pass"]
-                        )
-                        tasks.append(task)
-
-                xdcr_results = await asyncio.gather(*tasks, return_exceptions=True)
-
-                cluster_index = 0
-                for i, result in enumerate(xdcr_results):
-                    # Find the corresponding cluster that was watched
-                    while cluster_index < len(clusters) and not clusters[
-                        cluster_index
-                    ].get("watch", True):
-                        cluster_index += 1
-
-                    if cluster_index >= len(clusters):
-                        break
-
-                    if isinstance(result, Exception):
-                        logger.error(f"Error fetching XDCR status: {str(result)}")
-                        results.append(
-                            {
-                                "host": clusters[cluster_index]["host"],
-                                "customName": clusters[cluster_index].get("customName"),
-                                "remoteClusters": [],
-                                "xdcrTasks": [],
-                                "error": str(result),
-                            }
-                        )
-                    else:
-                        results.append(
-                            {
-                                "host": result["host"],
-                                "customName": clusters[cluster_index].get("customName"),
-                                "remoteClusters": result.get("remoteClusters", []),
-                                "xdcrTasks": result.get("xdcrTasks", []),
-                                "error": result.get("error"),
-                            }
-                        )
-
-                    cluster_index += 1
-
-            return results
-
-        result = loop.run_until_complete(fetch_all_xdcr_status())
-        loop.close()
+        result = run_async(fetch_all_xdcr_status(clusters, get_http_session()))
         return jsonify(result)
     except Exception as e:
         logger.error(f"Error in get_xdcr_status: {str(e)}")
         return jsonify({"error": str(e)}), 500
 
 
+@app.route("/api/internal/upstream")
+def get_upstream_metrics():
+    """Per-cluster, per-endpoint timing of upstream calls since startup.
+
+    ``?host=<host URL>`` limits the report to one cluster. Each row also
+    carries the endpoint's circuit breaker state.
+    """
+    circuits = upstream_health.states()
+    rows = upstream_metrics.report(request.args.get("host"))
+    for row in rows:
+        row["circuit"] = circuits.get((row["cluster"], row["endpoint"]))
+    return jsonify(rows)
+
+
+@app.route("/metrics")
+def get_metrics():
+    """Prometheus scrape endpoint rendered from the collector snapshot."""
+    if collector is None or not collector.is_running():
+        return Response(
+            "# /metrics requires the background collector\n",
+            status=503,
+            mimetype="text/plain",
+        )
+    snapshot = collector.wait_for_snapshot()
+    return snapshot_response(
+        f"{snapshot.tag}-metrics",
+        lambda: prometheus_exporter.render(snapshot.clusters),
+        PROMETHEUS_CONTENT_TYPE,
+    )
+
+
 def initialize_app():
     """Initialize the application with configuration and logging."""
     global config, logger
@@ -975,10 +4253,10 @@ def initialize_app():
     # Load configuration first
     config_data = {}
     try:
-        with open("config.json", "r") as f:
+        with open(config_store.path, "r") as f:
             config_data = json.load(f)
     except Exception as e:
-        print(f"Error loading config.json: {str(e)}")
+        print(f"Error loading {config_store.path}: {str(e)}")
         # Use default configuration if config.json fails to load
         config_data = {
             "logging": {"level": "info", "file": "logs/app.log", "enabled": True},
@@ -994,9 +4272,171 @@ def initialize_app():
     return config_data
 
 
-if __name__ == "__main__":
-    import sys
+SESSION_KEY = web.AppKey("session", aiohttp.ClientSession)
+EXECUTOR_KEY = web.AppKey("executor", ThreadPoolExecutor)
+
+
+def build_wsgi_environ(request, body):
+    """Translate an aiohttp request into a WSGI environ for the Flask app."""
+    host, _, port = (request.host or "localhost").partition(":")
+    environ = {
+        "REQUEST_METHOD": request.method,
+        "SCRIPT_NAME": "",
+        # WSGI carries the decoded path as a latin-1 str
+        "PATH_INFO": request.path.encode("utf-8").decode("latin-1"),
+        "QUERY_STRING": request.query_string,
+        "SERVER_NAME": host,
+        "SERVER_PORT": port or ("443" if request.secure else "80"),
+        "SERVER_PROTOCOL": f"HTTP/{request.version.major}.{request.version.minor}",
+        "REMOTE_ADDR": request.remote or "",
+        "CONTENT_TYPE": request.headers.get("Content-Type", ""),
+        "CONTENT_LENGTH": str(len(body)),
+        "wsgi.version": (1, 0),
+        "wsgi.url_scheme": request.scheme,
+        "wsgi.input": io.BytesIO(body),
+        "wsgi.errors": sys.stderr,
+        "wsgi.multithread": True,
+        "wsgi.multiprocess": False,
+        "wsgi.run_once": False,
+    }
+    for name in set(request.headers.keys()):
+        key = "HTTP_" + name.upper().replace("-", "_")
+        if key not in ("HTTP_CONTENT_TYPE", "HTTP_CONTENT_LENGTH"):
+            environ[key] = ",".join(request.headers.getall(name))
+    return environ
+
+
+async def handle_wsgi(request):
+    """Serve a request through the Flask app on the worker thread pool.
+
+    Every step runs in one copied context so ``stream_with_context`` keeps its
+    request context while NDJSON chunks are pulled on different threads.
+    """
+    loop = asyncio.get_running_loop()
+    executor = request.app[EXECUTOR_KEY]
+    environ = build_wsgi_environ(request, await request.read())
+    context = contextvars.copy_context()
+    started = {}
+
+    def start_response(status, headers, exc_info=None):
+        started["status"] = status
+        started["headers"] = headers
+
+    def call_app():
+        result = app.wsgi_app(environ, start_response)
+        return result, iter(result)
+
+    result, chunks = await loop.run_in_executor(executor, context.run, call_app)
+    try:
+        status, _, reason = started["status"].partition(" ")
+        response = web.StreamResponse(status=int(status), reason=reason)
+        for name, value in started["headers"]:
+            response.headers.add(name, value)
+        await response.prepare(request)
+        while True:
+            chunk = await loop.run_in_executor(
+                executor, context.run, next, chunks, None
+            )
+            if chunk is None:
+                break
+            if chunk:
+                await response.write(chunk)
+        await response.write_eof()
+        return response
+    finally:
+        if hasattr(result, "close"):
+            await loop.run_in_executor(executor, context.run, result.close)
+
+
+async def handle_bucket_stats(request):
+    """Native /api/bucket/.../stats: await upstream calls on the loop directly.
+
+    The config is read in the default executor: a changed config.json reloads
+    there, and reload listeners may block on ``runtime.run()`` (this loop).
+    """
+    started = time.perf_counter()
+    timings = {}
+    cluster_host = request.match_info["cluster_host"]
+    bucket_name = request.match_info["bucket_name"]
+    clusters = await asyncio.get_running_loop().run_in_executor(
+        None, config_store.clusters
+    )
+    cluster = find_cluster_by_host(clusters, cluster_host)
+    if not cluster:
+        response = web.Response(
+            body=json_codec.dumps({"error": "Cluster not found"}),
+            status=404,
+            content_type="application/json",
+        )
+    else:
+        try:
+            fetch_started = time.perf_counter()
+            result = await fetch_detailed_bucket_stats(
+                request.app[SESSION_KEY], cluster, bucket_name
+            )
+            timings["fetch"] = time.perf_counter() - fetch_started
+            serialize_started = time.perf_counter()
+            body = json_codec.dumps(result)
+            timings["serialize"] = time.perf_counter() - serialize_started
+            response = web.Response(body=body, content_type="application/json")
+        except Exception as e:
+            if logger:
+                logger.error(f"Error in get_bucket_stats: {str(e)}")
+            response = web.Response(
+                body=json_codec.dumps({"error": str(e)}),
+                status=500,
+                content_type="application/json",
+            )
+    timings["total"] = time.perf_counter() - started
+    response.headers["Server-Timing"] = format_server_timing(timings)
+    response.enable_compression()
+    return response
+
+
+def create_async_app(session, workers=DEFAULT_SERVER_WORKERS):
+    """Build the aiohttp application used by the async server mode.
+
+    Bucket stats requests run as coroutines on the event loop. Everything else
+    (pages, static files, the other API routes) goes through the Flask app on a
+    pool of ``workers`` threads. With the collector running those handlers only
+    read in-memory snapshots; without it, routes that fetch from the clusters
+    block their worker thread in ``run_async`` until the upstream calls finish,
+    so a slow cluster can tie up a thread per in-flight request.
+    """
+    webapp = web.Application()
+    webapp[SESSION_KEY] = session
+    webapp[EXECUTOR_KEY] = ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="flask-worker"
+    )
+
+    async def shutdown_executor(webapp):
+        webapp[EXECUTOR_KEY].shutdown(wait=False)
+
+    webapp.on_cleanup.append(shutdown_executor)
+    webapp.router.add_get(
+        "/api/bucket/{cluster_host}/{bucket_name}/stats", handle_bucket_stats
+    )
+    webapp.router.add_route("*", "/{tail:.*}", handle_wsgi)
+    return webapp
+
 
+def serve_async(host, port, workers=DEFAULT_SERVER_WORKERS):
+    """Serve the dashboard with aiohttp on the shared runtime loop until interrupted."""
+    shared = get_runtime()
+    runner = web.AppRunner(create_async_app(shared.session, workers))
+    shared.run(runner.setup())
+    shared.run(web.TCPSite(runner, host, port).start())
+    print(f" * Serving on http://{host}:{port} (async mode, {workers} workers)")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        shared.run(runner.cleanup(), timeout=10)
+
+
+if __name__ == "__main__":
     # Initialize application
     config_data = initialize_app()
 
@@ -1013,7 +4453,10 @@ if __name__ == "__main__":
         # Running as PyInstaller executable - disable debug mode
         debug = False
 
-    # Parse command line arguments for port (overrides config)
+    mode = server_config.get("mode", DEFAULT_SERVER_MODE)
+    workers = server_config.get("workers", DEFAULT_SERVER_WORKERS)
+
+    # Parse command line arguments for port and mode (override config)
     if len(sys.argv) > 1:
         for i, arg in enumerate(sys.argv):
             if arg == "--port" and i + 1 < len(sys.argv):
@@ -1022,10 +4465,39 @@ if __name__ == "__main__":
                 except ValueError:
                     print(f"Invalid port number: {sys.argv[i + 1]}")
                     sys.exit(1)
+            elif arg == "--mode" and i + 1 < len(sys.argv):
+                mode = sys.argv[i + 1]
+                if mode not in SERVER_MODES:
+                    print(f"Invalid server mode: {mode}")
+                    sys.exit(1)
+
+    # The async server has no reloader, so it always runs as the serving process
+    if mode == "async":
+        debug = False
+
+    # Start the background collector. With the debug reloader only the child
+    # process (WERKZEUG_RUN_MAIN=true) serves requests, so skip the parent.
+    collector_config = config_data.get("collector", {})
+    if collector_config.get("enabled", True) and (
+        not debug or os.environ.get("WERKZEUG_RUN_MAIN") == "true"
+    ):
+        clusters_config = config_store.clusters()
+        if clusters_config:
+            start_collector(clusters_config, collector_config)
+
+    # Pick up config.json edits (and SIGHUP) without a restart
+    if not debug or os.environ.get("WERKZEUG_RUN_MAIN") == "true":
+        config_store.add_listener(apply_config_change)
+        get_runtime().submit(watch_config())
+        if hasattr(signal, "SIGHUP"):
+            signal.signal(signal.SIGHUP, reload_config_on_signal)
 
     # Log server startup configuration
     if logger:
-        logger.info(f"Starting Flask server on port {port} (debug={debug})")
+        logger.info(f"Starting {mode} server on port {port} (debug={debug})")
 
     # Run the application
-    app.run(debug=debug, port=port)
+    if mode == "async":
+        serve_async(server_config.get("host", DEFAULT_SERVER_HOST), port, workers)
+    else:
+        app.run(debug=debug, port=port)
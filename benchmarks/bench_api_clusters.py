@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+End-to-end benchmark of /api/clusters against a simulated Couchbase fleet.
+
+Starts couchbase_simulator.py's fleet in this process, runs the real
+dashboard (app.py) as a subprocess pointed at it, and fires concurrent
+/api/clusters requests. Reports latency percentiles, the dashboard's peak
+RSS and how many upstream requests each endpoint received while measuring.
+
+Usage: python benchmarks/bench_api_clusters.py [--clusters N] [--buckets M]
+           [--requests R] [--concurrency C] [--server-mode flask|async]
+           [--no-collector] [--quick]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+import aiohttp
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from couchbase_simulator import add_fleet_arguments, fleet_from_args  # noqa: E402
+
+APP_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py"
+)
+STARTUP_TIMEOUT = 60  # seconds to wait for the dashboard's first full answer
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def peak_rss_kb(pid):
+    """VmHWM of ``pid`` from /proc (Linux only), or None."""
+    try:
+        with open(f"/proc/{pid}/status") as status:
+            for line in status:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def percentile(ordered, fraction):
+    return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)]
+
+
+def write_config(directory, fleet, args):
+    config = {
+        "server": {"port": args.port, "debug": False, "mode": args.server_mode},
+        "logging": {"level": "warning", "file": "logs/app.log", "enabled": True},
+        "collector": {"enabled": not args.no_collector, "interval": args.interval},
+        "clusters": fleet.cluster_configs(),
+    }
+    with open(os.path.join(directory, "config.json"), "w") as f:
+        json.dump(config, f, indent=2)
+
+
+async def wait_until_ready(session, url, clusters, process):
+    deadline = time.monotonic() + STARTUP_TIMEOUT
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"dashboard exited with code {process.returncode}")
+        try:
+            async with session.get(url) as response:
+                if response.status == 200:
+                    body = await response.json()
+                    if len(body) == clusters and all(c.get("nodes") for c in body):
+                        return
+        except aiohttp.ClientError:
+            pass
+        await asyncio.sleep(0.2)
+    raise RuntimeError("dashboard did not serve every cluster in time")
+
+
+async def measure(session, url, total, concurrency):
+    """Issue ``total`` GETs with ``concurrency`` in flight; return latencies."""
+    latencies = []
+    failures = 0
+    remaining = iter(range(total))
+
+    async def worker():
+        nonlocal failures
+        for _ in remaining:
+            started = time.perf_counter()
+            try:
+                async with session.get(url) as response:
+                    await response.read()
+                    if response.status != 200:
+                        failures += 1
+            except aiohttp.ClientError:
+                failures += 1
+            latencies.append(time.perf_counter() - started)
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies, failures
+
+
+async def run(args):
+    fleet = fleet_from_args(args)
+    await fleet.start()
+    workdir = tempfile.TemporaryDirectory(prefix="cb-dashboard-bench-")
+    write_config(workdir.name, fleet, args)
+    process = subprocess.Popen(
+        [sys.executable, APP_PATH, "--port", str(args.port)],
+        cwd=workdir.name,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    url = f"http://127.0.0.1:{args.port}/api/clusters"
+    try:
+        async with aiohttp.ClientSession(
+            headers={"Accept-Encoding": "gzip"},
+            connector=aiohttp.TCPConnector(limit=args.concurrency),
+        ) as session:
+            await wait_until_ready(session, url, args.clusters, process)
+            fleet.reset_counts()
+            started = time.perf_counter()
+            latencies, failures = await measure(
+                session, url, args.requests, args.concurrency
+            )
+            elapsed = time.perf_counter() - started
+        upstream = fleet.request_counts()
+        rss = peak_rss_kb(process.pid)
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+        await fleet.stop()
+        workdir.cleanup()
+
+    ordered = sorted(latencies)
+    mode = "on-demand" if args.no_collector else "collector"
+    print(
+        f"\n/api/clusters: {args.clusters} clusters x {args.buckets} buckets,"
+        f" {args.server_mode} server, {mode},"
+        f" upstream latency {args.latency * 1000:.0f}"
+        f"+{args.jitter * 1000:.0f} ms, error rate {args.error_rate:.0%}"
+    )
+    print(
+        f"  requests  {len(latencies)} ({failures} failed) in {elapsed:.2f}s"
+        f" = {len(latencies) / elapsed:.1f} req/s at concurrency {args.concurrency}"
+    )
+    print(
+        "  latency   "
+        + "  ".join(
+            f"{label} {percentile(ordered, fraction) * 1000:.1f} ms"
+            for label, fraction in (("p50", 0.5), ("p90", 0.9), ("p99", 0.99))
+        )
+        + f"  max {ordered[-1] * 1000:.1f} ms"
+    )
+    print(f"  peak RSS  {rss / 1024:.1f} MB" if rss else "  peak RSS  n/a")
+    total = sum(upstream.values())
+    print(
+        f"  upstream  {total} requests"
+        f" ({total / max(len(latencies), 1):.2f} per /api/clusters call)"
+    )
+    for kind, count in sorted(upstream.items()):
+        print(f"    {kind:<16} {count:>6}")
+    return failures == 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    add_fleet_arguments(parser)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--server-mode", choices=("flask", "async"), default="flask")
+    parser.add_argument(
+        "--no-collector",
+        action="store_true",
+        help="fetch from the clusters on every request instead of the snapshot",
+    )
+    parser.add_argument(
+        "--interval", type=int, default=10, help="collector refresh interval"
+    )
+    parser.add_argument("--port", type=int, default=None)
+    parser.add_argument(
+        "--quick", action="store_true", help="small fleet and few requests (smoke run)"
+    )
+    args = parser.parse_args()
+    if args.quick:
+        args.clusters, args.buckets, args.requests = 3, 3, 30
+    if args.port is None:
+        args.port = free_port()
+
+    sys.exit(0 if asyncio.run(run(args)) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Benchmark the JSON codecs used for upstream parsing and API serialization.
+
+Builds realistic /pools/default and /indexStatus documents and times
+decoding (as fetch_json does) and encoding (as the API routes do) with the
+stdlib codec and, when installed, orjson.
+
+Usage: python benchmarks/bench_json_codec.py [--nodes N] [--indexes N]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import JSONCodec, orjson  # noqa: E402
+
+
+def make_pools_default(node_count):
+    """A /pools/default document shaped like a Couchbase 7.x response."""
+    rng = random.Random(1)
+    nodes = []
+    for i in range(node_count):
+        nodes.append(
+            {
+                "hostname": f"cb-node-{i:03d}.example.com:8091",
+                "status": "healthy",
+                "clusterMembership": "active",
+                "services": ["kv", "index", "n1ql"][: 1 + i % 3],
+                "version": "7.2.4-7070-enterprise",
+                "os": "x86_64-pc-linux-gnu",
+                "memoryTotal": 67108864000,
+                "memoryFree": rng.randint(1, 60000000000),
+                "mcdMemoryReserved": 51200,
+                "mcdMemoryAllocated": 51200,
+                "uptime": str(rng.randint(1000, 9000000)),
+                "ports": {"direct": 11210, "distTCP": 21100, "distTLS": 21150},
+                "systemStats": {
+                    "cpu_utilization_rate": rng.random() * 100,
+                    "cpu_stolen_rate": rng.random(),
+                    "swap_total": 4294967296,
+                    "swap_used": rng.randint(0, 4294967296),
+                    "mem_total": 67108864000,
+                    "mem_free": rng.randint(1, 60000000000),
+                    "mem_limit": 67108864000,
+                    "cpu_cores_available": 16,
+                    "allocstall": 0,
+                },
+                "interestingStats": {
+                    name: rng.randint(0, 10**10)
+                    for name in (
+                        "cmd_get",
+                        "couch_docs_actual_disk_size",
+                        "couch_docs_data_size",
+                        "couch_spatial_data_size",
+                        "couch_spatial_disk_size",
+                        "couch_views_actual_disk_size",
+                        "couch_views_data_size",
+                        "curr_items",
+                        "curr_items_tot",
+                        "ep_bg_fetched",
+                        "get_hits",
+                        "mem_used",
+                        "ops",
+                        "vb_active_num_non_resident",
+                        "vb_replica_curr_items",
+                    )
+                },
+            }
+        )
+    return {
+        "name": "default",
+        "clusterName": "benchmark",
+        "etag": "123456789",
+        "nodes": nodes,
+        "bucketNames": [
+            {"bucketName": f"bucket-{i}", "uuid": "x" * 32} for i in range(20)
+        ],
+        "storageTotals": {
+            "ram": {"total": 67108864000 * node_count, "used": 1, "quotaTotal": 1},
+            "hdd": {"total": 10**12 * node_count, "used": 1, "free": 1},
+        },
+    }
+
+
+def make_index_status(index_count):
+    """An /indexStatus document with ``index_count`` indexes."""
+    rng = random.Random(2)
+    indexes = []
+    for i in range(index_count):
+        bucket = f"bucket-{i % 20}"
+        indexes.append(
+            {
+                "storageMode": "plasma",
+                "partitionMap": {f"cb-node-{i % 8:03d}.example.com:8091": [0]},
+                "numPartition": 1,
+                "partitioned": False,
+                "instId": rng.randint(10**18, 10**19),
+                "hosts": [f"cb-node-{i % 8:03d}.example.com:8091"],
+                "progress": 100,
+                "definition": f"CREATE INDEX `idx_{i}` ON `{bucket}`(`field_{i}`)",
+                "status": "Ready",
+                "collection": "_default",
+                "scope": "_default",
+                "bucket": bucket,
+                "replicaId": 0,
+                "lastScanTime": "Tue Oct 10 10:10:10 UTC 2026",
+                "indexName": f"idx_{i}",
+                "index": f"idx_{i}",
+                "id": rng.randint(10**18, 10**19),
+            }
+        )
+    return {"indexes": indexes, "version": rng.randint(1, 10**6), "warnings": []}
+
+
+def bench(label, payload, codecs, repeat):
+    raw = json.dumps(payload)
+    print(f"\n{label}: {len(raw) / 1024:.0f} KB")
+    print(f"  {'codec':<8} {'decode ms':>10} {'encode ms':>10}")
+    baseline = None
+    for codec in codecs:
+        decode = min(timeit.repeat(lambda: codec.loads(raw), number=1, repeat=repeat))
+        encode = min(
+            timeit.repeat(lambda: codec.dumps(payload), number=1, repeat=repeat)
+        )
+        line = f"  {codec.name:<8} {decode * 1000:>10.2f} {encode * 1000:>10.2f}"
+        if baseline is None:
+            baseline = (decode, encode)
+        else:
+            line += (
+                f"   ({baseline[0] / decode:.1f}x decode,"
+                f" {baseline[1] / encode:.1f}x encode)"
+            )
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--nodes", type=int, default=64)
+    parser.add_argument("--indexes", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    codecs = [JSONCodec("json")]
+    if orjson is not None:
+        codecs.append(JSONCodec("orjson"))
+    else:
+        print("orjson is not installed; only the stdlib codec is measured")
+
+    bench(
+        f"/pools/default ({args.nodes} nodes)",
+        make_pools_default(args.nodes),
+        codecs,
+        args.repeat,
+    )
+    bench(
+        f"/indexStatus ({args.indexes} indexes)",
+        make_index_status(args.indexes),
+        codecs,
+        args.repeat,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,424 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the Couchbase REST endpoints the dashboard polls.
+
+Serves /pools/default, /pools/default/buckets/<b>, /pools/default/buckets/<b>/stats,
+/indexStatus, /pools/default/remoteClusters and /pools/default/tasks for N
+synthetic clusters with M buckets each, one port per cluster (so per-host
+connection limits behave as they do against real clusters). Latency, errors
+and payload size can be injected, and every request is counted per endpoint.
+
+Usage: python benchmarks/couchbase_simulator.py [--clusters N] [--buckets M]
+           [--latency SECONDS] [--jitter SECONDS] [--error-rate FRACTION]
+
+Prints the ``clusters`` entries for a config.json and serves until interrupted.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from collections import Counter
+
+from aiohttp import web
+
+SIMULATOR_USER = "Administrator"
+SIMULATOR_PASSWORD = "password"
+STATS_SAMPLES = 60  # points per series, like zoom=minute
+
+STATS_METRICS = (
+    "cmd_get",
+    "cmd_set",
+    "curr_connections",
+    "curr_items",
+    "delete_hits",
+    "disk_write_queue",
+    "ep_bg_fetched",
+    "ep_cache_miss_rate",
+    "ep_mem_high_wat",
+    "get_hits",
+    "mem_used",
+    "ops",
+    "vb_active_resident_items_ratio",
+    "xdc_ops",
+)
+
+ENDPOINT_KINDS = (
+    ("/pools/default/buckets/", "/stats", "bucket_stats"),
+    ("/pools/default/buckets/", "", "bucket"),
+    ("/pools/default/remoteClusters", "", "remote_clusters"),
+    ("/pools/default/tasks", "", "tasks"),
+    ("/pools/default", "", "pools"),
+    ("/indexStatus", "", "index_status"),
+)
+
+
+def endpoint_kind(path):
+    """Fold a request path to the endpoint it hits (bucket names dropped)."""
+    for prefix, suffix, kind in ENDPOINT_KINDS:
+        if path.startswith(prefix) and path.endswith(suffix):
+            return kind
+    return "other"
+
+
+class SimulatedCluster:
+    """One synthetic cluster: its documents, request counters and fault knobs.
+
+    ``payload_scale`` multiplies the nodes' stats and adds unused stats series
+    per bucket (the dashboard's metric projection drops those again).
+    ``error_rate`` is the fraction of requests answered with ``error_status``.
+    """
+
+    def __init__(
+        self,
+        name,
+        buckets=10,
+        nodes=3,
+        indexes=100,
+        replications=2,
+        latency=0.0,
+        jitter=0.0,
+        error_rate=0.0,
+        error_status=500,
+        payload_scale=1,
+        seed=0,
+    ):
+        self.name = name
+        self.bucket_names = [f"bucket-{i}" for i in range(buckets)]
+        self.node_count = nodes
+        self.index_count = indexes
+        self.replication_count = replications
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.payload_scale = payload_scale
+        self.rng = random.Random(seed)
+        self.uuid = f"{seed:032x}"
+        self.requests = Counter()
+        self.etag = 1
+
+    def reset_counts(self):
+        self.requests.clear()
+
+    @web.middleware
+    async def middleware(self, request, handler):
+        self.requests[endpoint_kind(request.path)] += 1
+        delay = self.latency + self.rng.uniform(0, self.jitter)
+        if delay:
+            await asyncio.sleep(delay)
+        if self.error_rate and self.rng.random() < self.error_rate:
+            return web.json_response(
+                {"error": "injected failure"}, status=self.error_status
+            )
+        return await handler(request)
+
+    def make_app(self):
+        webapp = web.Application(middlewares=[self.middleware])
+        webapp.router.add_get("/pools/default", self.pools_default)
+        webapp.router.add_get("/pools/default/buckets/{bucket}", self.bucket)
+        webapp.router.add_get("/pools/default/buckets/{bucket}/stats", self.stats)
+        webapp.router.add_get("/pools/default/remoteClusters", self.remote_clusters)
+        webapp.router.add_get("/pools/default/tasks", self.tasks)
+        webapp.router.add_get("/indexStatus", self.index_status)
+        return webapp
+
+    async def pools_default(self, request):
+        # Long-poll: hold the request until waitChange ms pass (nothing changes)
+        if request.query.get("etag") == str(self.etag):
+            await asyncio.sleep(int(request.query.get("waitChange", 0)) / 1000)
+        rng = self.rng
+        nodes = [
+            {
+                "hostname": f"{self.name}-node-{i}.example.com:8091",
+                "status": "healthy",
+                "clusterMembership": "active",
+                "services": ["kv", "index", "n1ql"][: 1 + i % 3],
+                "version": "7.2.4-7070-enterprise",
+                "memoryTotal": 67108864000,
+                "memoryFree": rng.randint(1, 60000000000),
+                "systemStats": {
+                    "cpu_utilization_rate": rng.random() * 100,
+                    "mem_total": 67108864000,
+                    "mem_free": rng.randint(1, 60000000000),
+                    "swap_total": 4294967296,
+                    "swap_used": rng.randint(0, 4294967296),
+                },
+                "interestingStats": {
+                    f"stat_{j}": rng.randint(0, 10**10)
+                    for j in range(15 * self.payload_scale)
+                },
+            }
+            for i in range(self.node_count)
+        ]
+        return web.json_response(
+            {
+                "name": "default",
+                "clusterName": self.name,
+                "etag": str(self.etag),
+                "nodes": nodes,
+                "bucketNames": [
+                    {"bucketName": name, "uuid": self.uuid}
+                    for name in self.bucket_names
+                ],
+                "buckets": {"uri": f"/pools/default/buckets?uuid={self.uuid}"},
+                "storageTotals": {
+                    "ram": {
+                        "total": 67108864000 * self.node_count,
+                        "used": 32 * 1024**3,
+                        "quotaTotal": 48 * 1024**3,
+                    },
+                    "hdd": {
+                        "total": 10**12 * self.node_count,
+                        "used": 10**11,
+                        "free": 10**12 * self.node_count - 10**11,
+                    },
+                },
+            }
+        )
+
+    def _known_bucket(self, request):
+        name = request.match_info["bucket"]
+        if name not in self.bucket_names:
+            raise web.HTTPNotFound(text="Requested resource not found.")
+        return name
+
+    async def bucket(self, request):
+        name = self._known_bucket(request)
+        return web.json_response(
+            {
+                "name": name,
+                "uuid": self.uuid,
+                "bucketType": "membase",
+                "storageBackend": "magma",
+                "replicaNumber": 1,
+                "evictionPolicy": "valueOnly",
+                "durabilityMinLevel": "none",
+                "quota": {"ram": 1024**3, "rawRAM": 1024**3},
+                "basicStats": {
+                    "quotaPercentUsed": self.rng.random() * 100,
+                    "opsPerSec": self.rng.randint(0, 50000),
+                    "diskFetches": self.rng.randint(0, 100),
+                    "itemCount": self.rng.randint(0, 10**7),
+                    "memUsed": self.rng.randint(0, 1024**3),
+                },
+            }
+        )
+
+    async def stats(self, request):
+        name = self._known_bucket(request)
+        now = int(time.time() * 1000)
+        rng = self.rng
+        samples = {
+            "timestamp": [
+                now - (STATS_SAMPLES - i) * 1000 for i in range(STATS_SAMPLES)
+            ]
+        }
+        for metric in STATS_METRICS:
+            samples[metric] = [rng.random() * 1000 for _ in range(STATS_SAMPLES)]
+        for i in range(20 * (self.payload_scale - 1)):
+            samples[f"ep_unused_{i}"] = [0] * STATS_SAMPLES
+        for replication in self._replications():
+            if replication["source"] == name:
+                prefix = f"replications/{replication['id']}/"
+                samples[prefix + "changes_left"] = [
+                    rng.randint(0, 1000) for _ in range(STATS_SAMPLES)
+                ]
+                samples[prefix + "wtavg_docs_latency"] = [
+                    rng.random() * 50 for _ in range(STATS_SAMPLES)
+                ]
+        return web.json_response(
+            {
+                "op": {
+                    "samples": samples,
+                    "samplesCount": STATS_SAMPLES,
+                    "isPersistent": True,
+                    "lastTStamp": now,
+                    "interval": 1000,
+                },
+                "hot_keys": [],
+            }
+        )
+
+    async def index_status(self, request):
+        indexes = []
+        for i in range(self.index_count):
+            bucket = self.bucket_names[i % len(self.bucket_names)]
+            node = f"{self.name}-node-{i % self.node_count}.example.com:8091"
+            indexes.append(
+                {
+                    "storageMode": "plasma",
+                    "hosts": [node],
+                    "progress": 100,
+                    "definition": f"CREATE INDEX `idx_{i}` ON `{bucket}`(`f{i}`)",
+                    "status": "Ready",
+                    "collection": "_default",
+                    "scope": "_default",
+                    "bucket": bucket,
+                    "replicaId": 0,
+                    "numReplica": 0,
+                    "lastScanTime": "NA",
+                    "indexName": f"idx_{i}",
+                    "index": f"idx_{i}",
+                    "id": i,
+                }
+            )
+        return web.json_response({"indexes": indexes, "version": 1, "warnings": []})
+
+    def _replications(self):
+        return [
+            {
+                "id": f"{self.uuid}/{self.bucket_names[i % len(self.bucket_names)]}"
+                f"/remote-{i}",
+                "source": self.bucket_names[i % len(self.bucket_names)],
+                "target": f"/remoteClusters/{self.uuid}/buckets/remote-{i}",
+            }
+            for i in range(self.replication_count)
+        ]
+
+    async def remote_clusters(self, request):
+        return web.json_response(
+            [
+                {
+                    "name": f"{self.name}-dr",
+                    "hostname": "dr.example.com:8091",
+                    "uuid": self.uuid,
+                    "connectivityStatus": "RC_OK",
+                    "secureType": "none",
+                    "deleted": False,
+                }
+            ]
+            if self.replication_count
+            else []
+        )
+
+    async def tasks(self, request):
+        tasks = [{"type": "rebalance", "status": "notRunning"}]
+        for replication in self._replications():
+            tasks.append(
+                dict(
+                    replication,
+                    type="xdcr",
+                    status="running",
+                    replicationType="xmem",
+                    continuous=True,
+                    changesLeft=self.rng.randint(0, 1000),
+                    docsChecked=self.rng.randint(0, 10**6),
+                    docsWritten=self.rng.randint(0, 10**6),
+                    errors=[],
+                )
+            )
+        return web.json_response(tasks)
+
+
+class SimulatedFleet:
+    """N SimulatedClusters, each served on its own localhost port."""
+
+    def __init__(self, clusters=5, **cluster_options):
+        self.clusters = [
+            SimulatedCluster(f"sim-{i}", seed=i, **cluster_options)
+            for i in range(clusters)
+        ]
+        self.hosts = []
+        self._runners = []
+
+    async def start(self, bind="127.0.0.1"):
+        """Start every cluster on a free port and return their host URLs."""
+        for cluster in self.clusters:
+            runner = web.AppRunner(cluster.make_app(), access_log=None)
+            await runner.setup()
+            await web.TCPSite(runner, bind, 0).start()
+            port = runner.addresses[-1][1]
+            self._runners.append(runner)
+            self.hosts.append(f"http://{bind}:{port}")
+        return self.hosts
+
+    async def stop(self):
+        for runner in self._runners:
+            await runner.cleanup()
+        self._runners = []
+        self.hosts = []
+
+    def cluster_configs(self):
+        """``clusters`` entries for a dashboard config.json."""
+        return [
+            {
+                "host": host,
+                "user": SIMULATOR_USER,
+                "pass": SIMULATOR_PASSWORD,
+                "customName": cluster.name,
+            }
+            for host, cluster in zip(self.hosts, self.clusters)
+        ]
+
+    def request_counts(self):
+        """Requests received per endpoint kind, summed over the fleet."""
+        total = Counter()
+        for cluster in self.clusters:
+            total.update(cluster.requests)
+        return total
+
+    def reset_counts(self):
+        for cluster in self.clusters:
+            cluster.reset_counts()
+
+
+def add_fleet_arguments(parser):
+    """Options shared by the simulator CLI and the benchmarks that embed it."""
+    parser.add_argument("--clusters", type=int, default=5)
+    parser.add_argument("--buckets", type=int, default=10)
+    parser.add_argument("--nodes", type=int, default=3)
+    parser.add_argument("--indexes", type=int, default=100)
+    parser.add_argument("--replications", type=int, default=2)
+    parser.add_argument(
+        "--latency", type=float, default=0.02, help="seconds added to every response"
+    )
+    parser.add_argument(
+        "--jitter", type=float, default=0.01, help="extra random seconds, up to this"
+    )
+    parser.add_argument(
+        "--error-rate", type=float, default=0.0, help="fraction of requests failing"
+    )
+    parser.add_argument(
+        "--payload-scale", type=int, default=1, help="multiplier for payload size"
+    )
+
+
+def fleet_from_args(args):
+    return SimulatedFleet(
+        clusters=args.clusters,
+        buckets=args.buckets,
+        nodes=args.nodes,
+        indexes=args.indexes,
+        replications=args.replications,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        payload_scale=args.payload_scale,
+    )
+
+
+async def serve(args):
+    fleet = fleet_from_args(args)
+    await fleet.start(args.bind)
+    print(json.dumps({"clusters": fleet.cluster_configs()}, indent=2), flush=True)
+    try:
+        while True:
+            await asyncio.sleep(3600)
+    finally:
+        await fleet.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    add_fleet_arguments(parser)
+    parser.add_argument("--bind", default="127.0.0.1")
+    try:
+        asyncio.run(serve(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
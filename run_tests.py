@@ -101,6 +101,14 @@ def run_integration_tests():
         return True
 
 
+def run_benchmarks():
+    """Run the end-to-end benchmark against the simulated Couchbase fleet"""
+    return run_command(
+        f"{sys.executable} benchmarks/bench_api_clusters.py --quick",
+        "End-to-end /api/clusters benchmark (simulated clusters)",
+    )
+
+
 def generate_test_report():
     """Generate a summary test report"""
     print(f"\n{'='*60}")
@@ -152,6 +160,12 @@ def main():
     if not run_integration_tests():
         all_success = False
 
+    # Benchmarks are opt-in: they start real servers and take a while
+    if "--benchmark" in sys.argv:
+        print("\n⏱️  Running Benchmarks...")
+        if not run_benchmarks():
+            all_success = False
+
     # Generate report
     generate_test_report()
 
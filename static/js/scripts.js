@@ -6,6 +6,8 @@ $(document).ready(function () {
   function getHealthBadgeClass(cluster) {
     if (cluster.not_watching) {
       return "badge-warning"; // Yellow for not watching
+    } else if (cluster.stale) {
+      return "badge-secondary"; // Gray while showing last known data
     } else if (cluster.health === true) {
       return "badge-success"; // Green for healthy
     } else if (cluster.health === false) {
@@ -18,6 +20,8 @@ $(document).ready(function () {
   function getHealthBadgeText(cluster) {
     if (cluster.not_watching) {
       return "Not Watching";
+    } else if (cluster.stale) {
+      return "Stale";
     } else if (cluster.health === true) {
       return "Healthy";
     } else if (cluster.health === false) {
@@ -27,11 +31,308 @@ $(document).ready(function () {
     }
   }
 
+  function formatAge(seconds) {
+    if (seconds < 60) {
+      return `${seconds}s`;
+    } else if (seconds < 3600) {
+      return `${Math.floor(seconds / 60)}m`;
+    }
+    return `${Math.floor(seconds / 3600)}h ${Math.floor((seconds % 3600) / 60)}m`;
+  }
+
+  function staleAge(collectedAt) {
+    // collected_at is the epoch second of the cluster's last good refresh
+    if (!collectedAt) {
+      return formatAge(0);
+    }
+    return formatAge(Math.max(0, Math.floor(Date.now() / 1000 - collectedAt)));
+  }
+
+  function staleNotice(cluster) {
+    // Last known data is shown while the cluster can't be refreshed
+    if (!cluster.stale) {
+      return "";
+    }
+    const reason = cluster.stale_error ? ` (${cluster.stale_error})` : "";
+    return `<small class="text-warning">Stale data, last updated <span class="stale-age" data-collected-at="${
+      cluster.collected_at || ""
+    }">${staleAge(cluster.collected_at)}</span> ago${reason}</small>`;
+  }
+
+  function refreshStaleAges() {
+    // A still-failing cluster doesn't change the snapshot, so tick ages here
+    $(".stale-age").each(function () {
+      $(this).text(staleAge(parseFloat($(this).attr("data-collected-at"))));
+    });
+  }
+
+  let fetchInProgress = false;
+  // Ask for float32 columnar stats samples when the browser can decode them
+  const samplesEncoding =
+    window.atob && window.Float32Array && window.DataView ? "columnar" : "json";
+  // Snapshot version of clustersData; "" until the first delta response
+  let clustersVersion = "";
+  let deltaSupported = true;
+
   function fetchClusters() {
+    // Skip this tick if the previous refresh is still streaming in
+    if (fetchInProgress) {
+      return;
+    }
+    if (isInitialized && deltaSupported) {
+      fetchClustersDelta();
+    } else if (window.fetch && window.ReadableStream && window.TextDecoder) {
+      streamClusters();
+    } else {
+      fetchClustersAll();
+    }
+  }
+
+  function streamClusters() {
+    fetchInProgress = true;
+    let received = 0;
+
+    fetch(`/api/clusters/stream?samples=${samplesEncoding}`)
+      .then((response) => {
+        if (!response.ok || !response.body) {
+          throw new Error(response.statusText || "HTTP " + response.status);
+        }
+        const reader = response.body.getReader();
+        const decoder = new TextDecoder();
+        let buffer = "";
+
+        // Apply each NDJSON line (one cluster) as soon as it arrives
+        function read() {
+          return reader.read().then(({ done, value }) => {
+            buffer += decoder.decode(value || new Uint8Array(), {
+              stream: !done,
+            });
+            const lines = buffer.split("\n");
+            buffer = lines.pop();
+            lines.forEach((line) => {
+              if (line.trim()) {
+                applyStreamedCluster(JSON.parse(line));
+                received++;
+              }
+            });
+            if (!done) {
+              return read();
+            }
+          });
+        }
+        return read();
+      })
+      .then(() => {
+        if (!isInitialized && received > 0) {
+          initializeDragSort();
+          isInitialized = true;
+        }
+        updateLastUpdated();
+      })
+      .catch((error) => {
+        console.error("Error streaming cluster data, falling back:", error);
+        if (received === 0) {
+          fetchClustersAll();
+        }
+      })
+      .finally(() => {
+        fetchInProgress = false;
+      });
+  }
+
+  function applyStreamedCluster(message) {
+    const { index, total } = message;
+    const cluster = decodeClusterSamples(message.cluster);
+
+    if (!isInitialized) {
+      // First load: lay out one placeholder per cluster, then fill them in
+      if (!$("#clusters .cluster-placeholder, #clusters .cluster").length) {
+        let html = "";
+        for (let i = 0; i < total; i++) {
+          html += `
+                <div class="cluster-placeholder card mb-4" id="cluster-placeholder-${i}">
+                    <div class="card-body text-center">
+                        <div class="spinner-border spinner-border-sm" role="status"></div>
+                        <span class="text-muted ml-2">Loading cluster...</span>
+                    </div>
+                </div>`;
+        }
+        $("#clusters").html(html);
+      }
+      clustersData[index] = cluster;
+      const placeholder = $(`#cluster-placeholder-${index}`);
+      if (placeholder.length) {
+        placeholder.replaceWith(renderClusterCard(cluster, index));
+        initializeClusterTabs(index);
+      } else {
+        updateClusterData(cluster, index);
+      }
+    } else {
+      clustersData[index] = cluster;
+      updateClusterData(cluster, index);
+    }
+
+    updateClusterStats(clustersData.filter(Boolean));
+  }
+
+  function fetchClustersDelta() {
+    // Ask only for what changed since our version; 304 when nothing did
+    fetchInProgress = true;
+    $.ajax({
+      url: "/api/clusters",
+      method: "GET",
+      data: { since: clustersVersion, samples: samplesEncoding },
+      ifModified: true,
+      success: function (payload, status) {
+        if (status === "notmodified" || !payload) {
+          return;
+        }
+        if (Array.isArray(payload)) {
+          // Server is not running the collector, so it has no versions
+          deltaSupported = false;
+          applyFullClusters(payload.map(decodeClusterSamples));
+        } else {
+          applyClustersDelta(payload);
+          clustersVersion = payload.version;
+        }
+        updateLastUpdated();
+      },
+      error: function (xhr, status, error) {
+        console.error("Error fetching cluster changes:", error);
+      },
+      complete: function () {
+        fetchInProgress = false;
+      },
+    });
+  }
+
+  function applyClustersDelta(payload) {
+    if (payload.full) {
+      applyFullClusters(payload.clusters.map(decodeClusterSamples));
+      return;
+    }
+    Object.keys(payload.clusters).forEach((key) => {
+      const index = parseInt(key, 10);
+      const entry = payload.clusters[key];
+      const cluster = entry.replace
+        ? decodeClusterSamples(entry.replace)
+        : mergeClusterChanges(
+            clustersData[index],
+            decodeClusterSamples(entry.changes),
+            entry.removed || []
+          );
+      clustersData[index] = cluster;
+      updateClusterData(cluster, index);
+    });
+    updateClusterStats(clustersData);
+  }
+
+  function mergeClusterChanges(cluster, changes, removed) {
+    const merged = Object.assign({}, cluster);
+    removed.forEach((key) => {
+      // e.g. "stale" or "not_watching" once the cluster is back to normal
+      delete merged[key];
+    });
+    Object.keys(changes).forEach((key) => {
+      const value = changes[key];
+      if (Array.isArray(merged[key]) && !Array.isArray(value)) {
+        // {position: item} patch for an unchanged-length list
+        const list = merged[key].slice();
+        Object.keys(value).forEach((position) => {
+          list[parseInt(position, 10)] = value[position];
+        });
+        merged[key] = list;
+      } else {
+        merged[key] = value;
+      }
+    });
+    return merged;
+  }
+
+  function applyFullClusters(clusters) {
+    if (clusters.length !== clustersData.length) {
+      // Cluster list changed shape: rebuild the cards from scratch
+      initializeClusters(clusters);
+    } else {
+      updateClustersData(clusters);
+    }
+    clustersData = clusters;
+    updateClusterStats(clusters);
+  }
+
+  function decodeBase64(text) {
+    const binary = atob(text);
+    const bytes = new Uint8Array(binary.length);
+    for (let i = 0; i < binary.length; i++) {
+      bytes[i] = binary.charCodeAt(i);
+    }
+    return bytes.buffer;
+  }
+
+  const littleEndian = new Uint8Array(new Uint16Array([1]).buffer)[0] === 1;
+
+  function decodeColumnarSamples(encoded) {
+    // Timestamps: first value plus little-endian int32 deltas
+    const count = encoded.count;
+    const deltas = new DataView(decodeBase64(encoded.dt));
+    const timestamp = new Array(count);
+    let current = encoded.t0;
+    for (let i = 0; i < count; i++) {
+      if (i > 0) {
+        current += deltas.getInt32((i - 1) * 4, true);
+      }
+      timestamp[i] = current;
+    }
+
+    // Values: one float32 column per metric, concatenated metric-major
+    const buffer = decodeBase64(encoded.values);
+    let values;
+    if (littleEndian) {
+      values = new Float32Array(buffer);
+    } else {
+      const view = new DataView(buffer);
+      values = new Float32Array(buffer.byteLength / 4);
+      for (let i = 0; i < values.length; i++) {
+        values[i] = view.getFloat32(i * 4, true);
+      }
+    }
+
+    // Missing samples travel as NaN; turn them back into null as in JSON mode
+    const samples = { timestamp: timestamp };
+    encoded.metrics.forEach((name, k) => {
+      samples[name] = Array.from(
+        values.subarray(k * count, (k + 1) * count),
+        (value) => (Number.isNaN(value) ? null : value)
+      );
+    });
+    return samples;
+  }
+
+  function decodeClusterSamples(cluster) {
+    // bucket_stats is a list, or a {position: item} patch in delta responses
+    const bucketStats = cluster && cluster.bucket_stats;
+    if (!bucketStats) {
+      return cluster;
+    }
+    Object.keys(bucketStats).forEach((key) => {
+      const stats = bucketStats[key] && bucketStats[key].stats;
+      const op = stats && stats.op;
+      if (op && op.samplesColumnar) {
+        op.samples = decodeColumnarSamples(op.samplesColumnar);
+        delete op.samplesColumnar;
+      }
+    });
+    return cluster;
+  }
+
+  function fetchClustersAll() {
+    fetchInProgress = true;
     $.ajax({
       url: "/api/clusters",
       method: "GET",
+      data: { samples: samplesEncoding },
       success: function (clusters) {
+        clusters.forEach(decodeClusterSamples);
         clustersData = clusters;
         if (!isInitialized) {
           initializeClusters(clusters);
@@ -50,6 +351,9 @@ $(document).ready(function () {
             "</div>"
         );
       },
+      complete: function () {
+        fetchInProgress = false;
+      },
     });
   }
 
@@ -66,7 +370,7 @@ $(document).ready(function () {
     clusters.forEach((cluster) => {
       if (cluster.not_watching) {
         notWatchingCount++;
-      } else if (cluster.health === true) {
+      } else if (cluster.health === true && !cluster.stale) {
         healthyCount++;
       } else {
         unhealthyCount++;
@@ -81,7 +385,19 @@ $(document).ready(function () {
   function initializeClusters(clusters) {
     let html = "";
     clusters.forEach((cluster, index) => {
-      html += `
+      html += renderClusterCard(cluster, index);
+    });
+    $("#clusters").html(html);
+
+    // Initialize tabs for each cluster
+    clusters.forEach((cluster, index) => initializeClusterTabs(index));
+
+    // Make clusters draggable and sortable
+    initializeDragSort();
+  }
+
+  function renderClusterCard(cluster, index) {
+    return `
                 <div class="cluster card mb-4" data-cluster-uuid="${
                   cluster.clusterUUID
                 }" data-cluster-index="${index}">
@@ -96,6 +412,9 @@ $(document).ready(function () {
                                 <small class="text-muted cluster-host">${
                                   cluster.host
                                 }</small>
+                                <div class="cluster-stale">${staleNotice(
+                                  cluster
+                                )}</div>
                             </div>
                             <div class="text-right">
                                 <span class="badge cluster-health-badge ${getHealthBadgeClass(
@@ -233,11 +552,10 @@ $(document).ready(function () {
                     </div>
                 </div>
             `;
-    });
-    $("#clusters").html(html);
+  }
 
-    // Initialize tabs for each cluster
-    $(".tabs").tabs({
+  function initializeClusterTabs(index) {
+    $(`#tabs-${index}`).tabs({
       activate: function (event, ui) {
         const tabId = ui.newPanel.attr("id");
         const clusterIndex = tabId.split("-")[2];
@@ -287,88 +605,88 @@ $(document).ready(function () {
         }
       },
     });
-
-    // Make clusters draggable and sortable
-    initializeDragSort();
   }
 
   function updateClustersData(clusters) {
     // console.log('🔄 updateClustersData called with', clusters.length, 'clusters'); // Commented out to reduce noise
-    clusters.forEach((cluster, index) => {
-      const clusterDiv = $(`.cluster[data-cluster-index="${index}"]`);
-      if (clusterDiv.length) {
-        // Update header info
-        clusterDiv
-          .find(".cluster-name")
-          .text(
-            `${cluster.clusterName}${
-              cluster.customName ? ` (${cluster.customName})` : ""
-            }`
-          );
-        clusterDiv.find(".cluster-host").text(cluster.host);
-        clusterDiv
-          .find(".cluster-health-badge")
-          .removeClass(
-            "badge-success badge-danger badge-warning badge-secondary"
-          )
-          .addClass(getHealthBadgeClass(cluster))
-          .text(getHealthBadgeText(cluster));
-        clusterDiv.find(".cluster-uuid").text(cluster.clusterUUID);
-        clusterDiv.find(".cluster-memory").html(`${cluster.memory.used.toFixed(
-          2
-        )} / ${cluster.memory.total.toFixed(2)} GB 
-                    (Quota: ${cluster.memory.quotaTotal.toFixed(2)} GB)`);
-        clusterDiv.find(".cluster-disk").html(`${cluster.disk.used.toFixed(
-          2
-        )} / ${cluster.disk.total.toFixed(2)} GB 
-                    (Free: ${cluster.disk.free.toFixed(2)} GB)`);
-
-        // Update table data
-        clusterDiv
-          .find(".nodes-table-body")
-          .html(generateNodesTable(cluster.nodes, cluster.host));
+    clusters.forEach((cluster, index) => updateClusterData(cluster, index));
+  }
+
+  function updateClusterData(cluster, index) {
+    const clusterDiv = $(`.cluster[data-cluster-index="${index}"]`);
+    if (clusterDiv.length) {
+      // Update header info
+      clusterDiv
+        .find(".cluster-name")
+        .text(
+          `${cluster.clusterName}${
+            cluster.customName ? ` (${cluster.customName})` : ""
+          }`
+        );
+      clusterDiv.find(".cluster-host").text(cluster.host);
+      clusterDiv.find(".cluster-stale").html(staleNotice(cluster));
+      clusterDiv
+        .find(".cluster-health-badge")
+        .removeClass(
+          "badge-success badge-danger badge-warning badge-secondary"
+        )
+        .addClass(getHealthBadgeClass(cluster))
+        .text(getHealthBadgeText(cluster));
+      clusterDiv.find(".cluster-uuid").text(cluster.clusterUUID);
+      clusterDiv.find(".cluster-memory").html(`${cluster.memory.used.toFixed(
+        2
+      )} / ${cluster.memory.total.toFixed(2)} GB 
+                  (Quota: ${cluster.memory.quotaTotal.toFixed(2)} GB)`);
+      clusterDiv.find(".cluster-disk").html(`${cluster.disk.used.toFixed(
+        2
+      )} / ${cluster.disk.total.toFixed(2)} GB 
+                  (Free: ${cluster.disk.free.toFixed(2)} GB)`);
+
+      // Update table data
+      clusterDiv
+        .find(".nodes-table-body")
+        .html(generateNodesTable(cluster.nodes, cluster.host));
+      clusterDiv
+        .find(".buckets-table-body")
+        .html(generateBucketsTable(cluster.buckets));
+      // console.log('🔄 Updating system stats for cluster:', index);
+      // console.log('⚠️  WARNING: About to replace system-stats HTML - this may destroy existing charts!');
+
+      // Check if we're currently on the stats tab
+      const activeTab = clusterDiv.find(".tabs").tabs("option", "active");
+      const tabPanel = clusterDiv.find(".ui-tabs-panel").eq(activeTab);
+      const tabId = tabPanel.attr("id");
+      const isStatsTabActive = tabId && tabId.includes("stats");
+
+      // console.log('📊 Stats tab active?', isStatsTabActive, 'for cluster:', index);
+
+      if (isStatsTabActive) {
+        // console.log('🛑 Skipping system stats HTML update to preserve charts for cluster:', index);
+        // Skip updating the system-stats HTML to preserve existing charts
+      } else {
+        // console.log('✅ Updating system stats HTML for cluster:', index);
         clusterDiv
-          .find(".buckets-table-body")
-          .html(generateBucketsTable(cluster.buckets));
-        // console.log('🔄 Updating system stats for cluster:', index);
-        // console.log('⚠️  WARNING: About to replace system-stats HTML - this may destroy existing charts!');
-
-        // Check if we're currently on the stats tab
-        const activeTab = clusterDiv.find(".tabs").tabs("option", "active");
-        const tabPanel = clusterDiv.find(".ui-tabs-panel").eq(activeTab);
-        const tabId = tabPanel.attr("id");
-        const isStatsTabActive = tabId && tabId.includes("stats");
-
-        // console.log('📊 Stats tab active?', isStatsTabActive, 'for cluster:', index);
-
-        if (isStatsTabActive) {
-          // console.log('🛑 Skipping system stats HTML update to preserve charts for cluster:', index);
-          // Skip updating the system-stats HTML to preserve existing charts
-        } else {
-          // console.log('✅ Updating system stats HTML for cluster:', index);
-          clusterDiv
-            .find(".system-stats")
-            .html(generateSystemStats(cluster.systemStats, cluster, index));
-        }
+          .find(".system-stats")
+          .html(generateSystemStats(cluster.systemStats, cluster, index));
+      }
 
-        // Update charts if the charts tab is active and charts exist
-        if (tabId && tabId.includes("charts")) {
-          // Only update if charts exist for this cluster
-          const chartExists = Object.keys(charts).some((key) =>
-            key.includes(`-${index}`)
+      // Update charts if the charts tab is active and charts exist
+      if (tabId && tabId.includes("charts")) {
+        // Only update if charts exist for this cluster
+        const chartExists = Object.keys(charts).some((key) =>
+          key.includes(`-${index}`)
+        );
+        if (chartExists) {
+          // console.log('📊 Charts tab is active, updating charts for cluster:', index); // Commented out to reduce noise
+          updateCharts(cluster, index);
+        } else {
+          console.log(
+            "⏭️ Charts tab active but no charts exist yet for cluster:",
+            index
           );
-          if (chartExists) {
-            // console.log('📊 Charts tab is active, updating charts for cluster:', index); // Commented out to reduce noise
-            updateCharts(cluster, index);
-          } else {
-            console.log(
-              "⏭️ Charts tab active but no charts exist yet for cluster:",
-              index
-            );
-          }
         }
       }
-    });
+    }
   }
 
   function generateNodesTable(nodes, clusterHost) {
@@ -1690,7 +2008,82 @@ $(document).ready(function () {
     console.log("✅ Charts initialized and marked for cluster:", clusterIndex);
   }
 
+  // Bucket history pulled incrementally from /api/timeseries, keyed by host|bucket
+  const bucketSeries = {};
+  let timeseriesSupported = true;
+
+  function syncBucketSeries(cluster, bucketName, done) {
+    if (!timeseriesSupported || !bucketName) {
+      done();
+      return;
+    }
+    const key = `${cluster.host}|${bucketName}`;
+    const cached = bucketSeries[key];
+    const host = cluster.host.replace(/^https?:\/\//, "");
+    const lastTimestamp =
+      cached && cached.timestamp.length
+        ? cached.timestamp[cached.timestamp.length - 1]
+        : null;
+
+    $.ajax({
+      url: `/api/timeseries/${encodeURIComponent(
+        host
+      )}/bucket/${encodeURIComponent(bucketName)}`,
+      method: "GET",
+      data: lastTimestamp !== null ? { since: lastTimestamp } : {},
+      success: function (series) {
+        bucketSeries[key] = appendSeries(cached, series);
+      },
+      error: function (xhr) {
+        // 503: collector disabled, so fall back to the polled samples window
+        if (xhr.status === 503) {
+          timeseriesSupported = false;
+        }
+      },
+      complete: done,
+    });
+  }
+
+  // Append only the new points of a /api/timeseries response and trim to the
+  // server's retention
+  function appendSeries(cached, series) {
+    if (!cached) {
+      return series.samples;
+    }
+    // Lengths are taken before any metric (timestamp included) is replaced,
+    // so a metric new to this batch is backfilled against the old history
+    const previous = cached.timestamp.length;
+    const added = series.samples.timestamp.length;
+    const overflow = Math.max(0, previous + added - series.retention);
+    const metrics = new Set(
+      Object.keys(cached).concat(Object.keys(series.samples))
+    );
+    metrics.forEach((metric) => {
+      const existing = cached[metric] || new Array(previous).fill(null);
+      const incoming = series.samples[metric] || new Array(added).fill(null);
+      cached[metric] = existing.concat(incoming).slice(overflow);
+    });
+    return cached;
+  }
+
+  function bucketSamples(cluster, bucketStat) {
+    const cached = bucketSeries[`${cluster.host}|${bucketStat.name}`];
+    if (cached && cached.timestamp.length) {
+      return cached;
+    }
+    return bucketStat.stats && bucketStat.stats.op
+      ? bucketStat.stats.op.samples
+      : null;
+  }
+
   function loadBucketCharts(cluster, clusterIndex, bucketIndex) {
+    const bucketStat = cluster.bucket_stats[bucketIndex];
+    syncBucketSeries(cluster, bucketStat && bucketStat.name, () =>
+      renderBucketCharts(cluster, clusterIndex, bucketIndex)
+    );
+  }
+
+  function renderBucketCharts(cluster, clusterIndex, bucketIndex) {
     console.log(
       "📊 loadBucketCharts called for cluster:",
       clusterIndex,
@@ -1698,12 +2091,8 @@ $(document).ready(function () {
       bucketIndex
     );
     const bucketStat = cluster.bucket_stats[bucketIndex];
-    if (
-      !bucketStat ||
-      !bucketStat.stats ||
-      !bucketStat.stats.op ||
-      !bucketStat.stats.op.samples
-    ) {
+    const samples = bucketStat ? bucketSamples(cluster, bucketStat) : null;
+    if (!samples) {
       console.log(
         "❌ Invalid bucket stats for cluster:",
         clusterIndex,
@@ -1713,7 +2102,6 @@ $(document).ready(function () {
       return;
     }
 
-    const samples = bucketStat.stats.op.samples;
     const timestamps = samples.timestamp || [];
 
     // Convert timestamps to human-readable time format (HH:MM:SS)
@@ -2819,17 +3207,21 @@ $(document).ready(function () {
       parseInt($(`#bucket-select-${clusterIndex}`).val()) || 0;
     console.log("📈 Updating charts for bucket index:", selectedBucketIndex);
     const bucketStat = cluster.bucket_stats[selectedBucketIndex];
+    if (!bucketStat) {
+      return;
+    }
 
-    if (
-      !bucketStat ||
-      !bucketStat.stats ||
-      !bucketStat.stats.op ||
-      !bucketStat.stats.op.samples
-    ) {
+    syncBucketSeries(cluster, bucketStat.name, () =>
+      applyChartUpdates(cluster, clusterIndex, bucketStat)
+    );
+  }
+
+  function applyChartUpdates(cluster, clusterIndex, bucketStat) {
+    const samples = bucketSamples(cluster, bucketStat);
+    if (!samples) {
       return;
     }
 
-    const samples = bucketStat.stats.op.samples;
     const timestamps = samples.timestamp || [];
     const timeLabels = timestamps.map((ts) => {
       const date = new Date(ts); // Timestamps are already in milliseconds
@@ -3078,6 +3470,7 @@ $(document).ready(function () {
 
   // Poll every 10 seconds
   setInterval(fetchClusters, 10000);
+  setInterval(refreshStaleAges, 10000);
 
   // Index Charts functionality
   let indexData = {};
@@ -3167,26 +3560,47 @@ $(document).ready(function () {
     indexChartsInitialized[clusterIndex] = true;
   }
 
+  const indexPageSize = 100;
+
   function fetchIndexData(cluster, clusterIndex) {
-    $.ajax({
-      url: "/api/indexStatus",
-      method: "GET",
-      success: function (data) {
-        console.log("📊 Index data fetched:", data);
-        // Filter data to only show the current cluster
-        const currentClusterData = data.find(
-          (clusterData) =>
-            clusterData.host === cluster.host ||
-            clusterData.customName === cluster.customName
-        );
+    indexData[clusterIndex] = { host: cluster.host, offset: 0 };
+    loadIndexPage(clusterIndex);
+  }
 
-        if (currentClusterData) {
-          indexData[clusterIndex] = [currentClusterData]; // Make it an array for consistency
-        } else {
-          indexData[clusterIndex] = [];
-        }
+  function indexQueryParams(clusterIndex) {
+    // Filtering, sorting and paging happen server-side in /api/indexes
+    const state = indexData[clusterIndex];
+    const params = {
+      cluster: state.host,
+      offset: state.offset,
+      limit: indexPageSize,
+    };
+    [
+      ["bucket", `#bucket-filter-${clusterIndex}`],
+      ["scope", `#scope-filter-${clusterIndex}`],
+      ["collection", `#collection-filter-${clusterIndex}`],
+    ].forEach(([facet, selector]) => {
+      const value = $(selector).val();
+      if (value && value !== "(All)") {
+        params[facet] = value;
+      }
+    });
+    const viewBy = $(`#view-by-${clusterIndex}`).val();
+    if (viewBy === "No Replicas") {
+      params.numReplica = "0";
+    } else if (viewBy === "Server") {
+      params.sort = "host";
+    }
+    return params;
+  }
 
-        processIndexData(clusterIndex);
+  function loadIndexPage(clusterIndex) {
+    $.ajax({
+      url: "/api/indexes",
+      method: "GET",
+      data: indexQueryParams(clusterIndex),
+      success: function (page) {
+        renderIndexPage(clusterIndex, page);
       },
       error: function (xhr, status, error) {
         console.error("Error fetching index data:", error);
@@ -3199,53 +3613,68 @@ $(document).ready(function () {
     });
   }
 
-  function processIndexData(clusterIndex) {
-    const data = indexData[clusterIndex];
-    if (!data || data.length === 0) {
+  function renderIndexPage(clusterIndex, page) {
+    if (page.error && page.total === 0) {
       $(`#index-display-${clusterIndex}`).html(
         '<div class="alert alert-info">No index data available.</div>'
       );
+      updateIndexTabTitle(clusterIndex, 0);
       return;
     }
 
-    let allIndexes = [];
-    let buckets = new Set();
-    let scopes = new Set();
-    let collections = new Set();
-    let servers = new Set();
-
-    // Process data from all clusters
-    data.forEach((cluster) => {
-      if (cluster.data && cluster.data.indexes) {
-        cluster.data.indexes.forEach((index) => {
-          buckets.add(index.bucket);
-          scopes.add(index.scope);
-          collections.add(index.collection);
-          index.hosts.forEach((host) => servers.add(host));
-
-          // Add server and cluster info to index
-          index.clusterName = cluster.customName || cluster.host;
-          index.serverHost = index.hosts[0]; // Primary host
-          allIndexes.push(index);
-        });
-      }
-    });
+    updateFacetDropdown(`#bucket-filter-${clusterIndex}`, page.facets.bucket);
+    updateFacetDropdown(`#scope-filter-${clusterIndex}`, page.facets.scope);
+    updateFacetDropdown(
+      `#collection-filter-${clusterIndex}`,
+      page.facets.collection
+    );
 
-    // Populate filter dropdowns
-    populateFilterDropdowns(clusterIndex, buckets, scopes, collections);
+    page.indexes.forEach((index) => {
+      index.clusterName = page.customName || page.host;
+      index.serverHost = index.hosts[0]; // Primary host
+    });
+    displayIndexes(
+      clusterIndex,
+      page.indexes,
+      $(`#view-by-${clusterIndex}`).val()
+    );
+    if (page.total > page.indexes.length) {
+      $(`#index-display-${clusterIndex}`).append(renderIndexPager(page));
+    }
 
-    // Store processed data
-    indexData[clusterIndex].processedIndexes = allIndexes;
-    indexData[clusterIndex].buckets = Array.from(buckets);
-    indexData[clusterIndex].scopes = Array.from(scopes);
-    indexData[clusterIndex].collections = Array.from(collections);
-    indexData[clusterIndex].servers = Array.from(servers);
+    updateIndexTabTitle(clusterIndex, page.total);
+  }
 
-    // Display indexes
-    displayIndexes(clusterIndex, allIndexes);
+  function updateFacetDropdown(selector, counts) {
+    // Options are the values the other filters still allow, with their counts
+    const select = $(selector);
+    const current = select.val();
+    select.find('option:not([value="(All)"])').remove();
+    Object.keys(counts || {}).forEach((value) => {
+      select.append(
+        `<option value="${value}">${value} (${counts[value]})</option>`
+      );
+    });
+    select.val(current in (counts || {}) ? current : "(All)");
+  }
 
-    // Update tab title with index count
-    updateIndexTabTitle(clusterIndex, allIndexes.length);
+  function renderIndexPager(page) {
+    const first = page.offset + 1;
+    const last = page.offset + page.indexes.length;
+    const hasPrev = page.offset > 0;
+    const hasNext = last < page.total;
+    return `<div class="index-pager d-flex justify-content-between align-items-center mt-3">
+              <button class="btn btn-sm btn-outline-secondary index-page-link" data-offset="${Math.max(
+                page.offset - page.limit,
+                0
+              )}" ${hasPrev ? "" : "disabled"}>&laquo; Previous</button>
+              <small class="text-muted">Showing ${first}-${last} of ${
+      page.total
+    }</small>
+              <button class="btn btn-sm btn-outline-secondary index-page-link" data-offset="${last}" ${
+      hasNext ? "" : "disabled"
+    }>Next &raquo;</button>
+            </div>`;
   }
 
   function updateIndexTabTitle(clusterIndex, count) {
@@ -3258,165 +3687,31 @@ $(document).ready(function () {
     tabLink.text(`XDCR (${count})`);
   }
 
-  function populateFilterDropdowns(clusterIndex, buckets, scopes, collections) {
-    const bucketSelect = $(`#bucket-filter-${clusterIndex}`);
-    const scopeSelect = $(`#scope-filter-${clusterIndex}`);
-    const collectionSelect = $(`#collection-filter-${clusterIndex}`);
-
-    // Clear existing options (except "All")
-    bucketSelect.find('option:not([value="(All)"])').remove();
-    scopeSelect.find('option:not([value="(All)"])').remove();
-    collectionSelect.find('option:not([value="(All)"])').remove();
-
-    // Add bucket options
-    Array.from(buckets)
-      .sort()
-      .forEach((bucket) => {
-        bucketSelect.append(`<option value="${bucket}">${bucket}</option>`);
-      });
-
-    // Add scope options
-    Array.from(scopes)
-      .sort()
-      .forEach((scope) => {
-        scopeSelect.append(`<option value="${scope}">${scope}</option>`);
-      });
-
-    // Add collection options
-    Array.from(collections)
-      .sort()
-      .forEach((collection) => {
-        collectionSelect.append(
-          `<option value="${collection}">${collection}</option>`
-        );
-      });
-  }
-
   function setupIndexEventHandlers(clusterIndex) {
-    // Filter change handlers
-    $(
-      `#bucket-filter-${clusterIndex}, #scope-filter-${clusterIndex}, #collection-filter-${clusterIndex}, #view-by-${clusterIndex}`
-    ).on("change", function () {
-      filterAndDisplayIndexes(clusterIndex);
-    });
-
-    // Cascading filter logic
+    // Narrower filters reset the ones below them, then reload page one
     $(`#bucket-filter-${clusterIndex}`).on("change", function () {
-      updateCascadingFilters(clusterIndex, "bucket");
+      $(
+        `#scope-filter-${clusterIndex}, #collection-filter-${clusterIndex}`
+      ).val("(All)");
     });
-
     $(`#scope-filter-${clusterIndex}`).on("change", function () {
-      updateCascadingFilters(clusterIndex, "scope");
+      $(`#collection-filter-${clusterIndex}`).val("(All)");
+    });
+    $(
+      `#bucket-filter-${clusterIndex}, #scope-filter-${clusterIndex}, #collection-filter-${clusterIndex}, #view-by-${clusterIndex}`
+    ).on("change", function () {
+      indexData[clusterIndex].offset = 0;
+      loadIndexPage(clusterIndex);
     });
-  }
-
-  function updateCascadingFilters(clusterIndex, changedFilter) {
-    const data = indexData[clusterIndex];
-    if (!data || !data.processedIndexes) return;
-
-    const bucketFilter = $(`#bucket-filter-${clusterIndex}`).val();
-    const scopeFilter = $(`#scope-filter-${clusterIndex}`).val();
-
-    let filteredIndexes = data.processedIndexes;
-
-    // Apply bucket filter
-    if (bucketFilter !== "(All)") {
-      filteredIndexes = filteredIndexes.filter(
-        (index) => index.bucket === bucketFilter
-      );
-    }
-
-    // Update scope dropdown based on bucket selection
-    if (changedFilter === "bucket") {
-      const availableScopes = new Set();
-      filteredIndexes.forEach((index) => availableScopes.add(index.scope));
-
-      const scopeSelect = $(`#scope-filter-${clusterIndex}`);
-      const currentScope = scopeSelect.val();
-      scopeSelect.find('option:not([value="(All)"])').remove();
-
-      Array.from(availableScopes)
-        .sort()
-        .forEach((scope) => {
-          scopeSelect.append(`<option value="${scope}">${scope}</option>`);
-        });
 
-      // Restore selection if still valid
-      if (availableScopes.has(currentScope)) {
-        scopeSelect.val(currentScope);
+    $(`#index-display-${clusterIndex}`).on(
+      "click",
+      ".index-page-link",
+      function () {
+        indexData[clusterIndex].offset = parseInt($(this).data("offset"), 10);
+        loadIndexPage(clusterIndex);
       }
-    }
-
-    // Apply scope filter
-    if (scopeFilter !== "(All)") {
-      filteredIndexes = filteredIndexes.filter(
-        (index) => index.scope === scopeFilter
-      );
-    }
-
-    // Update collection dropdown based on bucket and scope selection
-    const availableCollections = new Set();
-    filteredIndexes.forEach((index) =>
-      availableCollections.add(index.collection)
     );
-
-    const collectionSelect = $(`#collection-filter-${clusterIndex}`);
-    const currentCollection = collectionSelect.val();
-    collectionSelect.find('option:not([value="(All)"])').remove();
-
-    Array.from(availableCollections)
-      .sort()
-      .forEach((collection) => {
-        collectionSelect.append(
-          `<option value="${collection}">${collection}</option>`
-        );
-      });
-
-    // Restore selection if still valid
-    if (availableCollections.has(currentCollection)) {
-      collectionSelect.val(currentCollection);
-    }
-  }
-
-  function filterAndDisplayIndexes(clusterIndex) {
-    const data = indexData[clusterIndex];
-    if (!data || !data.processedIndexes) return;
-
-    const bucketFilter = $(`#bucket-filter-${clusterIndex}`).val();
-    const scopeFilter = $(`#scope-filter-${clusterIndex}`).val();
-    const collectionFilter = $(`#collection-filter-${clusterIndex}`).val();
-    const viewBy = $(`#view-by-${clusterIndex}`).val();
-
-    let filteredIndexes = data.processedIndexes;
-
-    // Apply filters
-    if (bucketFilter !== "(All)") {
-      filteredIndexes = filteredIndexes.filter(
-        (index) => index.bucket === bucketFilter
-      );
-    }
-    if (scopeFilter !== "(All)") {
-      filteredIndexes = filteredIndexes.filter(
-        (index) => index.scope === scopeFilter
-      );
-    }
-    if (collectionFilter !== "(All)") {
-      filteredIndexes = filteredIndexes.filter(
-        (index) => index.collection === collectionFilter
-      );
-    }
-
-    // Apply view by filter
-    if (viewBy === "No Replicas") {
-      filteredIndexes = filteredIndexes.filter(
-        (index) => index.numReplica === 0
-      );
-    }
-
-    displayIndexes(clusterIndex, filteredIndexes, viewBy);
-
-    // Update tab title with filtered count
-    updateIndexTabTitle(clusterIndex, filteredIndexes.length);
   }
 
   function displayIndexes(clusterIndex, indexes, viewBy = "Name") {
@@ -3681,12 +3976,15 @@ $(document).ready(function () {
   let xdcrData = {};
   let xdcrChartsInitialized = {};
 
+  // Replication history pulled incrementally from /api/timeseries, keyed by
+  // host|replication id
+  const xdcrSeries = {};
+  let xdcrTimeseriesSupported = true;
+
   function initializeXDCRCharts(cluster, clusterIndex) {
     if (xdcrChartsInitialized[clusterIndex]) {
-      console.log(
-        "🔄 XDCR charts already initialized for cluster:",
-        clusterIndex
-      );
+      // Refresh the table and append new backlog points on every visit
+      fetchXDCRData(cluster, clusterIndex);
       return;
     }
 
@@ -3754,6 +4052,123 @@ $(document).ready(function () {
     });
   }
 
+  function syncXDCRSeries(cluster, task, done) {
+    const key = `${cluster.host}|${task.id}`;
+    const cached = xdcrSeries[key];
+    const host = cluster.host.replace(/^https?:\/\//, "");
+    const lastTimestamp =
+      cached && cached.timestamp.length
+        ? cached.timestamp[cached.timestamp.length - 1]
+        : null;
+
+    $.ajax({
+      url: `/api/timeseries/${encodeURIComponent(host)}/xdcr/${task.id
+        .split("/")
+        .map(encodeURIComponent)
+        .join("/")}`,
+      method: "GET",
+      data: lastTimestamp !== null ? { since: lastTimestamp } : {},
+      success: function (series) {
+        xdcrSeries[key] = appendSeries(cached, series);
+      },
+      error: function (xhr) {
+        // 503: collector disabled, so there is no history to chart
+        if (xhr.status === 503) {
+          xdcrTimeseriesSupported = false;
+        }
+      },
+      complete: done,
+    });
+  }
+
+  function loadXDCRBacklog(cluster, clusterIndex, xdcrTasks) {
+    const tasks = xdcrTasks.filter((task) => task.id);
+    if (!xdcrTimeseriesSupported || !tasks.length) {
+      $(`#xdcr-backlog-card-${clusterIndex}`).hide();
+      return;
+    }
+    let pending = tasks.length;
+    tasks.forEach((task) =>
+      syncXDCRSeries(cluster, task, () => {
+        pending -= 1;
+        if (pending === 0) {
+          renderXDCRBacklog(cluster, clusterIndex, tasks);
+        }
+      })
+    );
+  }
+
+  function renderXDCRBacklog(cluster, clusterIndex, tasks) {
+    const palette = [
+      "rgb(54, 162, 235)",
+      "rgb(255, 99, 132)",
+      "rgb(75, 192, 192)",
+      "rgb(255, 159, 64)",
+      "rgb(153, 102, 255)",
+    ];
+    // Replications are collected together, so they share timestamps
+    const timestamps = new Set();
+    tasks.forEach((task) => {
+      const samples = xdcrSeries[`${cluster.host}|${task.id}`];
+      (samples ? samples.timestamp : []).forEach((ts) => timestamps.add(ts));
+    });
+    if (!xdcrTimeseriesSupported || !timestamps.size) {
+      $(`#xdcr-backlog-card-${clusterIndex}`).hide();
+      return;
+    }
+    const axis = Array.from(timestamps).sort((a, b) => a - b);
+
+    const datasets = tasks.map((task, i) => {
+      const samples = xdcrSeries[`${cluster.host}|${task.id}`] || {
+        timestamp: [],
+      };
+      const byTime = {};
+      samples.timestamp.forEach((ts, j) => {
+        byTime[ts] = samples.changes_left ? samples.changes_left[j] : null;
+      });
+      const color = palette[i % palette.length];
+      const targetParts = task.target ? task.target.split("/") : [];
+      return {
+        label: `${task.source || "Unknown"} → ${
+          targetParts.length > 4 ? targetParts[4] : "Unknown"
+        }`,
+        data: axis.map((ts) => (ts in byTime ? byTime[ts] : null)),
+        borderColor: color,
+        backgroundColor: color.replace("rgb", "rgba").replace(")", ", 0.2)"),
+        tension: 0.4,
+        spanGaps: true,
+      };
+    });
+
+    $(`#xdcr-backlog-card-${clusterIndex}`).show();
+    createChart(
+      `xdcr-backlog-chart-${clusterIndex}`,
+      {
+        labels: axis.map((ts) =>
+          new Date(ts).toLocaleTimeString("en-US", {
+            hour12: false,
+            hour: "2-digit",
+            minute: "2-digit",
+            second: "2-digit",
+          })
+        ),
+        datasets: datasets,
+      },
+      "Changes Left",
+      { y: { display: true, title: { display: true, text: "Changes Left" } } }
+    );
+  }
+
+  function formatXDCRRate(task, metric, unit) {
+    const value = task.throughput ? task.throughput[metric] : null;
+    if (value == null) {
+      return "";
+    }
+    return `<br><small class="text-muted">${Math.round(
+      value
+    ).toLocaleString()}${unit}</small>`;
+  }
+
   function displayXDCRData(cluster, clusterIndex) {
     const displayArea = $(`#xdcr-display-${clusterIndex}`);
     const data = xdcrData[clusterIndex];
@@ -3930,17 +4345,29 @@ $(document).ready(function () {
                                                    task.changesLeft != null
                                                      ? task.changesLeft.toLocaleString()
                                                      : "N/A"
-                                                 }</td>
+                                                 }${formatXDCRRate(
+                                                   task,
+                                                   "latency_ms",
+                                                   " ms latency"
+                                                 )}</td>
                                                  <td>${
                                                    task.docsWritten != null
                                                      ? task.docsWritten.toLocaleString()
                                                      : "N/A"
-                                                 }</td>
+                                                 }${formatXDCRRate(
+                                                   task,
+                                                   "docs_written_rate",
+                                                   "/s"
+                                                 )}</td>
                                                  <td>${
                                                    task.docsChecked != null
                                                      ? task.docsChecked.toLocaleString()
                                                      : "N/A"
-                                                 }</td>
+                                                 }${formatXDCRRate(
+                                                   task,
+                                                   "docs_checked_rate",
+                                                   "/s"
+                                                 )}</td>
                                                  <td>
                                                      <span class="badge badge-${
                                                        task.continuous
@@ -4026,6 +4453,16 @@ $(document).ready(function () {
                          </div>
                      </div>
                  </div>
+                 <div class="card mt-4" id="xdcr-backlog-card-${clusterIndex}" style="display: none;">
+                     <div class="card-header">
+                         <h6 class="mb-0"><i class="fas fa-chart-line"></i> Backlog Trend (Changes Left)</h6>
+                     </div>
+                     <div class="card-body">
+                         <div style="height: 250px;">
+                             <canvas id="xdcr-backlog-chart-${clusterIndex}"></canvas>
+                         </div>
+                     </div>
+                 </div>
              `;
     } else {
       html += `
@@ -4044,6 +4481,7 @@ $(document).ready(function () {
     }
 
     displayArea.html(html);
+    loadXDCRBacklog(cluster, clusterIndex, xdcrTasks);
 
     // Add click handler for error badges
     $(document).off('click', '.clickable-errors').on('click', '.clickable-errors', function() {
@@ -0,0 +1,33 @@
+import os
+import sys
+
+import pytest
+
+# Add the parent directory to the path so we can import app
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app as app_module  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def fresh_config_store():
+    """Each test sees its own (usually patched) load_config, not a cached one."""
+    app_module.config_store.invalidate()
+    yield
+    app_module.config_store.invalidate()
+
+
+@pytest.fixture(autouse=True)
+def fresh_upstream_state():
+    """Failures or data mocked in one test must not leak into the next."""
+    app_module.upstream_health.reset()
+    app_module.upstream_metrics.reset()
+    app_module.last_good_clusters.clear()
+    app_module.index_status_cache.clear()
+    app_module.index_catalogs.clear()
+    yield
+    app_module.upstream_health.reset()
+    app_module.upstream_metrics.reset()
+    app_module.last_good_clusters.clear()
+    app_module.index_status_cache.clear()
+    app_module.index_catalogs.clear()
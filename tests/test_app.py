@@ -1,6 +1,10 @@
 import pytest
 import asyncio
 import json
+import ssl
+import base64
+import math
+from array import array
 import sys
 import os
 from unittest.mock import Mock, patch, AsyncMock
@@ -16,8 +20,45 @@ from app import (
     get_all_clusters_data,
     create_not_watching_result,
     process_cluster_data,
+    LastGoodClusters,
     load_config,
     fetch_cluster_data_with_timeout,
+    validate_config,
+    ClusterCollector,
+    ClusterSnapshot,
+    RefreshSchedule,
+    resolve_cadences,
+    diff_cluster,
+    build_clusters_delta,
+    RingBuffer,
+    TimeSeriesStore,
+    MetricProjection,
+    stats_projection,
+    encode_samples_columnar,
+    encode_clusters_payload,
+    JSONCodec,
+    ConfigStore,
+    AsyncRuntime,
+    TLSContextRegistry,
+    tls_registry,
+    RequestScheduler,
+    CircuitBreaker,
+    CircuitOpenError,
+    LatencyTracker,
+    upstream_health,
+    upstream_metrics,
+    Histogram,
+    fetch_index_status,
+    IndexStatusCache,
+    IndexCatalog,
+    PrometheusExporter,
+    DEFAULT_BREAKER_FAILURE_THRESHOLD,
+    LATENCY_MIN_SAMPLES,
+    PoolsWatcher,
+    fetch_cluster_data_longpoll,
+    fetch_cluster_pipeline,
+    ClusterInfo,
+    encode_cluster_list,
 )
 
 
@@ -188,6 +229,399 @@ class TestFetchBucketStats:
         assert result["error"] == "Timeout error"
 
 
+class TestMetricProjection:
+    """Test cases for the bucket stats metric allowlist"""
+
+    def test_projection_keeps_allowlisted_samples(self):
+        """Unlisted sample series and top-level sections are dropped"""
+        projection = MetricProjection(["ops"])
+        stats = {
+            "op": {
+                "samples": {"timestamp": [1], "ops": [2], "ep_unused": [3]},
+                "samplesCount": 1,
+            },
+            "hot_keys": [{"name": "k"}],
+        }
+
+        assert projection.apply(stats) == {
+            "op": {"samples": {"timestamp": [1], "ops": [2]}, "samplesCount": 1}
+        }
+
+    def test_projection_disabled_passes_through(self):
+        """metrics=None keeps the full document"""
+        stats = {"op": {"samples": {"anything": [1]}}, "hot_keys": []}
+
+        assert MetricProjection(None).apply(stats) is stats
+
+    def test_projection_keeps_replication_series(self):
+        """Per-replication XDCR stats survive any allowlist"""
+        stats = {"op": {"samples": {"replications/r1/a/b/changes_left": [4]}}}
+
+        assert MetricProjection(["ops"]).apply(stats) == stats
+
+    @pytest.mark.asyncio
+    async def test_fetch_bucket_stats_applies_projection(self):
+        """fetch_bucket_stats drops series outside the global allowlist"""
+        mock_session = Mock()
+        mock_response = Mock()
+        mock_response.status = 200
+        mock_response.json = AsyncMock(
+            return_value={"op": {"samples": {"cmd_get": [1], "not_charted": [2]}}}
+        )
+        mock_session.get.return_value.__aenter__ = AsyncMock(return_value=mock_response)
+        mock_session.get.return_value.__aexit__ = AsyncMock(return_value=None)
+
+        result = await fetch_bucket_stats(
+            mock_session, "http://localhost:8091", "b", "admin", "password"
+        )
+
+        assert result["stats"]["op"]["samples"] == {"cmd_get": [1]}
+        assert stats_projection.metrics is not None
+
+    def test_validate_stats_metrics(self):
+        """stats.metrics must be "*" or a list of names"""
+        base = {
+            "logging": {"level": "info", "file": "logs/app.log", "enabled": False},
+            "clusters": [{"host": "http://h:8091", "user": "u", "pass": "p"}],
+        }
+
+        assert validate_config({**base, "stats": {"metrics": "*"}}) == []
+        assert validate_config({**base, "stats": {"metrics": ["ops"]}}) == []
+        assert validate_config({**base, "stats": {"metrics": "ops"}}) != []
+
+
+class TestColumnarSamples:
+    """Test cases for the float32 columnar samples wire format"""
+
+    @staticmethod
+    def _unpack(typecode, text):
+        values = array(typecode)
+        values.frombytes(base64.b64decode(text))
+        if sys.byteorder != "little":
+            values.byteswap()
+        return values.tolist()
+
+    def test_encode_round_trip(self):
+        """Timestamps are delta-encoded and metrics packed metric-major"""
+        encoded = encode_samples_columnar(
+            {
+                "timestamp": [1700000000000, 1700000001000, 1700000003000],
+                "ops": [1.5, 2, None],
+                "mem_used": [10, 20],
+            }
+        )
+
+        assert encoded["count"] == 3
+        assert encoded["t0"] == 1700000000000
+        assert self._unpack("i", encoded["dt"]) == [1000, 2000]
+        assert encoded["metrics"] == ["ops", "mem_used"]
+        values = self._unpack("f", encoded["values"])
+        assert values[:2] == [1.5, 2.0]
+        assert values[3:5] == [10.0, 20.0]
+        assert math.isnan(values[2]) and math.isnan(values[5])
+
+    def test_encode_delta_payload_patches(self):
+        """Delta {position: item} bucket_stats patches are encoded too"""
+        bucket_stat = {
+            "name": "b",
+            "stats": {"op": {"samples": {"timestamp": [1], "ops": [2]}, "x": 1}},
+        }
+        payload = {
+            "version": "v",
+            "full": False,
+            "clusters": {"0": {"changes": {"bucket_stats": {"1": bucket_stat}}}},
+        }
+
+        encoded = encode_clusters_payload(payload)
+
+        op = encoded["clusters"]["0"]["changes"]["bucket_stats"]["1"]["stats"]["op"]
+        assert "samples" not in op
+        assert op["x"] == 1
+        assert op["samplesColumnar"]["metrics"] == ["ops"]
+        # The snapshot's own data is left untouched
+        assert "samples" in bucket_stat["stats"]["op"]
+
+
+class TestJSONCodec:
+    """Test cases for the pluggable JSON codec"""
+
+    payload = {"b": [1, 2.5, None], "a": {"name": "café"}, "nested": [{"x": True}]}
+
+    def test_stdlib_codec_round_trip(self):
+        """The stdlib codec encodes to compact UTF-8 bytes"""
+        codec = JSONCodec("json")
+
+        encoded = codec.dumps(self.payload, sort_keys=True)
+
+        assert encoded.startswith(b'{"a":{"name":"caf\xc3\xa9"}')
+        assert codec.loads(encoded) == self.payload
+
+    def test_orjson_codec_matches_stdlib(self):
+        """orjson produces the same document as the stdlib codec"""
+        pytest.importorskip("orjson")
+        fast, stdlib = JSONCodec("orjson"), JSONCodec("json")
+
+        assert fast.dumps(self.payload, sort_keys=True) == stdlib.dumps(
+            self.payload, sort_keys=True
+        )
+        assert fast.loads(stdlib.dumps(self.payload)) == self.payload
+
+    @pytest.mark.asyncio
+    async def test_fetch_decodes_with_codec(self):
+        """Upstream responses are decoded with the active codec"""
+        mock_session = Mock()
+        mock_response = Mock()
+        mock_response.status = 200
+        mock_response.json = AsyncMock(return_value={"clusterName": "c"})
+        mock_session.get.return_value.__aenter__ = AsyncMock(return_value=mock_response)
+        mock_session.get.return_value.__aexit__ = AsyncMock(return_value=None)
+
+        await fetch_cluster_data(mock_session, "http://localhost:8091", "a", "p")
+
+        loads = mock_response.json.call_args.kwargs["loads"]
+        assert loads('{"x": 1}') == {"x": 1}
+
+
+class TestLastGoodClusters:
+    """Test cases for LastGoodClusters"""
+
+    def _info(self, error=None, bucket_stats=()):
+        return {
+            "host": "http://localhost:8091",
+            "customName": "First",
+            "clusterName": "Error" if error else "Production",
+            "buckets": [],
+            "bucket_stats": list(bucket_stats),
+            "error": error,
+        }
+
+    def test_error_without_good_state_passes_through(self):
+        """Clusters that never succeeded still show their error"""
+        cache = LastGoodClusters()
+
+        info = cache.apply(self._info(error="refused"))
+
+        assert info["clusterName"] == "Error"
+        assert "stale" not in info
+
+    def test_error_returns_last_good_state_with_age(self):
+        """Errors serve the last good state with stale metadata"""
+        now = [1000.0]
+        cache = LastGoodClusters(clock=lambda: now[0])
+        cache.apply(self._info())
+        now[0] += 42.7
+
+        info = cache.apply(self._info(error="refused"))
+
+        assert info["clusterName"] == "Production"
+        assert info["error"] is None
+        assert info["stale"] is True
+        assert info["collected_at"] == 1000
+        now[0] += 10
+        assert cache.apply(self._info(error="refused")) == info
+        assert info["stale_error"] == "refused"
+
+        fresh = cache.apply(self._info())
+        assert "stale" not in fresh
+
+    def test_failed_bucket_stats_keep_last_good_entry(self):
+        """A bucket whose stats failed keeps its previous stats, marked stale"""
+        cache = LastGoodClusters()
+        good_stats = {"name": "beer", "stats": {"op": {}}, "error": None}
+        cache.apply(self._info(bucket_stats=[good_stats]))
+
+        info = cache.apply(
+            self._info(
+                bucket_stats=[
+                    {"name": "beer", "stats": None, "error": "Failed with status 500"}
+                ]
+            )
+        )
+
+        assert info["bucket_stats"][0]["stats"] == {"op": {}}
+        assert info["bucket_stats"][0]["stale"] is True
+        assert info["bucket_stats"][0]["error"] is None
+
+    def test_not_watching_forgets_last_good_state(self):
+        """Unwatching a cluster drops its stored state"""
+        cache = LastGoodClusters()
+        cache.apply(self._info())
+        cache.apply(dict(self._info(), not_watching=True))
+
+        info = cache.apply(self._info(error="refused"))
+
+        assert info["clusterName"] == "Error"
+
+
+class TestIndexStatusCache:
+    """Test cases for IndexStatusCache"""
+
+    @pytest.mark.asyncio
+    async def test_results_are_shared_until_ttl_expires(self):
+        """Concurrent and repeated gets share one fetch until the TTL passes"""
+        now = [0.0]
+        cache = IndexStatusCache(ttl=10, clock=lambda: now[0])
+        cluster = {"host": "http://a:8091", "user": "u", "pass": "p"}
+        fetch = AsyncMock(return_value={"host": "http://a:8091", "data": {}})
+
+        with patch("app.fetch_index_status", fetch):
+            await asyncio.gather(cache.get(None, cluster), cache.get(None, cluster))
+            now[0] = 9
+            await cache.get(None, cluster)
+            assert fetch.await_count == 1
+
+            now[0] = 20
+            await cache.get(None, cluster)
+
+        assert fetch.await_count == 2
+
+
+class TestIndexCatalog:
+    """Test cases for the faceted IndexCatalog"""
+
+    def _catalog(self):
+        def index(name, bucket, scope, host, status="Ready", replicas=1):
+            return {
+                "indexName": name,
+                "bucket": bucket,
+                "scope": scope,
+                "collection": "_default",
+                "hosts": [host],
+                "status": status,
+                "numReplica": replicas,
+            }
+
+        return IndexCatalog(
+            [
+                index("idx_b", "travel", "inventory", "n2:8091"),
+                index("#primary", "beer", "_default", "n1:8091", replicas=0),
+                index("idx_a", "travel", "_default", "n1:8091", status="Created"),
+                index("idx_c", "travel", "inventory", "n1:8091"),
+            ]
+        )
+
+    def test_filters_sort_and_paginate(self):
+        """Filters intersect, results are sorted by name and paged"""
+        result = self._catalog().query(
+            {"bucket": "travel", "host": "n1:8091"}, offset=0, limit=1
+        )
+
+        assert result["total"] == 2
+        assert [i["indexName"] for i in result["indexes"]] == ["idx_a"]
+
+    def test_facet_counts_ignore_their_own_filter(self):
+        """A facet's counts apply every other filter, but not its own"""
+        result = self._catalog().query({"bucket": "travel", "scope": "inventory"})
+
+        assert result["facets"]["bucket"] == {"travel": 2}
+        assert result["facets"]["scope"] == {"_default": 1, "inventory": 2}
+        assert result["facets"]["host"] == {"n1:8091": 1, "n2:8091": 1}
+
+    def test_text_numeric_facets_and_descending_sort(self):
+        """Name search, string-matched numReplica and other sort keys"""
+        catalog = self._catalog()
+
+        no_replica = catalog.query({"numReplica": "0"})
+        by_host = catalog.query(sort="host", descending=True)
+        searched = catalog.query(text="IDX_")
+
+        assert [i["indexName"] for i in no_replica["indexes"]] == ["#primary"]
+        assert by_host["indexes"][0]["hosts"] == ["n2:8091"]
+        assert searched["total"] == 3
+
+
+class TestPrometheusExporter:
+    """Test cases for the /metrics text exposition renderer"""
+
+    def cluster(self, **overrides):
+        cluster = {
+            "host": "http://h:8091",
+            "customName": 'Prod "A"',
+            "clusterName": "prod",
+            "health": True,
+            "memory": {"total": 2, "used": 1, "quotaTotal": 1},
+            "disk": {"total": 4, "used": 1, "free": 3},
+            "nodes": [
+                {
+                    "hostname": "n1:8091",
+                    "status": "healthy",
+                    "cpu_utilization": 12.5,
+                    "memory_total": 2,
+                    "memory_free": 1,
+                }
+            ],
+            "buckets": [
+                {
+                    "name": "travel",
+                    "quotaPercentUsed": 40,
+                    "opsPerSec": 100,
+                    "diskFetches": 0,
+                    "error": None,
+                },
+                {"name": "broken", "error": "boom", "opsPerSec": 0},
+            ],
+            "error": None,
+        }
+        cluster.update(overrides)
+        return cluster
+
+    def test_render_groups_families_and_escapes_labels(self):
+        """Each family has one HELP/TYPE header followed by all its samples"""
+        other = self.cluster(host="http://other:8091", customName=None)
+        body = PrometheusExporter().render([self.cluster(), other]).decode()
+        lines = body.splitlines()
+
+        labels = 'cluster="http://h:8091",cluster_name="Prod \\"A\\""'
+        assert f"couchbase_cluster_up{{{labels}}} 1" in lines
+        assert f"couchbase_cluster_memory_total_bytes{{{labels}}} 2147483648" in lines
+        assert (
+            f'couchbase_node_status{{{labels},node="n1:8091",status="healthy"}} 1'
+            in lines
+        )
+        bucket = f'{labels},bucket="travel"'
+        assert f"couchbase_bucket_ops_per_second{{{bucket}}} 100" in lines
+        assert 'bucket="broken"' not in body
+        assert 'cluster_name="prod"' in body
+        assert lines.count("# TYPE couchbase_cluster_up gauge") == 1
+        up = [
+            i for i, line in enumerate(lines) if line.startswith("couchbase_cluster_up")
+        ]
+        assert up == [up[0], up[0] + 1]
+
+    def test_unchanged_clusters_are_not_rendered_again(self):
+        """Fragments are reused while the published entry is the same object"""
+        exporter = PrometheusExporter()
+        cluster = self.cluster()
+        exporter.render([cluster])
+
+        with patch.object(exporter, "_render_cluster") as render_cluster:
+            exporter.render([cluster])
+            render_cluster.assert_not_called()
+            render_cluster.return_value = exporter._fragments[cluster["host"]][1]
+            exporter.render([self.cluster()])
+            assert render_cluster.call_count == 1
+
+    def test_failed_and_unwatched_clusters_only_report_state(self):
+        """Clusters without data expose up/watched gauges but no sizes"""
+        body = (
+            PrometheusExporter()
+            .render(
+                [
+                    self.cluster(error="Timeout"),
+                    {"host": "http://idle:8091", "not_watching": True},
+                ]
+            )
+            .decode()
+        )
+
+        assert 'couchbase_cluster_up{cluster="http://h:8091"' in body
+        assert "couchbase_cluster_memory_total_bytes" not in body
+        assert (
+            'couchbase_cluster_watched{cluster="http://idle:8091",'
+            'cluster_name="http://idle:8091"} 0' in body
+        )
+
+
 class TestCreateNotWatchingResult:
     """Test cases for create_not_watching_result function"""
 
@@ -275,6 +709,126 @@ class TestGetAllClustersData:
             assert not result[0].get("not_watching", False)
 
 
+class TestFetchClusterPipeline:
+    """Test cases for the per-cluster concurrent fetch pipeline"""
+
+    @pytest.mark.asyncio
+    async def test_clusters_and_bucket_calls_run_concurrently(self):
+        """Refresh time tracks the slowest cluster, not the sum of clusters"""
+        clusters = [
+            {"host": f"http://node{i}:8091", "user": "admin", "pass": "password"}
+            for i in range(5)
+        ]
+
+        async def slow_cluster(session, cluster_config, timeout_seconds):
+            await asyncio.sleep(0.1)
+            return {
+                "host": cluster_config["host"],
+                "data": {"bucketNames": [{"bucketName": "b1"}]},
+                "error": None,
+            }
+
+        async def slow_bucket(session, host, bucket_name, user, password):
+            await asyncio.sleep(0.1)
+            return {"bucket_name": bucket_name, "data": {}, "error": None}
+
+        async def slow_stats(session, host, bucket_name, user, password):
+            await asyncio.sleep(0.1)
+            return {"bucket_name": bucket_name, "stats": {}, "error": None}
+
+        with patch("app.fetch_cluster_data_with_timeout", slow_cluster), patch(
+            "app.fetch_bucket_data", slow_bucket
+        ), patch("app.fetch_bucket_stats", slow_stats):
+            started = asyncio.get_running_loop().time()
+            results = await get_all_clusters_data(clusters, session=Mock())
+            elapsed = asyncio.get_running_loop().time() - started
+
+        # Serial would be 5 x (pools + details + stats) = 1.5s
+        assert elapsed < 0.5
+        assert [r["host"] for r in results] == [c["host"] for c in clusters]
+        assert all(len(r["buckets"]) == 1 for r in results)
+        assert all(len(r["bucket_stats"]) == 1 for r in results)
+
+
+class TestPoolsWatcher:
+    """Test cases for etag/waitChange long-polling of /pools/default"""
+
+    cluster = {"host": "http://localhost:8091", "user": "admin", "pass": "password"}
+
+    @pytest.mark.asyncio
+    async def test_watcher_tracks_etag_changes(self):
+        """Only a new etag counts as a change; every response refreshes latest"""
+        responses = [
+            {"etag": "1", "rev": 1},
+            {"etag": "1", "rev": 2},
+            {"etag": "2", "rev": 3},
+        ]
+        calls = []
+
+        async def longpoll(session, host, user, password, etag, wait_change):
+            calls.append(etag)
+            if not responses:
+                await asyncio.sleep(3600)
+            return {"host": host, "data": responses.pop(0), "error": None}
+
+        watcher = PoolsWatcher(self.cluster, wait_change=5000)
+        with patch("app.fetch_cluster_data_longpoll", longpoll):
+            task = asyncio.ensure_future(watcher.run(Mock()))
+            await asyncio.sleep(0.05)
+            task.cancel()
+
+        assert calls == [None, "1", "1", "2"]
+        assert watcher.changes == 2
+        assert watcher.etag == "2"
+        assert (await watcher.current())["data"]["rev"] == 3
+
+    @pytest.mark.asyncio
+    async def test_watcher_falls_back_without_etag(self):
+        """Servers without etag support make the watcher hand back to polling"""
+
+        async def longpoll(session, host, user, password, etag, wait_change):
+            return {"host": host, "data": {"nodes": []}, "error": None}
+
+        watcher = PoolsWatcher(self.cluster)
+        with patch("app.fetch_cluster_data_longpoll", longpoll):
+            await watcher.run(Mock())
+
+        assert watcher.supported is False
+        assert await watcher.current() is None
+
+    @pytest.mark.asyncio
+    async def test_longpoll_sends_etag_and_wait_change(self):
+        """The long-poll request carries etag/waitChange and skips the scheduler"""
+        mock_session = Mock()
+        mock_response = Mock()
+        mock_response.status = 200
+        mock_response.json = AsyncMock(return_value={"etag": "7"})
+        mock_session.get.return_value.__aenter__ = AsyncMock(return_value=mock_response)
+        mock_session.get.return_value.__aexit__ = AsyncMock(return_value=None)
+
+        result = await fetch_cluster_data_longpoll(
+            mock_session, "http://localhost:8091", "admin", "password", "6", 20000
+        )
+
+        assert result["data"] == {"etag": "7"}
+        kwargs = mock_session.get.call_args.kwargs
+        assert kwargs["params"] == {"waitChange": "20000", "etag": "6"}
+        assert kwargs["timeout"] > 20
+
+    @pytest.mark.asyncio
+    async def test_pipeline_reuses_provided_cluster_result(self):
+        """A watcher-supplied /pools/default result replaces the pipeline's fetch"""
+        provided = {"host": self.cluster["host"], "data": {"etag": "1"}, "error": None}
+        fetch = AsyncMock()
+
+        with patch("app.fetch_cluster_data_with_timeout", fetch):
+            result = await fetch_cluster_pipeline(Mock(), self.cluster, provided)
+
+        fetch.assert_not_called()
+        assert result["data"] == {"etag": "1"}
+        assert result["buckets"] == []
+
+
 class TestProcessClusterData:
     """Test cases for process_cluster_data function"""
 
@@ -363,6 +917,95 @@ class TestProcessClusterData:
         assert cluster["error"] == "Connection timeout"
 
 
+class TestClusterInfo:
+    """Test cases for the slot-based processed cluster records"""
+
+    def cluster(self, **data):
+        return {
+            "host": "http://localhost:8091",
+            "customName": "Test Cluster",
+            "data": {
+                "clusterName": "Production",
+                "uuid": "12345",
+                "nodes": [
+                    {
+                        "hostname": "n1:8091",
+                        "status": "healthy",
+                        "services": ["kv"],
+                        "systemStats": {"cpu_utilization_rate": 12.5},
+                        "memoryTotal": 2 * 1024**3,
+                        "memoryFree": 1024**3,
+                        "version": "7.2.0",
+                    }
+                ],
+                "storageTotals": {"ram": {"total": 1024**3}, "hdd": {}},
+                **data,
+            },
+            "buckets": [
+                {
+                    "bucket_name": "b",
+                    "data": {"name": "b", "basicStats": {"opsPerSec": 7}},
+                    "error": None,
+                }
+            ],
+            "bucket_stats": [{"bucket_name": "b", "stats": {"op": {}}, "error": None}],
+            "error": None,
+        }
+
+    def test_records_compare_equal_to_plain_dicts(self):
+        """Records are read-only mappings that equal the dicts they replace"""
+        info = ClusterInfo(self.cluster())
+
+        assert info["nodes"][0] == {
+            "hostname": "n1:8091",
+            "status": "healthy",
+            "services": ["kv"],
+            "cpu_utilization": 12.5,
+            "memory_total": 2.0,
+            "memory_free": 1.0,
+            "version": "7.2.0",
+        }
+        assert info["buckets"][0]["opsPerSec"] == 7
+        assert dict(info) == info
+        assert "not_watching" not in info
+        with pytest.raises(TypeError):
+            info["health"] = False
+
+    def test_json_matches_dict_serialization(self):
+        """Cached bytes decode to the same document as the record's dict form"""
+        info = ClusterInfo(self.cluster())
+
+        encoded = info.json_bytes()
+
+        assert info.json_bytes() is encoded
+        assert json.loads(encoded) == json.loads(json.dumps(dict(info), default=dict))
+        assert json.loads(encode_cluster_list([info, {"host": "raw"}])) == [
+            json.loads(encoded),
+            {"host": "raw"},
+        ]
+
+    def test_refreshed_rebuilds_only_requested_bucket_kinds(self):
+        """Unchanged pools data is shared; refreshed bucket stats are rebuilt"""
+        info = ClusterInfo(self.cluster())
+        cluster = self.cluster()
+        cluster["bucket_stats"][0]["stats"] = {"op": {"samples": {}}}
+
+        copy = info.refreshed(cluster, ("stats",))
+
+        assert copy["nodes"] is info["nodes"]
+        assert copy["buckets"] is info["buckets"]
+        assert copy["bucket_stats"][0]["stats"] == {"op": {"samples": {}}}
+        assert info["bucket_stats"][0]["stats"] == {"op": {}}
+
+    def test_cluster_without_nodes_has_empty_system_stats(self):
+        """A cluster reporting no nodes is processed instead of raising"""
+        info = ClusterInfo(self.cluster(nodes=[]))
+
+        assert info["nodes"] == []
+        assert info["systemStats"] == {}
+        assert info["health"] is True
+
+
 class TestLoadConfig:
     """Test cases for load_config function"""
 
@@ -453,5 +1096,994 @@ class TestFetchClusterDataWithTimeout:
             assert "timeout after 10 seconds" in result["error"]
 
 
+class TestClusterCollector:
+    """Test cases for the background ClusterCollector"""
+
+    def _clusters(self):
+        return [
+            {
+                "host": "http://localhost:8091",
+                "user": "admin",
+                "pass": "password",
+                "customName": "First",
+            },
+            {
+                "host": "http://localhost:8092",
+                "user": "admin",
+                "pass": "password",
+                "watch": False,
+            },
+            {
+                "host": "http://localhost:8093",
+                "user": "admin",
+                "pass": "password",
+            },
+        ]
+
+    def test_unwatched_clusters_are_seeded(self):
+        """Unwatched clusters appear in the snapshot without any fetch"""
+        collector = ClusterCollector(self._clusters())
+
+        snapshot = collector.snapshot
+        assert snapshot.version == 1
+        assert len(snapshot.clusters) == 1
+        assert snapshot.clusters[0]["not_watching"] is True
+        assert snapshot.index_status == ()
+        assert snapshot.xdcr_status == ()
+
+    def test_publish_keeps_config_order_and_bumps_version(self):
+        """Published clusters are ordered as in config and versioned"""
+        collector = ClusterCollector(self._clusters())
+
+        collector.publish(
+            "http://localhost:8093",
+            {"host": "http://localhost:8093"},
+            {"host": "http://localhost:8093", "data": None, "error": None},
+            {"host": "http://localhost:8093", "error": None},
+        )
+        assert not collector._ready.is_set()
+
+        collector.publish(
+            "http://localhost:8091",
+            {"host": "http://localhost:8091"},
+            {"host": "http://localhost:8091", "data": None, "error": None},
+            {"host": "http://localhost:8091", "error": None},
+        )
+
+        snapshot = collector.wait_for_snapshot(timeout=0)
+        assert snapshot.version == 3
+        assert [c["host"] for c in snapshot.clusters] == [
+            "http://localhost:8091",
+            "http://localhost:8092",
+            "http://localhost:8093",
+        ]
+        assert [e["host"] for e in snapshot.index_status] == [
+            "http://localhost:8091",
+            "http://localhost:8093",
+        ]
+        assert collector._ready.is_set()
+
+    def test_snapshot_is_immutable(self):
+        """Snapshots cannot be modified after publication"""
+        snapshot = ClusterSnapshot(1, 0, [], [], [])
+
+        with pytest.raises(AttributeError):
+            snapshot.version = 2
+
+    @pytest.mark.asyncio
+    async def test_collect_cluster_publishes_processed_data(self):
+        """collect_cluster fetches cluster, index and XDCR data and publishes it"""
+        cluster = self._clusters()[0]
+        collector = ClusterCollector([cluster])
+
+        with patch("app.fetch_pools_result") as mock_pools, patch(
+            "app.fetch_cluster_pipeline"
+        ) as mock_pipeline, patch("app.fetch_index_status") as mock_index, patch(
+            "app.fetch_xdcr_data"
+        ) as mock_xdcr:
+            mock_pools.return_value = {"host": cluster["host"], "data": {}}
+            mock_pipeline.return_value = {
+                "host": cluster["host"],
+                "customName": "First",
+                "data": {
+                    "clusterName": "Production",
+                    "nodes": [{"status": "healthy"}],
+                },
+                "error": None,
+                "buckets": [],
+                "bucket_stats": [],
+            }
+            mock_index.return_value = {
+                "host": cluster["host"],
+                "data": {"indexes": []},
+                "error": None,
+            }
+            mock_xdcr.side_effect = Exception("XDCR unavailable")
+
+            await collector.collect_cluster(None, cluster)
+
+        snapshot = collector.snapshot
+        assert snapshot.clusters[0]["clusterName"] == "Production"
+        assert snapshot.index_status[0]["data"] == {"indexes": []}
+        assert snapshot.index_status[0]["customName"] == "First"
+        assert snapshot.xdcr_status[0]["error"] == "XDCR unavailable"
+        assert snapshot.xdcr_status[0]["xdcrTasks"] == []
+
+    @pytest.mark.asyncio
+    async def test_collect_cluster_serves_last_good_data_on_failure(self):
+        """A failed refresh keeps the previous data, flagged as stale"""
+        cluster = self._clusters()[0]
+        collector = ClusterCollector([cluster])
+        good = {
+            "host": cluster["host"],
+            "customName": "First",
+            "data": {"clusterName": "Production", "nodes": [{"status": "healthy"}]},
+            "error": None,
+            "buckets": [],
+            "bucket_stats": [],
+        }
+        failed = dict(good, data=None, error="Timeout or error: timed out")
+
+        with patch("app.fetch_pools_result") as mock_pools, patch(
+            "app.fetch_cluster_pipeline"
+        ) as mock_pipeline, patch("app.fetch_index_status") as mock_index, patch(
+            "app.fetch_xdcr_data"
+        ) as mock_xdcr:
+            mock_pools.return_value = {"host": cluster["host"], "data": {}}
+            mock_index.side_effect = Exception("unavailable")
+            mock_xdcr.side_effect = Exception("unavailable")
+            mock_pipeline.return_value = good
+            await collector.collect_cluster(None, cluster)
+            mock_pipeline.return_value = failed
+            await collector.collect_cluster(None, cluster)
+
+        cluster_info = collector.snapshot.clusters[0]
+        assert cluster_info["clusterName"] == "Production"
+        assert cluster_info["error"] is None
+        assert cluster_info["stale"] is True
+        assert cluster_info["stale_error"] == "Timeout or error: timed out"
+
+    def test_resolve_cadences_falls_back_per_class(self):
+        """Cluster cadences win over collector cadences, then refreshInterval"""
+        cluster = {
+            "host": "http://localhost:8091",
+            "refreshInterval": 5,
+            "cadences": {"index": 60},
+        }
+
+        cadences = resolve_cadences(cluster, {"buckets": 300, "index": 30}, 10)
+
+        assert cadences == {
+            "pools": 5,
+            "buckets": 300,
+            "stats": 5,
+            "index": 60,
+            "xdcr": 5,
+        }
+
+    def test_refresh_schedule_tracks_due_classes(self):
+        """Classes come due on their own cadence"""
+        now = [0.0]
+        schedule = RefreshSchedule(
+            {"pools": 10, "buckets": 300, "stats": 10, "index": 30, "xdcr": 30},
+            clock=lambda: now[0],
+        )
+
+        assert schedule.take_due() == {"pools", "buckets", "stats", "index", "xdcr"}
+        assert schedule.delay() == 10
+        now[0] = 10
+        assert schedule.take_due() == {"pools", "stats"}
+        now[0] = 30
+        assert schedule.take_due() == {"pools", "stats", "index", "xdcr"}
+
+    @pytest.mark.asyncio
+    async def test_collect_cluster_only_fetches_due_classes(self):
+        """Bucket details on a slow cadence are reused until due or a bucket appears"""
+        cluster = dict(self._clusters()[0], cadences={"buckets": 300})
+        collector = ClusterCollector([cluster])
+        now = [0.0]
+        schedule = RefreshSchedule(
+            resolve_cadences(cluster, interval=10), clock=lambda: now[0]
+        )
+        pools = {
+            "host": cluster["host"],
+            "data": {
+                "nodes": [{"status": "healthy"}],
+                "bucketNames": [{"bucketName": "beer"}],
+            },
+            "error": None,
+        }
+
+        async def bucket_data(session, host, name, user, password):
+            return {
+                "bucket_name": name,
+                "data": {"bucketType": "membase"},
+                "error": None,
+            }
+
+        async def bucket_stats(session, host, name, user, password):
+            return {"bucket_name": name, "stats": {"op": {}}, "error": None}
+
+        with patch("app.fetch_pools_result", AsyncMock(return_value=pools)), patch(
+            "app.fetch_bucket_data", side_effect=bucket_data
+        ) as mock_data, patch(
+            "app.fetch_bucket_stats", side_effect=bucket_stats
+        ) as mock_stats, patch(
+            "app.fetch_index_status"
+        ) as mock_index, patch(
+            "app.fetch_xdcr_data"
+        ) as mock_xdcr:
+            mock_index.side_effect = Exception("unavailable")
+            mock_xdcr.side_effect = Exception("unavailable")
+            await collector.collect_cluster(None, cluster, schedule=schedule)
+            now[0] = 10
+            await collector.collect_cluster(None, cluster, schedule=schedule)
+
+            assert mock_data.call_count == 1
+            assert mock_stats.call_count == 2
+            assert mock_index.call_count == 2
+            assert collector.snapshot.clusters[0]["buckets"][0]["name"] == "beer"
+
+            # A new bucket gets its details right away
+            pools["data"]["bucketNames"].append({"bucketName": "travel"})
+            now[0] = 20
+            await collector.collect_cluster(None, cluster, schedule=schedule)
+
+        assert mock_data.call_count == 3
+        assert [b["name"] for b in collector.snapshot.clusters[0]["buckets"]] == [
+            "beer",
+            "travel",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_collect_cluster_reuses_record_for_unchanged_document(self):
+        """The same long-poll document isn't processed twice; a new one always is"""
+        cluster = dict(self._clusters()[0], cadences={"buckets": 300, "stats": 300})
+        collector = ClusterCollector([cluster])
+        now = [0.0]
+        schedule = RefreshSchedule(
+            resolve_cadences(cluster, interval=10), clock=lambda: now[0]
+        )
+
+        def document(cpu):
+            node = {"status": "healthy", "systemStats": {"cpu_utilization_rate": cpu}}
+            return {
+                "host": cluster["host"],
+                "data": {"etag": "1", "nodes": [node]},
+                "error": None,
+            }
+
+        watcher = Mock()
+        watcher.current = AsyncMock(return_value=document(10))
+
+        with patch("app.fetch_index_status") as mock_index, patch(
+            "app.fetch_xdcr_data"
+        ) as mock_xdcr, patch(
+            "app.process_cluster_data", wraps=process_cluster_data
+        ) as mock_process:
+            mock_index.side_effect = Exception("unavailable")
+            mock_xdcr.side_effect = Exception("unavailable")
+            await collector.collect_cluster(None, cluster, watcher, schedule)
+            first = collector.snapshot.clusters[0]
+            now[0] = 10
+            await collector.collect_cluster(None, cluster, watcher, schedule)
+
+            assert mock_process.call_count == 1
+            assert collector.snapshot.clusters[0] is first
+
+            # waitChange timed out: same etag, fresh systemStats
+            watcher.current.return_value = document(55)
+            now[0] = 20
+            await collector.collect_cluster(None, cluster, watcher, schedule)
+
+        assert mock_process.call_count == 2
+        assert collector.snapshot.clusters[0]["systemStats"] == {
+            "cpu_utilization_rate": 55
+        }
+        assert collector.snapshot.clusters[0]["nodes"][0]["cpu_utilization"] == 55
+
+    def test_validate_config_collector_section(self):
+        """Collector settings, refreshInterval and cadences are validated"""
+        config_data = {
+            "logging": {"level": "info", "file": "logs/app.log", "enabled": True},
+            "collector": {
+                "enabled": "yes",
+                "interval": 0,
+                "cadences": {"stats": 0, "views": 10},
+            },
+            "clusters": [
+                {
+                    "host": "http://localhost:8091",
+                    "user": "admin",
+                    "pass": "password",
+                    "refreshInterval": True,
+                    "cadences": [],
+                }
+            ],
+        }
+
+        errors = validate_config(config_data)
+
+        assert "'enabled' in collector config must be a boolean" in errors
+        assert "'interval' in collector config must be a positive number" in errors
+        assert "'refreshInterval' in cluster 0 must be a positive number" in errors
+        assert (
+            "'cadences.stats' in collector config must be a positive number" in errors
+        )
+        assert any(e.startswith("Unknown cadence 'views'") for e in errors)
+        assert "'cadences' in cluster 0 must be an object" in errors
+
+
+class TestConfigStore:
+    """Test cases for the cached, hot-reloaded config"""
+
+    @staticmethod
+    def _write(path, hosts):
+        path.write_text(
+            json.dumps(
+                {
+                    "logging": {"level": "info", "file": "app.log", "enabled": False},
+                    "clusters": [
+                        {"host": host, "user": "admin", "pass": "password"}
+                        for host in hosts
+                    ],
+                }
+            )
+        )
+
+    def test_config_is_read_once_until_file_changes(self, tmp_path, monkeypatch):
+        """Unchanged files are served from memory; edits are picked up"""
+        monkeypatch.chdir(tmp_path)
+        self._write(tmp_path / "config.json", ["http://a:8091"])
+        store = ConfigStore()
+        changes = []
+        store.add_listener(changes.append)
+
+        with patch("app.load_config", wraps=load_config) as mock_load:
+            first = store.clusters()
+            second = store.clusters()
+            self._write(tmp_path / "config.json", ["http://a:8091", "http://b:8091"])
+            third = store.clusters()
+
+        assert second is first
+        assert mock_load.call_count == 2
+        assert [c["host"] for c in third] == ["http://a:8091", "http://b:8091"]
+        assert len(changes) == 1
+
+    def test_store_reads_its_own_path(self, tmp_path, monkeypatch):
+        """A store on another file loads and reloads that file, not config.json"""
+        monkeypatch.chdir(tmp_path)
+        self._write(tmp_path / "config.json", ["http://ignored:8091"])
+        self._write(tmp_path / "other.json", ["http://a:8091"])
+        store = ConfigStore(path=str(tmp_path / "other.json"))
+
+        first = store.clusters()
+        self._write(tmp_path / "other.json", ["http://b:8091"])
+
+        assert [c["host"] for c in first] == ["http://a:8091"]
+        assert [c["host"] for c in store.clusters(force=True)] == ["http://b:8091"]
+
+    def test_invalid_edit_keeps_last_good_config(self, tmp_path, monkeypatch):
+        """A broken config.json doesn't wipe the clusters being served"""
+        monkeypatch.chdir(tmp_path)
+        self._write(tmp_path / "config.json", ["http://a:8091"])
+        store = ConfigStore()
+        good = store.clusters()
+
+        (tmp_path / "config.json").write_text("{not json")
+
+        assert store.clusters() is good
+        assert store.clusters(force=True) is good
+
+    @pytest.mark.asyncio
+    async def test_collector_reconfigure_adds_and_removes_clusters(self):
+        """Reloaded clusters swap in without restarting the collector"""
+        a = {"host": "http://a:8091", "user": "u", "pass": "p"}
+        b = {"host": "http://b:8091", "user": "u", "pass": "p"}
+        collector = ClusterCollector([a])
+        collector.publish(a["host"], {"host": a["host"]}, None, None)
+        started = []
+
+        async def refresh_forever(session, cluster):
+            started.append(cluster["host"])
+            await asyncio.sleep(3600)
+
+        collector._refresh_forever = refresh_forever
+        collector._task = asyncio.ensure_future(asyncio.sleep(3600))
+        collector._sync_loops()
+        await asyncio.sleep(0)
+        old_loop = collector._loops[a["host"]]
+
+        await collector._reconfigure([b, {**a, "watch": False}])
+        await asyncio.sleep(0)
+
+        assert old_loop.cancelled()
+        assert list(collector._loops) == [b["host"]]
+        assert started == [a["host"], b["host"]]
+        assert collector.snapshot.clusters[0]["not_watching"] is True
+
+        await collector._reconfigure([b])
+        assert [c["host"] for c in collector.snapshot.clusters] == []
+        collector.publish(a["host"], {"host": a["host"]}, None, None)
+        assert collector._entries.keys() == set()
+
+        collector._task.cancel()
+        for task in collector._loops.values():
+            task.cancel()
+
+
+class TestClustersDelta:
+    """Test cases for snapshot versioning and delta payloads"""
+
+    def test_diff_cluster_patches_changed_list_items(self):
+        """Equal-length lists are sent as {position: item} patches"""
+        old = {"health": True, "nodes": [{"n": 1}, {"n": 2}], "buckets": [{"b": 1}]}
+        new = {"health": True, "nodes": [{"n": 1}, {"n": 3}], "buckets": []}
+
+        assert diff_cluster(old, new) == ({"nodes": {"1": {"n": 3}}, "buckets": []}, [])
+
+    def test_diff_cluster_lists_removed_fields(self):
+        """Fields that disappear, like the stale marker, are reported as removed"""
+        old = {"host": "a", "stale": True, "collected_at": 30, "stale_error": "x"}
+        new = {"host": "a"}
+
+        assert diff_cluster(old, new) == ({}, ["stale", "collected_at", "stale_error"])
+
+    def test_build_delta_full_when_version_unknown(self):
+        """An unknown ``since`` version falls back to the full cluster list"""
+        snapshot = ClusterSnapshot(2, 0, [{"host": "a"}], [], [])
+
+        payload = build_clusters_delta(None, snapshot)
+
+        assert payload == {
+            "version": "2",
+            "total": 1,
+            "full": True,
+            "clusters": [{"host": "a"}],
+        }
+
+    def test_identical_publish_keeps_version(self):
+        """Re-publishing unchanged data doesn't invalidate clients' ETags"""
+        collector = ClusterCollector(
+            [{"host": "http://localhost:8091", "user": "admin", "pass": "password"}]
+        )
+        collector.publish("http://localhost:8091", {"clusterName": "c"}, None, None)
+        tag = collector.snapshot.tag
+
+        collector.publish("http://localhost:8091", {"clusterName": "c"}, None, None)
+
+        assert collector.snapshot.tag == tag
+        assert collector.snapshot_for(tag) is collector.snapshot
+        assert collector.snapshot_for("unknown") is None
+
+
+class TestTimeSeriesStore:
+    """Test cases for the ring-buffer time-series store"""
+
+    def test_ring_buffer_overwrites_oldest(self):
+        """Memory stays bounded at capacity; values come back oldest first"""
+        ring = RingBuffer(3)
+        for value in range(5):
+            ring.append(value)
+
+        assert len(ring) == 3
+        assert ring.tolist() == [2.0, 3.0, 4.0]
+        assert ring.last() == 4.0
+
+    def test_overlapping_bucket_windows_are_deduplicated(self):
+        """Only samples newer than the last stored timestamp are appended"""
+        store = TimeSeriesStore(retention=4)
+        store.record_bucket_samples(
+            "h", "b", {"timestamp": [1000, 2000, 3000], "ops": [1, 2, 3]}
+        )
+        store.record_bucket_samples(
+            "h", "b", {"timestamp": [2000, 3000, 4000, 5000], "ops": [2, 3, 4, 5]}
+        )
+
+        samples = store.series("h", "bucket", "b")
+        assert samples == {"timestamp": [2000, 3000, 4000, 5000], "ops": [2, 3, 4, 5]}
+        assert store.series("h", "bucket", "b", since=4000) == {
+            "timestamp": [5000],
+            "ops": [5],
+        }
+
+    def test_late_metric_is_aligned(self):
+        """A metric that appears later is backfilled with None"""
+        store = TimeSeriesStore(retention=10)
+        store.record_bucket_samples("h", "b", {"timestamp": [1], "ops": [1]})
+        store.record_bucket_samples(
+            "h", "b", {"timestamp": [2], "ops": [2], "cmd_get": [7]}
+        )
+
+        samples = store.series("h", "bucket", "b")
+        assert samples["cmd_get"] == [None, 7.0]
+        assert samples["ops"] == [1.0, 2.0]
+
+    def test_record_cluster_feeds_buckets_and_nodes(self):
+        """Collector pipeline results populate bucket and node series"""
+        store = TimeSeriesStore()
+        store.record_cluster(
+            {
+                "host": "http://h:8091",
+                "data": {
+                    "nodes": [
+                        {
+                            "hostname": "n1:8091",
+                            "systemStats": {"cpu_utilization_rate": 12.5},
+                            "interestingStats": {"curr_items": 10, "name": "x"},
+                        }
+                    ]
+                },
+                "bucket_stats": [
+                    {
+                        "bucket_name": "b",
+                        "stats": {"op": {"samples": {"timestamp": [1], "ops": [3]}}},
+                    },
+                    {"bucket_name": "broken", "stats": None, "error": "boom"},
+                ],
+            },
+            timestamp=1000,
+        )
+
+        assert store.series("http://h:8091", "bucket", "b")["ops"] == [3.0]
+        node = store.series("http://h:8091", "node", "n1:8091")
+        assert node == {
+            "timestamp": [1000],
+            "cpu_utilization_rate": [12.5],
+            "curr_items": [10.0],
+        }
+        assert store.series("http://h:8091", "bucket", "broken") is None
+
+    def test_record_xdcr_computes_rates_from_counter_deltas(self):
+        """Rates need two points; a counter that goes backwards has no rate"""
+        store = TimeSeriesStore()
+        task = {"id": "r1/src/dst", "source": "src", "changesLeft": 50}
+
+        first = store.record_xdcr(
+            "h", [dict(task, docsWritten=100, docsChecked=200)], timestamp=1000
+        )
+        second = store.record_xdcr(
+            "h", [dict(task, docsWritten=300, docsChecked=600)], timestamp=3000
+        )
+        reset = store.record_xdcr(
+            "h", [dict(task, docsWritten=10, docsChecked=700)], timestamp=4000
+        )
+
+        assert first == {"r1/src/dst": {"changes_left": 50}}
+        assert second["r1/src/dst"] == {
+            "changes_left": 50,
+            "docs_written_rate": 100.0,
+            "docs_checked_rate": 200.0,
+        }
+        assert "docs_written_rate" not in reset["r1/src/dst"]
+        assert store.series("h", "xdcr", "r1/src/dst")["docs_checked_rate"] == [
+            None,
+            200.0,
+            100.0,
+        ]
+
+    def test_record_xdcr_falls_back_to_bucket_stats(self):
+        """Counters missing from the task come from replications/<id>/... samples"""
+        store = TimeSeriesStore()
+        prefix = "replications/r1/src/dst/"
+        bucket_stats = [
+            {
+                "bucket_name": "src",
+                "stats": {
+                    "op": {
+                        "samples": {
+                            prefix + "changes_left": [7, 9],
+                            prefix + "wtavg_docs_latency": [12, None],
+                        }
+                    }
+                },
+            }
+        ]
+
+        rows = store.record_xdcr(
+            "h", [{"id": "r1/src/dst", "source": "src"}], bucket_stats, 1000
+        )
+        store.drop("h")
+
+        assert rows == {"r1/src/dst": {"changes_left": 9, "latency_ms": 12}}
+        assert store.series("h", "xdcr", "r1/src/dst") is None
+        assert store._xdcr_counters == {}
+
+
+class TestAsyncRuntime:
+    """Test cases for the shared AsyncRuntime loop and pooled session"""
+
+    def test_runtime_runs_coroutines_on_one_loop(self):
+        """Coroutines submitted from different calls share the same loop"""
+        runtime = AsyncRuntime()
+        runtime.start()
+        try:
+
+            async def current_loop():
+                return asyncio.get_running_loop()
+
+            assert runtime.run(current_loop()) is runtime.loop
+            assert runtime.run(current_loop()) is runtime.loop
+        finally:
+            runtime.stop()
+
+        assert not runtime.is_running()
+
+    def test_runtime_session_uses_configured_connector(self):
+        """The pooled session keeps connections alive with per-host limits"""
+        runtime = AsyncRuntime(
+            connection_limit=50, connection_limit_per_host=5, dns_cache_ttl=60
+        )
+        runtime.start()
+        try:
+            session = runtime.session
+            assert isinstance(session, aiohttp.ClientSession)
+            assert session.connector.limit == 50
+            assert session.connector.limit_per_host == 5
+            assert session.connector.use_dns_cache is True
+        finally:
+            runtime.stop()
+
+        assert session.closed
+
+    def test_validate_config_http_section(self):
+        """Connection pool settings must be positive numbers"""
+        config_data = {
+            "logging": {"level": "info", "file": "logs/app.log", "enabled": True},
+            "http": {"connectionLimit": -1, "dnsCacheTtl": "300"},
+            "clusters": [],
+        }
+
+        errors = validate_config(config_data)
+
+        assert "'connectionLimit' in http config must be a positive number" in errors
+        assert "'dnsCacheTtl' in http config must be a positive number" in errors
+
+
+class TestTLSContextRegistry:
+    """Test cases for per-cluster TLS context caching"""
+
+    def test_plain_http_has_no_context(self):
+        """HTTP clusters never get an SSL context"""
+        registry = TLSContextRegistry()
+
+        assert registry.get("http://localhost:8091") is None
+
+    def test_context_is_built_once_and_shared(self):
+        """Clusters with identical TLS settings share one cached context"""
+        registry = TLSContextRegistry()
+        registry.configure(
+            [
+                {"host": "https://a:18091"},
+                {"host": "https://b:18091"},
+                {"host": "https://c:18091", "tls": {"verify": True}},
+            ]
+        )
+
+        context_a = registry.get("https://a:18091")
+        assert registry.get("https://a:18091") is context_a
+        assert registry.get("https://b:18091") is context_a
+        assert context_a.verify_mode == ssl.CERT_NONE
+        assert context_a.check_hostname is False
+
+        context_c = registry.get("https://c:18091")
+        assert context_c is not context_a
+        assert context_c.verify_mode == ssl.CERT_REQUIRED
+
+    def test_reconfigure_drops_unused_contexts(self):
+        """Changing a cluster's TLS settings rebuilds its context"""
+        registry = TLSContextRegistry()
+        registry.configure([{"host": "https://a:18091", "tls": {"verify": True}}])
+        old_context = registry.get("https://a:18091")
+
+        registry.configure([{"host": "https://a:18091", "tls": {"verify": False}}])
+
+        assert registry.get("https://a:18091") is not old_context
+
+    @pytest.mark.asyncio
+    async def test_fetch_uses_cached_context(self):
+        """fetch_cluster_data passes the registry's context to aiohttp"""
+        mock_session = Mock()
+        mock_response = Mock()
+        mock_response.status = 200
+        mock_response.json = AsyncMock(return_value={})
+        mock_session.get.return_value.__aenter__ = AsyncMock(return_value=mock_response)
+        mock_session.get.return_value.__aexit__ = AsyncMock(return_value=None)
+
+        await fetch_cluster_data(mock_session, "https://secure:18091", "a", "b")
+
+        _, kwargs = mock_session.get.call_args
+        assert kwargs["ssl"] is tls_registry.get("https://secure:18091")
+
+    def test_validate_config_tls_section(self):
+        """TLS settings are type-checked and keyFile needs certFile"""
+        config_data = {
+            "logging": {"level": "info", "file": "logs/app.log", "enabled": True},
+            "clusters": [
+                {
+                    "host": "https://localhost:18091",
+                    "user": "admin",
+                    "pass": "password",
+                    "tls": {"verify": "yes", "keyFile": "client.key"},
+                }
+            ],
+        }
+
+        errors = validate_config(config_data)
+
+        assert "'tls.verify' in cluster 0 must be a boolean" in errors
+        assert "'tls.keyFile' in cluster 0 requires 'tls.certFile'" in errors
+
+
+class TestRequestScheduler:
+    """Test cases for bounded, fair and prioritized upstream requests"""
+
+    async def _run_requests(self, scheduler, requests, order):
+        async def request(cluster, priority, label):
+            async with scheduler.slot(cluster, priority):
+                order.append(label)
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*(request(*r) for r in requests))
+
+    @pytest.mark.asyncio
+    async def test_limits_are_never_exceeded(self):
+        """In-flight requests respect the global and per-cluster limits"""
+        scheduler = RequestScheduler(global_limit=4, per_cluster_limit=2)
+        peaks = {"global": 0, "a": 0}
+        in_flight_a = 0
+
+        async def request(cluster):
+            nonlocal in_flight_a
+            async with scheduler.slot(cluster, 0):
+                peaks["global"] = max(peaks["global"], scheduler.in_flight)
+                if cluster == "a":
+                    in_flight_a += 1
+                    peaks["a"] = max(peaks["a"], in_flight_a)
+                await asyncio.sleep(0.01)
+                if cluster == "a":
+                    in_flight_a -= 1
+
+        await asyncio.gather(*(request(c) for c in ["a"] * 10 + ["b", "c"] * 5))
+
+        assert peaks["global"] == 4
+        assert peaks["a"] == 2
+        assert scheduler.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_cheap_requests_go_before_stats(self):
+        """Queued /pools/default calls are served before queued stats calls"""
+        scheduler = RequestScheduler(global_limit=1, per_cluster_limit=1)
+        order = []
+        requests = [("a", 2, "stats-1"), ("a", 2, "stats-2"), ("a", 0, "pools")]
+
+        await self._run_requests(scheduler, requests, order)
+
+        assert order == ["stats-1", "pools", "stats-2"]
+
+    @pytest.mark.asyncio
+    async def test_clusters_take_turns(self):
+        """A busy cluster does not starve other clusters of slots"""
+        scheduler = RequestScheduler(global_limit=1, per_cluster_limit=1)
+        order = []
+        requests = [("big", 2, "big")] * 4 + [("small", 2, "small")] * 2
+
+        await self._run_requests(scheduler, requests, order)
+
+        assert order == ["big", "small", "big", "small", "big", "big"]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_frees_its_place(self):
+        """Cancelling a queued request does not leak or block slots"""
+        scheduler = RequestScheduler(global_limit=1, per_cluster_limit=1)
+        await scheduler.acquire("a", 0)
+        waiter = asyncio.ensure_future(scheduler.acquire("a", 0))
+        await asyncio.sleep(0)
+
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        scheduler.release("a")
+
+        assert scheduler.in_flight == 0
+        assert scheduler.queued() == 0
+        await asyncio.wait_for(scheduler.acquire("a", 0), timeout=1)
+        assert scheduler.in_flight == 1
+
+
+class TestCircuitBreaker:
+    """Test cases for CircuitBreaker, LatencyTracker and UpstreamHealth"""
+
+    def _breaker(self, now):
+        return CircuitBreaker(
+            "http://a:8091/pools/default",
+            failure_threshold=2,
+            base_backoff=5,
+            max_backoff=12,
+            clock=lambda: now[0],
+        )
+
+    def test_opens_after_threshold_and_fails_fast(self):
+        """Consecutive failures open the circuit until the backoff elapses"""
+        now = [100.0]
+        breaker = self._breaker(now)
+        breaker.record_failure()
+        breaker.before_request()
+        breaker.record_failure()
+
+        assert breaker.state == CircuitBreaker.OPEN
+        with pytest.raises(CircuitOpenError, match="next probe in 5s"):
+            breaker.before_request()
+
+    def test_half_open_allows_a_single_probe(self):
+        """After the backoff one probe goes out; success closes the circuit"""
+        now = [100.0]
+        breaker = self._breaker(now)
+        breaker.record_failure()
+        breaker.record_failure()
+        now[0] += 5
+
+        breaker.before_request()
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request()
+
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
+        breaker.before_request()
+
+    def test_failed_probes_back_off_exponentially(self):
+        """Each failed probe doubles the backoff, up to max_backoff"""
+        now = [100.0]
+        breaker = self._breaker(now)
+        breaker.record_failure()
+        breaker.record_failure()
+        backoffs = []
+        for _ in range(3):
+            now[0] = breaker.retry_at
+            breaker.before_request()
+            breaker.record_failure()
+            backoffs.append(breaker.retry_at - now[0])
+
+        assert backoffs == [10, 12, 12]
+
+    def test_cancelled_probe_releases_the_slot(self):
+        """A cancelled half-open probe lets the next request probe instead"""
+        now = [100.0]
+        breaker = self._breaker(now)
+        breaker.record_failure()
+        breaker.record_failure()
+        now[0] += 5
+        breaker.before_request()
+
+        breaker.cancel_probe()
+        breaker.before_request()
+
+    def test_latency_tracker_adapts_timeout(self):
+        """Timeouts follow the p99 latency, clamped to min/max"""
+        tracker = LatencyTracker(min_timeout=2, max_timeout=10)
+        assert tracker.timeout() == 10
+
+        for latency in (0.1, 0.2, 0.3, 0.4, 1.0):
+            tracker.record(latency)
+        assert tracker.timeout() == 3.0
+
+        tracker.samples.clear()
+        for _ in range(5):
+            tracker.record(0.01)
+        assert tracker.timeout() == 2
+
+        tracker.record(60)
+        assert tracker.timeout() == 10
+
+    def test_endpoint_key_folds_bucket_names(self):
+        """Every bucket's stats share one breaker per cluster"""
+        key = upstream_health.endpoint_key(
+            "http://a:8091", "http://a:8091/pools/default/buckets/beer/stats"
+        )
+        assert key == ("http://a:8091", "/pools/default/buckets/*/stats")
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_skips_the_request(self):
+        """Once open, fetches fail fast without calling the session"""
+        mock_session = Mock()
+        mock_session.get.side_effect = aiohttp.ClientConnectionError("refused")
+
+        for _ in range(DEFAULT_BREAKER_FAILURE_THRESHOLD):
+            result = await fetch_cluster_data(
+                mock_session, "http://dead:8091", "admin", "password"
+            )
+            assert result["error"] == "refused"
+        calls = mock_session.get.call_count
+
+        with patch("app.logger") as mock_logger:
+            result = await fetch_cluster_data(
+                mock_session, "http://dead:8091", "admin", "password"
+            )
+
+        assert result["error"].startswith("Circuit open for http://dead:8091")
+        assert mock_session.get.call_count == calls
+        statuses = [row["status"] for row in upstream_metrics.report()]
+        assert sorted(statuses) == ["circuit_open", "error"]
+        mock_logger.error.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_server_errors_count_but_client_errors_do_not(self):
+        """5xx responses trip the breaker; 4xx responses don't"""
+        mock_session = Mock()
+        mock_response = Mock()
+        mock_session.get.return_value.__aenter__ = AsyncMock(return_value=mock_response)
+        mock_session.get.return_value.__aexit__ = AsyncMock(return_value=None)
+        key = ("http://a:8091", "/pools/default")
+
+        mock_response.status = 401
+        for _ in range(DEFAULT_BREAKER_FAILURE_THRESHOLD):
+            await fetch_cluster_data(mock_session, "http://a:8091", "admin", "x")
+        assert upstream_health.breaker(key).state == CircuitBreaker.CLOSED
+
+        mock_response.status = 503
+        for _ in range(DEFAULT_BREAKER_FAILURE_THRESHOLD):
+            await fetch_cluster_data(mock_session, "http://a:8091", "admin", "x")
+        assert upstream_health.breaker(key).state == CircuitBreaker.OPEN
+
+    @pytest.mark.asyncio
+    async def test_fetch_uses_adaptive_timeout(self):
+        """Requests get the endpoint's adaptive timeout"""
+        mock_session = Mock()
+        mock_response = Mock()
+        mock_response.status = 200
+        mock_response.json = AsyncMock(return_value={})
+        mock_session.get.return_value.__aenter__ = AsyncMock(return_value=mock_response)
+        mock_session.get.return_value.__aexit__ = AsyncMock(return_value=None)
+        tracker = upstream_health.latency(("http://a:8091", "/indexStatus"))
+        for _ in range(LATENCY_MIN_SAMPLES):
+            tracker.record(1.0)
+
+        await fetch_index_status(mock_session, "http://a:8091", "admin", "x")
+
+        assert mock_session.get.call_args.kwargs["timeout"] == 3.0
+
+
+class TestUpstreamMetrics:
+    """Test cases for upstream call histograms"""
+
+    def test_histogram_buckets_and_quantiles(self):
+        """Values land in the first bucket whose bound they don't exceed"""
+        histogram = Histogram((0.1, 1))
+        for value in (0.05, 0.1, 0.5, 0.7, 3):
+            histogram.record(value)
+
+        report = histogram.to_dict()
+        assert report["buckets"] == {"0.1": 2, "1": 2, "+Inf": 1}
+        assert report["count"] == 5
+        assert report["max"] == 3
+        assert report["p50"] == 1
+        assert report["p99"] == 3
+
+    @pytest.mark.asyncio
+    async def test_fetch_records_status_bytes_and_parse_time(self):
+        """Every call is counted per cluster, endpoint and status"""
+        mock_session = Mock()
+        mock_response = Mock()
+        mock_response.status = 200
+        mock_response.content_length = 9
+        mock_response.json = AsyncMock(side_effect=lambda loads: loads('{"a": 1}'))
+        mock_session.get.return_value.__aenter__ = AsyncMock(return_value=mock_response)
+        mock_session.get.return_value.__aexit__ = AsyncMock(return_value=None)
+
+        result = await fetch_index_status(mock_session, "http://a:8091", "admin", "x")
+        mock_session.get.side_effect = asyncio.TimeoutError()
+        await fetch_index_status(mock_session, "http://a:8091", "admin", "x")
+
+        assert result["data"] == {"a": 1}
+        rows = {row["status"]: row for row in upstream_metrics.report()}
+        assert rows["200"]["endpoint"] == "/indexStatus"
+        assert rows["200"]["bytes"] == 9
+        assert rows["200"]["latency"]["count"] == 1
+        assert rows["200"]["parse"]["count"] == 1
+        assert rows["timeout"]["count"] == 1
+        assert upstream_metrics.report("http://other:8091") == []
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -4,16 +4,28 @@ Tests the full application workflow end-to-end
 """
 
 import pytest
+import gzip
 import json
 import asyncio
+import aiohttp
 import sys
+import threading
 import os
 from unittest.mock import patch, Mock, AsyncMock
+from aiohttp.test_utils import TestClient, TestServer
 
 # Add the parent directory to the path so we can import app
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from app import app, get_all_clusters_data, process_cluster_data
+import app as app_module
+from app import (
+    app,
+    get_all_clusters_data,
+    process_cluster_data,
+    ClusterCollector,
+    LastGoodClusters,
+)
+from benchmarks.couchbase_simulator import SimulatedFleet
 
 
 class TestIntegration:
@@ -243,6 +255,50 @@ class TestFullWorkflow:
             assert processed[1]["clusterName"] == "Not Watching"
 
 
+class TestSimulatedFleet:
+    """Real HTTP fan-out against the local Couchbase REST simulator"""
+
+    @pytest.mark.asyncio
+    async def test_refresh_fans_out_to_every_bucket(self):
+        """One refresh hits /pools/default once and each bucket's endpoints once"""
+        fleet = SimulatedFleet(clusters=2, buckets=3, indexes=5)
+        await fleet.start()
+        try:
+            async with aiohttp.ClientSession() as session:
+                results = await get_all_clusters_data(
+                    fleet.cluster_configs(), session=session
+                )
+        finally:
+            await fleet.stop()
+
+        processed = process_cluster_data(results)
+        assert fleet.request_counts() == {"pools": 2, "bucket": 6, "bucket_stats": 6}
+        assert [c["clusterName"] for c in processed] == ["sim-0", "sim-1"]
+        assert [b["name"] for b in processed[0]["buckets"]] == [
+            "bucket-0",
+            "bucket-1",
+            "bucket-2",
+        ]
+        assert processed[0]["bucket_stats"][0]["stats"]["op"]["samples"]["ops"]
+
+    @pytest.mark.asyncio
+    async def test_injected_errors_surface_per_cluster(self):
+        """A failing cluster reports its error without affecting the others"""
+        fleet = SimulatedFleet(clusters=2, buckets=1)
+        fleet.clusters[1].error_rate = 1.0
+        await fleet.start()
+        try:
+            async with aiohttp.ClientSession() as session:
+                results = await get_all_clusters_data(
+                    fleet.cluster_configs(), session=session
+                )
+        finally:
+            await fleet.stop()
+
+        assert results[0]["error"] is None
+        assert results[1]["error"] == "Failed with status 500"
+
+
 class TestErrorHandling:
     """Test error handling scenarios"""
 
@@ -343,5 +399,583 @@ class TestConfigurationHandling:
         assert watch_value is True
 
 
+class TestCollectorRoutes:
+    """API routes served from the background collector snapshot"""
+
+    def setup_method(self):
+        app.config["TESTING"] = True
+        self.client = app.test_client()
+        self.collector = ClusterCollector(
+            [{"host": "http://localhost:8091", "user": "admin", "pass": "password"}]
+        )
+        self.collector.publish(
+            "http://localhost:8091",
+            {"host": "http://localhost:8091", "clusterName": "from-snapshot"},
+            {"host": "http://localhost:8091", "data": {"indexes": []}, "error": None},
+            {
+                "host": "http://localhost:8091",
+                "remoteClusters": [],
+                "xdcrTasks": [],
+                "error": None,
+            },
+        )
+        self.collector.is_running = lambda: True
+
+    @patch("app.get_all_clusters_data")
+    def test_routes_serve_snapshot_without_fetching(self, mock_get_data):
+        """/api/clusters, /api/indexStatus and /api/xdcrStatus use the snapshot"""
+        with patch.object(app_module, "collector", self.collector):
+            clusters = json.loads(self.client.get("/api/clusters").data)
+            indexes = json.loads(self.client.get("/api/indexStatus").data)
+            xdcr = json.loads(self.client.get("/api/xdcrStatus").data)
+
+        assert clusters[0]["clusterName"] == "from-snapshot"
+        assert indexes[0]["data"] == {"indexes": []}
+        assert xdcr[0]["xdcrTasks"] == []
+        mock_get_data.assert_not_called()
+
+    def test_clusters_etag_returns_304_when_unchanged(self):
+        """If-None-Match with the current snapshot version gets an empty 304"""
+        with patch.object(app_module, "collector", self.collector):
+            first = self.client.get("/api/clusters")
+            etag = first.headers["ETag"]
+            second = self.client.get("/api/clusters", headers={"If-None-Match": etag})
+
+        assert first.status_code == 200
+        assert second.status_code == 304
+        assert second.data == b""
+
+    def test_clusters_delta_returns_only_changes(self):
+        """?since= returns the changed fields of changed clusters only"""
+        with patch.object(app_module, "collector", self.collector):
+            version = self.client.get("/api/clusters").headers["ETag"].strip('"')
+            self.collector.publish(
+                "http://localhost:8091",
+                {"host": "http://localhost:8091", "clusterName": "renamed"},
+                None,
+                None,
+            )
+            delta = json.loads(self.client.get(f"/api/clusters?since={version}").data)
+            unknown = json.loads(self.client.get("/api/clusters?since=stale").data)
+
+        assert delta["full"] is False
+        assert delta["version"] != version
+        assert delta["clusters"] == {"0": {"changes": {"clusterName": "renamed"}}}
+        assert unknown["full"] is True
+        assert unknown["clusters"][0]["clusterName"] == "renamed"
+
+    def test_clusters_delta_keeps_unknown_versions_out_of_the_etag(self):
+        """Unknown or malformed ?since= values get one shared full response"""
+        with patch.object(app_module, "collector", self.collector):
+            quoted = self.client.get('/api/clusters?since="x"')
+            junk = self.client.get("/api/clusters?since=junk")
+
+        assert quoted.status_code == 200
+        assert json.loads(quoted.data)["full"] is True
+        assert quoted.headers["ETag"] == junk.headers["ETag"]
+        assert "junk" not in junk.headers["ETag"]
+
+    def test_clusters_delta_clears_stale_marker_on_recovery(self):
+        """A cluster that recovers sends its stale fields as removed"""
+        host = "http://localhost:8091"
+        last_good = LastGoodClusters()
+        good = {
+            "host": host,
+            "data": {"clusterName": "c"},
+            "buckets": [],
+            "bucket_stats": [],
+            "error": None,
+        }
+        failed = {"host": host, "data": None, "error": "timeout"}
+        with patch.object(app_module, "collector", self.collector):
+            for cluster in (good, failed):
+                processed = process_cluster_data([cluster])[0]
+                self.collector.publish(host, last_good.apply(processed), None, None)
+            stale = json.loads(self.client.get("/api/clusters").data)
+            version = self.collector.snapshot.tag
+            processed = process_cluster_data([good])[0]
+            self.collector.publish(host, last_good.apply(processed), None, None)
+            delta = json.loads(self.client.get(f"/api/clusters?since={version}").data)
+
+        assert stale[0]["stale"] is True
+        entry = delta["clusters"]["0"]
+        assert entry["changes"] == {}
+        assert sorted(entry["removed"]) == ["collected_at", "stale", "stale_error"]
+
+    def test_repeated_failures_keep_snapshot_version(self):
+        """A cluster that stays down doesn't change the ETag on every tick"""
+        host = "http://localhost:8091"
+        now = [1000.0]
+        last_good = LastGoodClusters(clock=lambda: now[0])
+        good = {
+            "host": host,
+            "data": {"clusterName": "c"},
+            "buckets": [],
+            "bucket_stats": [],
+            "error": None,
+        }
+        failed = {"host": host, "data": None, "error": "timeout"}
+        with patch.object(app_module, "collector", self.collector):
+            for cluster in (good, failed):
+                processed = process_cluster_data([cluster])[0]
+                self.collector.publish(host, last_good.apply(processed), None, None)
+            etag = self.client.get("/api/clusters").headers["ETag"]
+            now[0] += 30
+            processed = process_cluster_data([failed])[0]
+            self.collector.publish(host, last_good.apply(processed), None, None)
+            again = self.client.get("/api/clusters", headers={"If-None-Match": etag})
+
+        assert again.status_code == 304
+
+    @patch("app.load_config")
+    @patch("app.get_all_clusters_data")
+    @patch("app.process_cluster_data")
+    def test_on_demand_clusters_honour_etag(
+        self, mock_process, mock_get_data, mock_load_config
+    ):
+        """Without the collector the ETag is a hash of the response body"""
+        mock_load_config.return_value = [
+            {"host": "http://localhost:8091", "user": "admin", "pass": "password"}
+        ]
+        mock_process.return_value = [{"host": "http://localhost:8091"}]
+
+        first = self.client.get("/api/clusters")
+        second = self.client.get(
+            "/api/clusters", headers={"If-None-Match": first.headers["ETag"]}
+        )
+
+        assert second.status_code == 304
+
+    def test_clusters_columnar_samples(self):
+        """?samples=columnar swaps op.samples for an encoded block"""
+        self.collector.publish(
+            "http://localhost:8091",
+            {
+                "host": "http://localhost:8091",
+                "bucket_stats": [
+                    {"name": "b", "stats": {"op": {"samples": {"timestamp": [1]}}}}
+                ],
+            },
+            None,
+            None,
+        )
+        with patch.object(app_module, "collector", self.collector):
+            plain = self.client.get("/api/clusters")
+            columnar = self.client.get("/api/clusters?samples=columnar")
+
+        op = json.loads(columnar.data)[0]["bucket_stats"][0]["stats"]["op"]
+        assert op["samplesColumnar"]["count"] == 1
+        assert "samples" not in op
+        assert plain.headers["ETag"] != columnar.headers["ETag"]
+
+    def test_snapshot_responses_are_gzipped_and_cached(self):
+        """Compressed snapshot bodies are built once and shared across viewers"""
+        self.collector.publish(
+            "http://localhost:8091",
+            {"host": "http://localhost:8091", "clusterName": "x" * 4096},
+            None,
+            None,
+        )
+        app_module.response_cache.clear()
+        headers = {"Accept-Encoding": "gzip"}
+        with patch.object(app_module, "collector", self.collector), patch.object(
+            app_module, "compress_body", wraps=app_module.compress_body
+        ) as compress:
+            first = self.client.get("/api/clusters", headers=headers)
+            second = self.client.get("/api/clusters", headers=headers)
+            revalidated = self.client.get(
+                "/api/clusters",
+                headers={**headers, "If-None-Match": first.headers["ETag"]},
+            )
+
+        assert first.headers["Content-Encoding"] == "gzip"
+        assert "Accept-Encoding" in first.headers["Vary"]
+        assert json.loads(gzip.decompress(first.data))[0]["clusterName"] == "x" * 4096
+        assert second.data == first.data
+        assert compress.call_count == 1
+        assert revalidated.status_code == 304
+
+    def test_small_and_unaccepted_responses_are_not_compressed(self):
+        """Bodies under minSize, or clients without gzip, get identity"""
+        with patch.object(app_module, "collector", self.collector):
+            small = self.client.get(
+                "/api/xdcrStatus", headers={"Accept-Encoding": "gzip"}
+            )
+            plain = self.client.get("/api/clusters")
+
+        assert "Content-Encoding" not in small.headers
+        assert "Content-Encoding" not in plain.headers
+        assert json.loads(small.data)[0]["xdcrTasks"] == []
+
+    def test_timeseries_route_returns_incremental_history(self):
+        """/api/timeseries serves stored bucket history, optionally since a time"""
+        self.collector.timeseries.record_bucket_samples(
+            "http://localhost:8091",
+            "travel",
+            {"timestamp": [1000, 2000], "ops": [5, 6]},
+        )
+        with patch.object(app_module, "collector", self.collector):
+            full = self.client.get("/api/timeseries/localhost:8091/bucket/travel")
+            since = self.client.get(
+                "/api/timeseries/localhost:8091/bucket/travel?since=1000"
+            )
+            missing = self.client.get("/api/timeseries/localhost:8091/bucket/none")
+
+        assert json.loads(full.data)["samples"]["ops"] == [5, 6]
+        assert json.loads(since.data)["samples"] == {"timestamp": [2000], "ops": [6]}
+        assert missing.status_code == 404
+
+    def test_timeseries_route_tells_apart_clusters_on_one_host(self):
+        """Clusters sharing a hostname are matched by port as well"""
+        collector = ClusterCollector(
+            [
+                {"host": "http://localhost:8091", "user": "a", "pass": "p"},
+                {"host": "http://localhost:8092", "user": "a", "pass": "p"},
+            ]
+        )
+        collector.is_running = lambda: True
+        for port, ops in ((8091, 1), (8092, 2)):
+            collector.timeseries.record_bucket_samples(
+                f"http://localhost:{port}",
+                "travel",
+                {"timestamp": [1000], "ops": [ops]},
+            )
+        with patch.object(app_module, "collector", collector):
+            first = self.client.get("/api/timeseries/localhost:8091/bucket/travel")
+            second = self.client.get("/api/timeseries/localhost:8092/bucket/travel")
+
+        assert json.loads(first.data)["host"] == "http://localhost:8091"
+        assert json.loads(second.data)["host"] == "http://localhost:8092"
+        assert json.loads(second.data)["samples"]["ops"] == [2]
+
+    def test_timeseries_route_serves_replication_history(self):
+        """Replication throughput is served under the xdcr kind"""
+        self.collector.timeseries.record_xdcr(
+            "http://localhost:8091",
+            [{"id": "r1/travel/dst", "changesLeft": 3, "docsWritten": 1}],
+            timestamp=1000,
+        )
+        with patch.object(app_module, "collector", self.collector):
+            response = self.client.get(
+                "/api/timeseries/localhost:8091/xdcr/r1/travel/dst"
+            )
+
+        assert json.loads(response.data)["samples"] == {
+            "timestamp": [1000],
+            "changes_left": [3],
+        }
+
+    def test_metrics_route_renders_snapshot(self):
+        """/metrics serves the text exposition format from the snapshot"""
+        with patch.object(app_module, "collector", self.collector):
+            response = self.client.get("/metrics")
+            revalidated = self.client.get(
+                "/metrics", headers={"If-None-Match": response.headers["ETag"]}
+            )
+        with patch.object(app_module, "collector", None):
+            disabled = self.client.get("/metrics")
+
+        assert response.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+        assert (
+            'couchbase_cluster_up{cluster="http://localhost:8091",'
+            'cluster_name="from-snapshot"} 1' in response.get_data(as_text=True)
+        )
+        assert revalidated.status_code == 304
+        assert disabled.status_code == 503
+
+    def test_api_responses_carry_server_timing(self):
+        """/api/* responses break their time down; pages don't"""
+        with patch.object(app_module, "collector", self.collector):
+            api = self.client.get("/api/clusters", headers={"Accept-Encoding": "gzip"})
+            columnar = self.client.get("/api/clusters?samples=columnar")
+            page = self.client.get("/")
+
+        for name in ("serialize", "total"):
+            assert f"{name};dur=" in api.headers["Server-Timing"]
+        for name in ("process", "serialize", "total"):
+            assert f"{name};dur=" in columnar.headers["Server-Timing"]
+        assert "Server-Timing" not in page.headers
+
+    def test_upstream_metrics_route_reports_calls(self):
+        """The internal endpoint lists recorded calls with their circuit state"""
+        key = ("http://localhost:8091", "/pools/default")
+        app_module.upstream_metrics.record(key, "200", 0.02, 512, 0.001)
+        app_module.upstream_health.breaker(key)
+
+        rows = json.loads(self.client.get("/api/internal/upstream").data)
+
+        assert rows[0]["cluster"] == "http://localhost:8091"
+        assert rows[0]["bytes"] == 512
+        assert rows[0]["latency"]["buckets"]["0.025"] == 1
+        assert rows[0]["circuit"] == "closed"
+
+    def test_timeseries_route_requires_collector(self):
+        """Without a running collector there is no history to serve"""
+        with patch.object(app_module, "collector", None):
+            response = self.client.get("/api/timeseries/localhost:8091/bucket/b")
+
+        assert response.status_code == 503
+
+    def test_index_status_selects_one_cluster(self):
+        """?host= and ?cluster= return only the selected cluster's entry"""
+        with patch.object(app_module, "collector", self.collector):
+            by_host = self.client.get("/api/indexStatus?host=http://localhost:8091")
+            by_name = self.client.get("/api/indexStatus?cluster=localhost:8091")
+            unknown = self.client.get("/api/indexStatus?cluster=nope")
+
+        assert [e["host"] for e in json.loads(by_host.data)] == [
+            "http://localhost:8091"
+        ]
+        assert json.loads(by_name.data) == json.loads(by_host.data)
+        assert unknown.status_code == 404
+
+    def test_on_demand_index_status_queries_and_caches_one_cluster(self):
+        """Without the collector only the selected cluster is queried, then cached"""
+        clusters = [
+            {"host": "http://a:8091", "user": "u", "pass": "p", "customName": "A"},
+            {"host": "http://b:8091", "user": "u", "pass": "p", "customName": "B"},
+        ]
+        fetch = AsyncMock(
+            return_value={
+                "host": "http://b:8091",
+                "data": {"indexes": []},
+                "error": None,
+            }
+        )
+        with patch.object(app_module, "collector", None), patch(
+            "app.config_store.clusters", return_value=clusters
+        ), patch("app.fetch_index_status", fetch):
+            first = self.client.get("/api/indexStatus?cluster=B")
+            second = self.client.get("/api/indexStatus?cluster=B")
+
+        assert json.loads(first.data) == [
+            {
+                "host": "http://b:8091",
+                "customName": "B",
+                "data": {"indexes": []},
+                "error": None,
+            }
+        ]
+        assert second.data == first.data
+        fetch.assert_awaited_once()
+        assert fetch.await_args.args[1] == "http://b:8091"
+
+    def test_index_catalog_route_pages_and_facets(self):
+        """/api/indexes filters, pages and counts from the snapshot"""
+        indexes = [
+            {"indexName": f"idx_{i:02d}", "bucket": "travel", "hosts": ["n1:8091"]}
+            for i in range(5)
+        ] + [{"indexName": "#primary", "bucket": "beer", "hosts": ["n1:8091"]}]
+        self.collector.publish(
+            "http://localhost:8091",
+            {"host": "http://localhost:8091"},
+            {
+                "host": "http://localhost:8091",
+                "data": {"indexes": indexes},
+                "error": None,
+            },
+            None,
+        )
+        with patch.object(app_module, "collector", self.collector):
+            page = json.loads(
+                self.client.get(
+                    "/api/indexes?cluster=localhost:8091&bucket=travel"
+                    "&offset=2&limit=2"
+                ).data
+            )
+            reordered = self.client.get(
+                '/api/indexes?limit=2&offset=2&bucket=travel&junk="x"'
+                "&cluster=localhost:8091"
+            )
+            first = self.client.get(
+                "/api/indexes?cluster=localhost:8091&bucket=travel&offset=2&limit=2"
+            )
+            missing = self.client.get("/api/indexes")
+            bad_sort = self.client.get("/api/indexes?cluster=localhost:8091&sort=x")
+
+        assert reordered.status_code == 200
+        assert reordered.headers["ETag"] == first.headers["ETag"]
+        assert page["total"] == 5
+        assert [i["indexName"] for i in page["indexes"]] == ["idx_02", "idx_03"]
+        assert page["facets"]["bucket"] == {"beer": 1, "travel": 5}
+        assert page["host"] == "http://localhost:8091"
+        assert missing.status_code == 400
+        assert bad_sort.status_code == 400
+
+
+class TestClusterStream:
+    """Streaming /api/clusters/stream endpoint"""
+
+    def setup_method(self):
+        app.config["TESTING"] = True
+        self.client = app.test_client()
+
+    @patch("app.load_config")
+    @patch("app.fetch_cluster_pipeline")
+    def test_stream_emits_one_line_per_cluster(self, mock_pipeline, mock_load_config):
+        """Each cluster is sent as its own NDJSON line as soon as it is ready"""
+        mock_load_config.return_value = [
+            {"host": "http://slow:8091", "user": "admin", "pass": "password"},
+            {"host": "http://fast:8091", "user": "admin", "pass": "password"},
+        ]
+
+        async def pipeline(session, cluster_config):
+            if "slow" in cluster_config["host"]:
+                await asyncio.sleep(0.2)
+            return {
+                "host": cluster_config["host"],
+                "data": None,
+                "error": "unreachable",
+                "buckets": [],
+                "bucket_stats": [],
+            }
+
+        mock_pipeline.side_effect = pipeline
+
+        with patch.object(app_module, "collector", None):
+            response = self.client.get("/api/clusters/stream")
+            lines = [json.loads(line) for line in response.data.splitlines()]
+
+        assert response.status_code == 200
+        assert response.mimetype == "application/x-ndjson"
+        # The fast cluster arrives first even though it is second in config
+        assert [line["index"] for line in lines] == [1, 0]
+        assert all(line["total"] == 2 for line in lines)
+        assert lines[0]["cluster"]["host"] == "http://fast:8091"
+        assert lines[0]["cluster"]["error"] == "unreachable"
+
+    @patch("app.load_config")
+    def test_stream_without_clusters(self, mock_load_config):
+        """An empty configuration returns an error instead of a stream"""
+        mock_load_config.return_value = []
+
+        with patch.object(app_module, "collector", None):
+            response = self.client.get("/api/clusters/stream")
+
+        assert response.status_code == 500
+        assert "No clusters configured" in json.loads(response.data)["error"]
+
+    def test_collector_stream_waits_for_pending_clusters(self):
+        """Clusters not yet collected are streamed once they are published"""
+        collector = ClusterCollector(
+            [
+                {"host": "http://a:8091", "user": "admin", "pass": "password"},
+                {"host": "http://b:8091", "user": "admin", "pass": "password"},
+            ]
+        )
+        collector.publish("http://b:8091", {"host": "http://b:8091"}, None, None)
+        timer = threading.Timer(
+            0.1,
+            collector.publish,
+            args=("http://a:8091", {"host": "http://a:8091"}, None, None),
+        )
+        timer.start()
+
+        results = list(collector.iter_clusters(timeout=5))
+        timer.join()
+
+        assert results == [
+            (1, {"host": "http://b:8091"}),
+            (0, {"host": "http://a:8091"}),
+        ]
+
+    def test_collector_stream_fills_in_missing_clusters(self):
+        """Clusters that never report get a placeholder after the timeout"""
+        collector = ClusterCollector(
+            [{"host": "http://a:8091", "user": "admin", "pass": "password"}]
+        )
+
+        results = list(collector.iter_clusters(timeout=0.05))
+
+        assert len(results) == 1
+        assert results[0][0] == 0
+        assert results[0][1]["error"] == "No data collected yet"
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
+
+
+class TestAsyncServer:
+    """aiohttp server mode sharing the runtime event loop"""
+
+    def setup_method(self):
+        self.collector = ClusterCollector(
+            [{"host": "http://localhost:8091", "user": "admin", "pass": "password"}]
+        )
+        self.collector.publish(
+            "http://localhost:8091",
+            {"host": "http://localhost:8091", "clusterName": "async"},
+            None,
+            None,
+        )
+        self.collector.is_running = lambda: True
+
+    async def _client(self):
+        client = TestClient(TestServer(app_module.create_async_app(Mock(), workers=2)))
+        await client.start_server()
+        return client
+
+    @pytest.mark.asyncio
+    async def test_flask_routes_are_bridged(self):
+        """Pages, static files and snapshot routes are served through Flask"""
+        client = await self._client()
+        try:
+            with patch.object(app_module, "collector", self.collector):
+                page = await client.get("/")
+                script = await client.get("/static/js/scripts.js")
+                clusters = await client.get("/api/clusters")
+                stream = await client.get("/api/clusters/stream")
+                missing = await client.get("/no-such-page")
+
+                assert page.status == 200
+                assert "text/html" in page.headers["Content-Type"]
+                assert script.status == 200
+                assert (await clusters.json())[0]["clusterName"] == "async"
+                assert clusters.headers["ETag"]
+                line = json.loads((await stream.text()).splitlines()[0])
+                assert line["cluster"]["clusterName"] == "async"
+                assert missing.status == 404
+        finally:
+            await client.close()
+
+    @pytest.mark.asyncio
+    @patch("app.fetch_bucket_data")
+    @patch("app.fetch_bucket_stats")
+    async def test_bucket_stats_run_on_the_loop(self, mock_stats, mock_bucket):
+        """Upstream-bound bucket stats are awaited natively, not in a thread"""
+        mock_stats.return_value = {"bucket_name": "b", "stats": {}, "error": None}
+        mock_bucket.return_value = {"bucket_name": "b", "data": {}, "error": None}
+        clusters = [{"host": "http://localhost:8091", "user": "a", "pass": "p"}]
+
+        client = await self._client()
+        try:
+            with patch.object(app_module.config_store, "clusters", lambda: clusters):
+                found = await client.get("/api/bucket/localhost:8091/b/stats")
+                unknown = await client.get("/api/bucket/other:8091/b/stats")
+
+            assert (await found.json())["stats"]["bucket_name"] == "b"
+            for name in ("fetch", "serialize", "total"):
+                assert f"{name};dur=" in found.headers["Server-Timing"]
+            assert unknown.status == 404
+        finally:
+            await client.close()
+
+    @pytest.mark.asyncio
+    async def test_bucket_stats_reload_config_off_the_loop(self):
+        """A config reload triggered by the route doesn't run on the event loop"""
+        threads = []
+
+        def clusters():
+            threads.append(threading.current_thread())
+            return []
+
+        client = await self._client()
+        try:
+            with patch.object(app_module.config_store, "clusters", clusters):
+                response = await client.get("/api/bucket/localhost:8091/b/stats")
+
+            assert response.status == 404
+            assert threads and threads[0] is not threading.current_thread()
+        finally:
+            await client.close()